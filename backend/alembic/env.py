@@ -5,7 +5,7 @@ from sqlalchemy import engine_from_config, pool
 
 from app.core.config import get_settings
 from app.db.base import Base
-from app.models import attendance, employee
+from app.models import attendance, attendance_rollup, employee, resource_version
 
 config = context.config
 
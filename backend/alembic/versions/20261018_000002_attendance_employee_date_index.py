@@ -0,0 +1,34 @@
+"""attendance (employee_id, date desc) index
+
+Revision ID: 20261018_000002
+Revises: 20260225_000001
+Create Date: 2026-10-18 00:00:02
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_000002"
+down_revision: Union[str, None] = "20260225_000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_attendance_employee_id_date",
+        "attendance",
+        ["employee_id", sa.text("date DESC")],
+        unique=False,
+    )
+    # Redundant with the leading column of the composite index above.
+    op.drop_index(op.f("ix_attendance_employee_id"), table_name="attendance")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_attendance_employee_id"), "attendance", ["employee_id"], unique=False)
+    op.drop_index("ix_attendance_employee_id_date", table_name="attendance")
@@ -0,0 +1,48 @@
+"""attendance monthly rollup
+
+Revision ID: 20261018_000004
+Revises: 20261018_000003
+Create Date: 2026-10-18 00:00:04
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_000004"
+down_revision: Union[str, None] = "20261018_000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attendance_monthly_rollup",
+        sa.Column("employee_id", sa.String(length=32), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("present_count", sa.Integer(), nullable=False),
+        sa.Column("absent_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["employee_id"], ["employees.employee_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("employee_id", "month"),
+    )
+
+    # Backfill from existing attendance; `python -m app.cli rebuild-rollup` does the same later on.
+    op.execute(
+        """
+        INSERT INTO attendance_monthly_rollup (employee_id, month, present_count, absent_count)
+        SELECT
+            employee_id,
+            date_trunc('month', date)::date,
+            count(*) FILTER (WHERE status = 'PRESENT'),
+            count(*) FILTER (WHERE status = 'ABSENT')
+        FROM attendance
+        GROUP BY employee_id, date_trunc('month', date)::date
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("attendance_monthly_rollup")
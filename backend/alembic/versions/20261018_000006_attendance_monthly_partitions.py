@@ -0,0 +1,128 @@
+"""partition attendance by month
+
+Revision ID: 20261018_000006
+Revises: 20261018_000005
+Create Date: 2026-10-18 00:00:06
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_000006"
+down_revision: Union[str, None] = "20261018_000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+attendance_status = postgresql.ENUM("PRESENT", "ABSENT", name="attendance_status", create_type=False)
+
+# Partitions from the oldest stored month through this many months past the newest one (or today).
+MONTHS_AHEAD = 3
+
+
+def attendance_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), server_default=sa.text("nextval('attendance_id_seq'::regclass)"), nullable=False),
+        sa.Column("employee_id", sa.String(length=32), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("status", attendance_status, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["employees.employee_id"],
+            name="attendance_employee_id_fkey",
+            ondelete="CASCADE",
+        ),
+    ]
+
+
+def release_names(table: str) -> None:
+    """Free the constraint and index names held by ``table`` so the replacement can take them."""
+    op.drop_constraint("uq_attendance_employee_date", table, type_="unique")
+    op.drop_constraint("attendance_employee_id_fkey", table, type_="foreignkey")
+    op.drop_constraint("attendance_pkey", table, type_="primary")
+    op.drop_index("ix_attendance_employee_id_date", table_name=table)
+    op.drop_index("ix_attendance_id", table_name=table)
+
+
+def create_indexes() -> None:
+    op.create_index("ix_attendance_id", "attendance", ["id"], unique=False)
+    op.create_index("ix_attendance_employee_id_date", "attendance", ["employee_id", sa.text("date DESC")], unique=False)
+
+
+def upgrade() -> None:
+    op.rename_table("attendance", "attendance_unpartitioned")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY NONE")
+    release_names("attendance_unpartitioned")
+
+    # Unique constraints on a partitioned table must include the partition key,
+    # so the primary key widens to (id, date); the sequence keeps id unique on its own.
+    op.create_table(
+        "attendance",
+        *attendance_columns(),
+        sa.PrimaryKeyConstraint("id", "date", name="attendance_pkey"),
+        sa.UniqueConstraint("employee_id", "date", name="uq_attendance_employee_date"),
+        postgresql_partition_by="RANGE (date)",
+    )
+    create_indexes()
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start date := date_trunc(
+                'month', LEAST(COALESCE((SELECT min(date) FROM attendance_unpartitioned), current_date), current_date)
+            )::date;
+            last_month date := (
+                date_trunc(
+                    'month', GREATEST(COALESCE((SELECT max(date) FROM attendance_unpartitioned), current_date), current_date)
+                ) + interval '{MONTHS_AHEAD} months'
+            )::date;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF attendance FOR VALUES FROM (%L) TO (%L)',
+                    'attendance_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    (month_start + interval '1 month')::date
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END$$;
+        """
+    )
+    op.execute("CREATE TABLE attendance_default PARTITION OF attendance DEFAULT")
+    op.execute(
+        """
+        INSERT INTO attendance (id, employee_id, date, status, created_at)
+        SELECT id, employee_id, date, status, created_at FROM attendance_unpartitioned
+        """
+    )
+    op.drop_table("attendance_unpartitioned")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY attendance.id")
+
+
+def downgrade() -> None:
+    op.rename_table("attendance", "attendance_partitioned")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY NONE")
+    release_names("attendance_partitioned")
+
+    op.create_table(
+        "attendance",
+        *attendance_columns(),
+        sa.PrimaryKeyConstraint("id", name="attendance_pkey"),
+        sa.UniqueConstraint("employee_id", "date", name="uq_attendance_employee_date"),
+    )
+    create_indexes()
+    op.execute(
+        """
+        INSERT INTO attendance (id, employee_id, date, status, created_at)
+        SELECT id, employee_id, date, status, created_at FROM attendance_partitioned
+        """
+    )
+    # Dropping the parent drops every partition with it.
+    op.drop_table("attendance_partitioned")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY attendance.id")
@@ -1,31 +1,95 @@
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.api.dependencies import get_attendance_service, require_superadmin_key
-from app.schemas.attendance import AttendanceCreate, AttendanceRead, AttendanceSummary
-from app.services.attendance_service import AttendanceService
+from app.api.dependencies import attendance_service_provider, require_superadmin_key
+from app.schemas.attendance import (
+    AttendanceBulkCreate,
+    AttendanceBulkResult,
+    AttendanceCreate,
+    AttendanceExportFormat,
+    AttendanceRead,
+    AttendanceSummary,
+)
+from app.services.attendance_service import AsyncAttendanceService, AttendanceService
+from app.utils.concurrency import run_service
+from app.utils.etag import if_none_match, weak_etag
+from app.utils.serialization import AppJSONResponse, trusted_rows
+
+EXPORT_MEDIA_TYPES = {
+    AttendanceExportFormat.NDJSON: "application/x-ndjson",
+    AttendanceExportFormat.CSV: "text/csv",
+}
+
+ETAG_HEADER = "ETag"
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"], dependencies=[Depends(require_superadmin_key)])
 
 
 @router.post("", response_model=AttendanceRead, status_code=status.HTTP_200_OK)
-def mark_attendance(
+async def mark_attendance(
     payload: AttendanceCreate,
-    service: Annotated[AttendanceService, Depends(get_attendance_service)],
+    service: Annotated[AttendanceService | AsyncAttendanceService, Depends(attendance_service_provider)],
     response: Response,
 ):
-    record, created = service.mark_attendance(payload)
+    record, created = await run_service(service.mark_attendance, payload)
     response.status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
     return record
 
 
+@router.post("/bulk", response_model=AttendanceBulkResult, status_code=status.HTTP_200_OK)
+async def mark_attendance_bulk(
+    payload: AttendanceBulkCreate,
+    service: Annotated[AttendanceService | AsyncAttendanceService, Depends(attendance_service_provider)],
+):
+    return await run_service(service.mark_attendance_bulk, payload)
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_attendance(
+    service: Annotated[AttendanceService | AsyncAttendanceService, Depends(attendance_service_provider)],
+    start: Annotated[date, Query(alias="from")],
+    end: Annotated[date, Query(alias="to")],
+    export_format: Annotated[AttendanceExportFormat, Query(alias="format")] = AttendanceExportFormat.NDJSON,
+    department: Annotated[str | None, Query(min_length=2, max_length=100)] = None,
+):
+    chunks = await run_service(service.export_attendance, start, end, export_format, department)
+    filename = f"attendance_{start.isoformat()}_{end.isoformat()}.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{employee_id}", response_model=AttendanceSummary, status_code=status.HTTP_200_OK)
-def get_attendance(
+async def get_attendance(
     employee_id: str,
-    service: Annotated[AttendanceService, Depends(get_attendance_service)],
+    service: Annotated[AttendanceService | AsyncAttendanceService, Depends(attendance_service_provider)],
+    request: Request,
     date_filter: Annotated[date | None, Query(alias="date")] = None,
     month_filter: Annotated[str | None, Query(alias="month")] = None,
+    limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+    before: Annotated[str | None, Query(description="Cursor: return records older than it")] = None,
+    after: Annotated[str | None, Query(description="Cursor: return records newer than it")] = None,
 ):
-    return service.get_employee_attendance(employee_id, date_filter, month_filter)
+    version = await run_service(service.get_attendance_version, employee_id)
+    etag = weak_etag("attendance", employee_id, version, request.url.query)
+    if if_none_match(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
+
+    summary = await run_service(
+        service.get_employee_attendance,
+        employee_id,
+        date_filter,
+        month_filter,
+        limit=limit,
+        before=before,
+        after=after,
+    )
+    # Records are trusted database rows; returning the summary would re-validate every one.
+    content = summary.model_dump(exclude={"records"})
+    content["records"] = trusted_rows(AttendanceRead, summary.records)
+    return AppJSONResponse(content=content, headers={ETAG_HEADER: etag})
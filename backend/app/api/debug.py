@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies import require_superadmin_key
+from app.db.session import pool_status
+from app.schemas.debug import PoolReport
+
+router = APIRouter(prefix="/debug", tags=["Debug"], dependencies=[Depends(require_superadmin_key)])
+
+
+@router.get("/pool", response_model=PoolReport, status_code=status.HTTP_200_OK)
+def get_pool_status():
+    return PoolReport(pools=pool_status())
@@ -1,13 +1,16 @@
 from fastapi import Depends
 from fastapi import Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Annotated
 import hmac
 
 from app.core.config import get_settings
-from app.db.session import get_db
-from app.services.attendance_service import AttendanceService
-from app.services.employee_service import EmployeeService
+from app.db.session import get_async_db, get_db
+from app.services.attendance_service import AsyncAttendanceService, AttendanceService
+from app.services.employee_service import AsyncEmployeeService, EmployeeService
+from app.services.readiness_service import AsyncReadinessService, ReadinessService
+from app.services.stats_service import StatsService
 
 
 def get_employee_service(db: Session = Depends(get_db)) -> EmployeeService:
@@ -18,6 +21,36 @@ def get_attendance_service(db: Session = Depends(get_db)) -> AttendanceService:
     return AttendanceService(db)
 
 
+async def get_async_employee_service(db: AsyncSession = Depends(get_async_db)) -> AsyncEmployeeService:
+    return AsyncEmployeeService(db)
+
+
+async def get_async_attendance_service(db: AsyncSession = Depends(get_async_db)) -> AsyncAttendanceService:
+    return AsyncAttendanceService(db)
+
+
+# Chosen once at import: DB_MODE decides which session stack serves the routers.
+_async_mode = get_settings().db_mode == "async"
+employee_service_provider = get_async_employee_service if _async_mode else get_employee_service
+attendance_service_provider = get_async_attendance_service if _async_mode else get_attendance_service
+
+
+def get_readiness_service(db: Session = Depends(get_db)) -> ReadinessService:
+    return ReadinessService(db)
+
+
+async def get_async_readiness_service(db: AsyncSession = Depends(get_async_db)) -> AsyncReadinessService:
+    return AsyncReadinessService(db)
+
+
+# Probes the pool that actually serves the API in this DB_MODE.
+readiness_service_provider = get_async_readiness_service if _async_mode else get_readiness_service
+
+
+def get_stats_service(db: Session = Depends(get_db)) -> StatsService:
+    return StatsService(db)
+
+
 def require_superadmin_key(
     x_superadmin_key: Annotated[str | None, Header(alias="X-Superadmin-Key")] = None,
 ) -> None:
@@ -1,32 +1,80 @@
+import io
+import tempfile
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
-from app.api.dependencies import get_employee_service, require_superadmin_key
+from app.api.dependencies import employee_service_provider, get_employee_service, require_superadmin_key
 from app.schemas.common import MessageResponse
-from app.schemas.employee import EmployeeCreate, EmployeeRead
-from app.services.employee_service import EmployeeService
+from app.schemas.employee import EmployeeCreate, EmployeeImportResult, EmployeeRead
+from app.services.employee_service import AsyncEmployeeService, EmployeeService
+from app.utils.concurrency import run_service
+from app.utils.etag import if_none_match, weak_etag
+from app.utils.serialization import AppJSONResponse, trusted_rows
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+ETAG_HEADER = "ETag"
+# Uploads larger than this spill from memory to a temporary file.
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
 
 router = APIRouter(prefix="/employees", tags=["Employees"], dependencies=[Depends(require_superadmin_key)])
 
 
 @router.post("", response_model=EmployeeRead, status_code=status.HTTP_201_CREATED)
-def create_employee(
+async def create_employee(
     payload: EmployeeCreate,
-    service: Annotated[EmployeeService, Depends(get_employee_service)],
+    service: Annotated[EmployeeService | AsyncEmployeeService, Depends(employee_service_provider)],
 ):
-    return service.create_employee(payload)
+    return await run_service(service.create_employee, payload)
 
 
 @router.get("", response_model=list[EmployeeRead], status_code=status.HTTP_200_OK)
-def list_employees(service: Annotated[EmployeeService, Depends(get_employee_service)]):
-    return service.list_employees()
+async def list_employees(
+    service: Annotated[EmployeeService | AsyncEmployeeService, Depends(employee_service_provider)],
+    request: Request,
+    limit: Annotated[int | None, Query(ge=1, le=1000)] = None,
+    cursor: Annotated[str | None, Query()] = None,
+    fields: Annotated[str | None, Query(description="Comma-separated EmployeeRead fields")] = None,
+):
+    # Read the version before the rows: a write racing in between leaves the tag older
+    # than the body, which only costs the client one extra full response.
+    etag = weak_etag("employees", await run_service(service.get_version), request.url.query)
+    if if_none_match(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
+
+    requested_fields = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+    employees, next_cursor = await run_service(
+        service.list_employees, limit=limit, cursor=cursor, fields=requested_fields
+    )
+    headers = {ETAG_HEADER: etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    # Rows come straight from the database, so they skip response-model re-validation;
+    # sparse rows would not satisfy EmployeeRead anyway.
+    return AppJSONResponse(content=trusted_rows(EmployeeRead, employees, requested_fields), headers=headers)
+
+
+@router.post("/import", response_model=EmployeeImportResult, status_code=status.HTTP_200_OK)
+async def import_employees(
+    request: Request,
+    # Always the sync service: COPY needs the blocking psycopg cursor, and the import runs in the threadpool.
+    service: Annotated[EmployeeService, Depends(get_employee_service)],
+):
+    """Import employees from a raw ``text/csv`` request body with a header row."""
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        # utf-8-sig drops the byte-order mark spreadsheet exports tend to add.
+        source = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        return await run_service(service.import_employees, source)
 
 
 @router.delete("/{employee_id}", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-def delete_employee(
+async def delete_employee(
     employee_id: str,
-    service: Annotated[EmployeeService, Depends(get_employee_service)],
+    service: Annotated[EmployeeService | AsyncEmployeeService, Depends(employee_service_provider)],
 ):
-    service.delete_employee(employee_id)
+    await run_service(service.delete_employee, employee_id)
     return MessageResponse(message="Employee deleted successfully")
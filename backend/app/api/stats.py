@@ -0,0 +1,14 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from app.api.dependencies import get_stats_service, require_superadmin_key
+from app.schemas.stats import StatsOverview
+from app.services.stats_service import StatsService
+
+router = APIRouter(prefix="/stats", tags=["Stats"], dependencies=[Depends(require_superadmin_key)])
+
+
+@router.get("/overview", response_model=StatsOverview, status_code=status.HTTP_200_OK)
+def get_overview(service: Annotated[StatsService, Depends(get_stats_service)]):
+    return service.get_overview()
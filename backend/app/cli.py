@@ -0,0 +1,113 @@
+"""HRMS Lite maintenance commands.
+
+Run from the backend directory, e.g. ``python -m app.cli rebuild-rollup``.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+
+from app.core.config import get_settings
+from app.db.partitions import DEFAULT_MONTHS_AHEAD, ensure_attendance_partitions
+from app.db.session import SessionLocal, engine
+from app.db.synthetic import LOAD_BATCH_SIZE, DatasetSpec, seed_database
+from app.repositories.attendance_rollup_repository import AttendanceRollupRepository
+
+
+def rebuild_rollup() -> int:
+    with SessionLocal() as db:
+        rows = AttendanceRollupRepository(db).rebuild()
+        db.commit()
+    print(f"[hrms] Rebuilt attendance_monthly_rollup: {rows} rows.")
+    return 0
+
+
+def ensure_partitions(months_ahead: int) -> int:
+    with engine.begin() as connection:
+        created = ensure_attendance_partitions(connection, months_ahead)
+    if created:
+        print(f"[hrms] Created attendance partitions: {', '.join(created)}.")
+    else:
+        print("[hrms] Attendance partitions are up to date (or the table is not partitioned).")
+    return 0
+
+
+def seed(args: argparse.Namespace) -> int:
+    spec = DatasetSpec(
+        employees=args.employees,
+        days=args.days,
+        end=args.end,
+        department_skew=args.department_skew,
+        absence_rate=args.absence_rate,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    result = seed_database(get_settings().database_url, spec, workers=args.workers, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - started
+
+    for table in ("employees", "attendance"):
+        seconds = result[f"{table}_seconds"]
+        rate = result[table] / seconds if seconds else 0.0
+        print(f"[hrms] Seeded {int(result[table])} {table} rows in {seconds:.2f}s ({rate:,.0f} rows/sec).")
+    if result["attendance_partitions"]:
+        print(f"[hrms] Created {int(result['attendance_partitions'])} attendance partitions for the seeded months.")
+    rows = result["employees"] + result["attendance"]
+    rollup_rows = int(result["attendance_monthly_rollup"])
+    print(f"[hrms] Rebuilt attendance_monthly_rollup: {rollup_rows} rows in {result['finalize_seconds']:.2f}s.")
+    print(f"[hrms] Total {int(rows)} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/sec).")
+    return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HRMS Lite maintenance commands")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser(
+        "rebuild-rollup",
+        help="Recompute attendance_monthly_rollup from raw attendance rows",
+    )
+    partitions_parser = subcommands.add_parser(
+        "ensure-partitions",
+        help="Create monthly attendance partitions from this month onwards (PostgreSQL only)",
+    )
+    partitions_parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        help="Future months to cover beyond the current one",
+    )
+    seed_parser = subcommands.add_parser(
+        "seed",
+        help="Bulk-load synthetic SYN* employees and their attendance into a migrated database",
+    )
+    seed_parser.add_argument("--employees", type=int, default=10_000)
+    seed_parser.add_argument("--days", type=int, default=365, help="Calendar days of attendance ending at --end")
+    seed_parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD")
+    seed_parser.add_argument(
+        "--department-skew",
+        type=float,
+        default=1.0,
+        help="Zipf exponent for department sizes (0 = uniform)",
+    )
+    seed_parser.add_argument("--absence-rate", type=float, default=0.05, help="Fraction of days marked ABSENT")
+    seed_parser.add_argument("--seed", type=int, default=42, help="RNG seed; same flags reproduce the same rows")
+    seed_parser.add_argument("--workers", type=int, help="Loader processes (default: CPU count)")
+    seed_parser.add_argument("--batch-size", type=int, default=LOAD_BATCH_SIZE, help="Rows per executemany batch")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "rebuild-rollup":
+        return rebuild_rollup()
+    if args.command == "ensure-partitions":
+        return ensure_partitions(args.months_ahead)
+    if args.command == "seed":
+        return seed(args)
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+# Requests that matched no route share one label value to keep cardinality bounded.
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUESTS = Counter(
+    "hrms_http_requests_total",
+    "HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "hrms_http_request_duration_seconds",
+    "Time from receiving a request to sending the last body chunk.",
+    ["method", "route"],
+)
+IN_FLIGHT = Gauge(
+    "hrms_http_requests_in_flight",
+    "Requests currently being served.",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+DB_TIME = Histogram(
+    "hrms_http_request_db_seconds",
+    "Cursor execution time spent per request.",
+    ["method", "route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+DB_QUERIES = Histogram(
+    "hrms_http_request_db_queries",
+    "SQL statements executed per request.",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware, so streamed bodies are timed to their last chunk."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        route = route_template(scope)
+        in_flight = IN_FLIGHT.labels(method, route)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            REQUEST_LATENCY.labels(method, route).observe(time.perf_counter() - started)
+            REQUESTS.labels(method, route, str(status_code)).inc()
+            DB_TIME.labels(method, route).observe(queries.seconds)
+            DB_QUERIES.labels(method, route).observe(queries.count)
+
+
+class QueryCountHeaderMiddleware:
+    """Debug aid: report the statements a request ran before its response started.
+
+    Statements issued while a streamed body is being sent are not included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+
+            async def send_with_counts(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(queries.count)
+                    headers[QUERY_TIME_HEADER] = f"{queries.seconds * 1000:.3f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_counts)
+
+
+def route_template(scope: Scope) -> str:
+    """Match the request against the app's routes up front, so even in-flight samples carry the template."""
+    for route in getattr(scope.get("app"), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition body; under gunicorn every worker's samples are merged."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -1,6 +1,6 @@
 from app.db.base import Base
 from app.db.session import engine
-from app.models import attendance, employee
+from app.models import attendance, attendance_rollup, employee, resource_version
 
 
 def init_db() -> None:
@@ -0,0 +1,95 @@
+"""Monthly range partitions of ``attendance`` on PostgreSQL.
+
+Migration ``20261018_000006`` turns ``attendance`` into a table partitioned
+by ``date``, with one partition per month plus ``attendance_default`` for
+rows outside every monthly range. :func:`ensure_attendance_partitions` keeps
+partitions ahead of the calendar, and gives older months that landed in the
+default partition their own, through ``python -m app.cli ensure-partitions``,
+which ``hrmsctl start`` and the Compose backend command run after migrating; run it
+from a scheduler (e.g. a monthly cron) on long-lived deployments. Databases built by
+``Base.metadata.create_all`` (SQLite, tests) keep a plain table and are skipped.
+"""
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+ATTENDANCE_TABLE = "attendance"
+DEFAULT_PARTITION = "attendance_default"
+DEFAULT_MONTHS_AHEAD = 3
+# Serialises concurrent callers (overlapping deploys or cron runs); any constant unique to this job.
+PARTITION_LOCK_KEY = 0x4852_4D53_0001
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{ATTENDANCE_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.scalar(
+            text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table))"),
+            {"table": ATTENDANCE_TABLE},
+        )
+    )
+
+
+def partition_months(today: date, months_ahead: int, stranded: Iterable[date] = ()) -> list[date]:
+    """Months that need a partition: the current one through ``months_ahead``, plus every ``stranded`` month."""
+    first = month_start(today)
+    months = {add_months(first, offset) for offset in range(months_ahead + 1)}
+    months.update(month_start(month) for month in stranded)
+    return sorted(months)
+
+
+def ensure_attendance_partitions(connection: Connection, months_ahead: int, today: date | None = None) -> list[str]:
+    """Create any missing monthly partitions from the current month through ``months_ahead``.
+
+    Months that only have rows in the default partition (older data, or
+    dates loaded before their partition existed) get a partition too. Rows
+    the default partition holds for a new month are moved into it before it
+    is attached. Returns the names of the partitions created; the caller commits.
+    """
+    if not is_partitioned(connection):
+        return []
+
+    connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+    stranded = connection.scalars(text(f"SELECT DISTINCT date_trunc('month', date)::date FROM {DEFAULT_PARTITION}"))
+    created: list[str] = []
+    for lower in partition_months(today or date.today(), months_ahead, stranded):
+        name = partition_name(lower)
+        if connection.scalar(text("SELECT to_regclass(:name)"), {"name": name}) is not None:
+            continue
+        bounds = {"lower": lower, "upper": add_months(lower, 1)}
+        # Built standalone and attached so rows the default partition caught for this month can move over.
+        connection.execute(
+            text(f'CREATE TABLE "{name}" (LIKE {ATTENDANCE_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        )
+        connection.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date >= :lower AND date < :upper RETURNING *) "
+                f'INSERT INTO "{name}" SELECT * FROM moved'
+            ),
+            bounds,
+        )
+        connection.execute(
+            text(
+                f'ALTER TABLE {ATTENDANCE_TABLE} ATTACH PARTITION "{name}" '
+                f"FOR VALUES FROM ('{bounds['lower'].isoformat()}') TO ('{bounds['upper'].isoformat()}')"
+            )
+        )
+        created.append(name)
+    return created
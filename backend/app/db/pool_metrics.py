@@ -0,0 +1,101 @@
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters fed by SQLAlchemy pool events.
+
+    ``checked_out`` follows the checkout/checkin events; wait time is recorded
+    by pools built with :func:`instrumented_pool_class`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checked_out = 0
+            self.checkouts = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def listen(self, engine: Engine) -> None:
+        # Pool events registered on the engine survive pool.recreate() on dispose.
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict:
+        """Merge the event counters with the pool's own occupancy figures."""
+        queued = isinstance(pool, QueuePool)
+        with self._lock:
+            return {
+                "pool_class": type(pool).__name__,
+                "size": pool.size() if queued else None,
+                "checked_out": self.checked_out,
+                "idle": pool.checkedin() if queued else None,
+                # QueuePool counts overflow from -pool_size; only positive values are extra connections.
+                "overflow": max(pool.overflow(), 0) if queued else None,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+    def _on_connect(self, _dbapi_connection, _connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, _dbapi_connection, _connection_record, _connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+
+    def _on_checkin(self, _dbapi_connection, _connection_record) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, _dbapi_connection, _connection_record, _exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+class _TimedCheckoutMixin:
+    metrics: PoolMetrics
+
+    def connect(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started, timed_out)
+
+
+def instrumented_pool_class(base: type[QueuePool], metrics: PoolMetrics) -> type[QueuePool]:
+    """Return a ``base`` subclass that records checkout wait time into ``metrics``.
+
+    The metrics live on the class so pools rebuilt by ``recreate()`` keep them.
+    """
+    return type(f"Instrumented{base.__name__}", (_TimedCheckoutMixin, base), {"metrics": metrics})
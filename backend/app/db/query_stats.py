@@ -0,0 +1,63 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    """Statements executed and cursor time spent while a tracking scope is active."""
+
+    count: int = 0
+    seconds: float = 0.0
+    parent: "QueryStats | None" = field(default=None, repr=False)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect query stats for the enclosed block, including threadpool work it spawns.
+
+    The stats object is shared, not copied, so work run in a copied context
+    (``run_in_threadpool``) still adds to it. Scopes nest: a statement counts
+    towards every enclosing scope.
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    stats = _current_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats = stats.parent
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
@@ -1,14 +1,92 @@
-from collections.abc import Generator
-from sqlalchemy import create_engine
+import sqlite3
+from collections.abc import AsyncGenerator, Generator
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class
+# Registers the cursor-execute listeners that time statements for request metrics.
+from app.db.query_stats import track_queries  # noqa: F401
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def engine_options(config: Settings, database_url: str, pool_base: type[QueuePool], metrics: PoolMetrics) -> dict:
+    """Pool arguments for ``create_engine``/``create_async_engine`` from settings.
+
+    SQLite keeps its dialect default pool; it has no server-side connection
+    limit to size against.
+    """
+    options: dict = {"pool_pre_ping": config.db_pool_pre_ping}
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=instrumented_pool_class(pool_base, metrics),
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+        )
+    return options
+
+
+engine = create_engine(
+    settings.database_url,
+    **engine_options(settings, settings.database_url, QueuePool, sync_pool_metrics),
+)
+sync_pool_metrics.listen(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Drivers without native asyncio support are swapped for their async sibling.
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "sqlite+pysqlite": "sqlite+aiosqlite"}
+
+
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+    # SQLite ships with foreign keys off; attendance writes rely on them.
+    if isinstance(dbapi_connection, (sqlite3.Connection, AsyncAdapt_aiosqlite_connection)):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def async_database_url(database_url: str) -> str:
+    """Return ``database_url`` with a driver usable by ``create_async_engine``.
+
+    ``postgresql+psycopg`` works in both modes and is returned unchanged.
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    # Built lazily so sync deployments never import an async driver.
+    url = async_database_url(settings.database_url)
+    async_engine = create_async_engine(
+        url,
+        **engine_options(settings, url, AsyncAdaptedQueuePool, async_pool_metrics),
+    )
+    async_pool_metrics.listen(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # Attributes stay loaded after commit; lazy refreshes cannot run outside a greenlet.
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -16,3 +94,21 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+def pool_status() -> list[dict]:
+    """Snapshot every engine built in this process; the async one only once it exists."""
+    pools = [{"name": "sync", **sync_pool_metrics.snapshot(engine.pool)}]
+    if get_async_engine.cache_info().currsize:
+        pools.append({"name": "async", **async_pool_metrics.snapshot(get_async_engine().sync_engine.pool)})
+    return pools
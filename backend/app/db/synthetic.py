@@ -0,0 +1,231 @@
+"""Deterministic synthetic employees and attendance for benchmarks and load tests.
+
+Every employee draws from its own RNG seeded by ``(seed, index)``, so any
+slice of the dataset can be generated independently and reproduces the same
+rows regardless of how the work is split.
+"""
+
+import os
+import random
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import islice
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.db.partitions import DEFAULT_MONTHS_AHEAD, ensure_attendance_partitions
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+from app.repositories.attendance_rollup_repository import AttendanceRollupRepository
+from app.repositories.resource_version_repository import (
+    EMPLOYEES_SCOPE,
+    ResourceVersionRepository,
+    attendance_scope,
+)
+
+DEFAULT_DEPARTMENTS = (
+    "Engineering",
+    "Operations",
+    "Sales",
+    "Support",
+    "Finance",
+    "Marketing",
+    "People",
+    "Legal",
+)
+LOAD_BATCH_SIZE = 5000
+# Employees handed to one seeding task; attendance for them is roughly this times the day count.
+SEED_TASK_EMPLOYEES = 250
+VERSION_BUMP_CHUNK_SIZE = 1000
+EMPLOYEE_COLUMNS = ("employee_id", "full_name", "email", "department")
+ATTENDANCE_COLUMNS = ("employee_id", "date", "status")
+
+_FIRST_NAMES = ("Aarav", "Maya", "Noah", "Priya", "Liam", "Zara", "Omar", "Elena", "Kenji", "Ama", "Lucas", "Sofia")
+_LAST_NAMES = ("Sharma", "Okafor", "Nguyen", "Garcia", "Smith", "Kowalski", "Haddad", "Tanaka", "Silva", "Mensah")
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    employees: int = 1000
+    days: int = 90
+    # Last calendar day covered; the window is the ``days`` days ending here.
+    end: date = field(default_factory=date.today)
+    departments: tuple[str, ...] = DEFAULT_DEPARTMENTS
+    # Zipf exponent over ``departments``: 0 spreads evenly, larger values crowd the first ones.
+    department_skew: float = 1.0
+    absence_rate: float = 0.05
+    weekdays_only: bool = True
+    seed: int = 42
+
+    @property
+    def start(self) -> date:
+        return self.end - timedelta(days=self.days - 1)
+
+    def attendance_dates(self) -> list[date]:
+        dates = (self.start + timedelta(days=offset) for offset in range(self.days))
+        return [day for day in dates if not self.weekdays_only or day.weekday() < 5]
+
+    def department_weights(self) -> list[float]:
+        return [1 / (rank**self.department_skew) for rank in range(1, len(self.departments) + 1)]
+
+
+def synthetic_employee_id(index: int) -> str:
+    return f"SYN{index:07d}"
+
+
+def _rng(spec: DatasetSpec, index: int) -> random.Random:
+    return random.Random(spec.seed * 1_000_003 + index)
+
+
+def generate_employees(spec: DatasetSpec, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+    """Yield employee rows for indexes ``[start, stop)``."""
+    weights = spec.department_weights()
+    for index in range(start, spec.employees if stop is None else min(stop, spec.employees)):
+        rng = _rng(spec, index)
+        employee_id = synthetic_employee_id(index)
+        yield {
+            "employee_id": employee_id,
+            "full_name": f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            "email": f"{employee_id.lower()}@example.com",
+            "department": rng.choices(spec.departments, weights)[0],
+        }
+
+
+def generate_attendance(spec: DatasetSpec, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+    """Yield one attendance row per covered day for employees ``[start, stop)``."""
+    dates = spec.attendance_dates()
+    for index in range(start, spec.employees if stop is None else min(stop, spec.employees)):
+        # Offset the stream so attendance draws never repeat the employee's profile draws.
+        rng = _rng(spec, index + spec.employees)
+        employee_id = synthetic_employee_id(index)
+        for day in dates:
+            status = AttendanceStatus.ABSENT if rng.random() < spec.absence_rate else AttendanceStatus.PRESENT
+            yield {"employee_id": employee_id, "date": day, "status": status}
+
+
+def batched(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def load_dataset(db: Session, spec: DatasetSpec, batch_size: int = LOAD_BATCH_SIZE) -> dict[str, int]:
+    """Insert ``spec`` through Core ``executemany`` batches and rebuild the monthly rollup.
+
+    The caller owns the transaction. Returns the row counts written per table.
+    """
+    connection = db.connection()
+    counts = {"employees": 0, "attendance": 0}
+    for batch in batched(generate_employees(spec), batch_size):
+        connection.execute(insert(Employee.__table__), batch)
+        counts["employees"] += len(batch)
+    for batch in batched(generate_attendance(spec), batch_size):
+        connection.execute(insert(Attendance.__table__), batch)
+        counts["attendance"] += len(batch)
+    counts["attendance_monthly_rollup"] = AttendanceRollupRepository(db).rebuild()
+    return counts
+
+
+_worker_engine: Engine | None = None
+
+
+def _init_seed_worker(database_url: str) -> None:
+    global _worker_engine
+    connect_args = {}
+    if make_url(database_url).get_backend_name() == "sqlite":
+        # Workers take turns on SQLite's single write lock; wait for it instead of failing.
+        connect_args["timeout"] = 300
+    _worker_engine = create_engine(database_url, poolclass=NullPool, connect_args=connect_args)
+
+
+def _employee_values(row: dict) -> tuple:
+    return tuple(row[column] for column in EMPLOYEE_COLUMNS)
+
+
+def _attendance_values(row: dict) -> tuple:
+    # Enum columns store member names.
+    return row["employee_id"], row["date"], row["status"].name
+
+
+def _seed_task(spec: DatasetSpec, table: str, start: int, stop: int, batch_size: int) -> int:
+    """Write one slice of ``table`` through the raw DBAPI connection and commit it."""
+    if table == Employee.__tablename__:
+        columns, values = EMPLOYEE_COLUMNS, map(_employee_values, generate_employees(spec, start, stop))
+    else:
+        columns, values = ATTENDANCE_COLUMNS, map(_attendance_values, generate_attendance(spec, start, stop))
+
+    written = 0
+    connection = _worker_engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if _worker_engine.dialect.name == "postgresql":
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in values:
+                    copy.write_row(row)
+                    written += 1
+        else:
+            placeholders = ", ".join("?" for _ in columns)
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            while batch := list(islice(values, batch_size)):
+                if table == Attendance.__tablename__:
+                    batch = [(employee_id, day.isoformat(), status) for employee_id, day, status in batch]
+                cursor.executemany(sql, batch)
+                written += len(batch)
+        cursor.close()
+        connection.commit()
+    finally:
+        connection.close()
+    return written
+
+
+def seed_database(
+    database_url: str,
+    spec: DatasetSpec,
+    workers: int | None = None,
+    batch_size: int = LOAD_BATCH_SIZE,
+) -> dict[str, float]:
+    """Bulk-load ``spec`` into an already migrated database, bypassing the ORM.
+
+    Employee slices are written first, then attendance slices, each by a
+    process pool (``COPY`` on PostgreSQL, ``executemany`` elsewhere). Months
+    the rows landed in without a partition get one, the monthly rollup is
+    rebuilt and the touched resource versions bumped afterwards so served
+    counts and ETags reflect the new rows. Returns row
+    counts and the elapsed seconds per phase.
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = [
+        (start, min(start + SEED_TASK_EMPLOYEES, spec.employees))
+        for start in range(0, spec.employees, SEED_TASK_EMPLOYEES)
+    ]
+    result: dict[str, float] = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_seed_worker, initargs=(database_url,)) as pool:
+        for table in (Employee.__tablename__, Attendance.__tablename__):
+            started = time.perf_counter()
+            tasks = [pool.submit(_seed_task, spec, table, start, stop, batch_size) for start, stop in ranges]
+            result[table] = sum(task.result() for task in tasks)
+            result[f"{table}_seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as db:
+            # Seeded history predates the migration's partitions; move it out of the default partition.
+            partitions = ensure_attendance_partitions(db.connection(), DEFAULT_MONTHS_AHEAD)
+            result["attendance_partitions"] = len(partitions)
+            result["attendance_monthly_rollup"] = AttendanceRollupRepository(db).rebuild()
+            versions = ResourceVersionRepository(db)
+            scopes = [EMPLOYEES_SCOPE, *(attendance_scope(synthetic_employee_id(i)) for i in range(spec.employees))]
+            for start in range(0, len(scopes), VERSION_BUMP_CHUNK_SIZE):
+                versions.bump(scopes[start : start + VERSION_BUMP_CHUNK_SIZE])
+            db.commit()
+    finally:
+        engine.dispose()
+    result["finalize_seconds"] = time.perf_counter() - started
+    return result
@@ -1,16 +1,47 @@
-from fastapi import FastAPI, Request, status
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.api.debug import router as debug_router
+from app.api.dependencies import readiness_service_provider
 from app.api.router import api_router
 from app.core.config import get_settings
 from app.core.exceptions import AppException
+from app.core.metrics import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    PrometheusMiddleware,
+    QueryCountHeaderMiddleware,
+    render_metrics,
+)
+from app.db.session import dispose_async_engine
+from app.schemas.readiness import ReadinessReport
+from app.services.readiness_service import AsyncReadinessService, ReadinessService
+from app.utils.concurrency import run_service
+from app.utils.serialization import AppJSONResponse
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name, debug=settings.app_debug)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    await dispose_async_engine()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    debug=settings.app_debug,
+    lifespan=lifespan,
+    default_response_class=AppJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,7 +49,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", QUERY_COUNT_HEADER, QUERY_TIME_HEADER],
 )
+if settings.app_debug:
+    app.add_middleware(QueryCountHeaderMiddleware)
+# Added last so it wraps CORS and times the whole request.
+app.add_middleware(PrometheusMiddleware)
 
 
 @app.exception_handler(AppException)
@@ -61,4 +97,28 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get(
+    "/ready",
+    response_model=ReadinessReport,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessReport}},
+)
+async def readiness_check(
+    service: Annotated[ReadinessService | AsyncReadinessService, Depends(readiness_service_provider)],
+):
+    # /health only says the process is up; /ready says this worker can serve queries.
+    report: ReadinessReport = await run_service(service.check)
+    if report.status != "ready":
+        return AppJSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=report.model_dump(mode="json"))
+    return report
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 app.include_router(api_router, prefix=settings.api_v1_prefix)
+# Operational endpoints sit beside /health, outside the versioned API prefix.
+app.include_router(debug_router)
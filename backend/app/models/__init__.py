@@ -1,4 +1,6 @@
 from app.models.attendance import Attendance, AttendanceStatus
+from app.models.attendance_rollup import AttendanceMonthlyRollup
 from app.models.employee import Employee
+from app.models.resource_version import ResourceVersion
 
-__all__ = ["Employee", "Attendance", "AttendanceStatus"]
+__all__ = ["Employee", "Attendance", "AttendanceStatus", "AttendanceMonthlyRollup", "ResourceVersion"]
@@ -1,7 +1,7 @@
 import enum
 from datetime import date as dt_date, datetime
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -13,6 +13,8 @@ class AttendanceStatus(str, enum.Enum):
 
 
 class Attendance(Base):
+    # On PostgreSQL the migrations range-partition this table by month on `date`
+    # (primary key (id, date)); see app/db/partitions.py. create_all builds a plain table.
     __tablename__ = "attendance"
     __table_args__ = (UniqueConstraint("employee_id", "date", name="uq_attendance_employee_date"),)
 
@@ -20,7 +22,6 @@ class Attendance(Base):
     employee_id: Mapped[str] = mapped_column(
         String(32),
         ForeignKey("employees.employee_id", ondelete="CASCADE"),
-        index=True,
         nullable=False,
     )
     date: Mapped[dt_date] = mapped_column(Date, nullable=False)
@@ -28,3 +29,8 @@ class Attendance(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     employee = relationship("Employee", back_populates="attendance_records")
+
+
+# Serves the per-employee range scans newest-first; its leading column also
+# covers plain employee_id lookups.
+Index("ix_attendance_employee_id_date", Attendance.employee_id, Attendance.date.desc())
@@ -0,0 +1,22 @@
+from datetime import date as dt_date
+
+from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AttendanceMonthlyRollup(Base):
+    """Per-employee, per-month attendance counters maintained alongside ``attendance``."""
+
+    __tablename__ = "attendance_monthly_rollup"
+
+    employee_id: Mapped[str] = mapped_column(
+        String(32),
+        ForeignKey("employees.employee_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # First day of the month the counters cover.
+    month: Mapped[dt_date] = mapped_column(Date, primary_key=True)
+    present_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    absent_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
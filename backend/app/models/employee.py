@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,13 +8,21 @@ from app.db.base import Base
 
 class Employee(Base):
     __tablename__ = "employees"
+    # Fetch server defaults (id, created_at) through INSERT ... RETURNING instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     employee_id: Mapped[str] = mapped_column(String(32), unique=True, index=True, nullable=False)
     full_name: Mapped[str] = mapped_column(String(150), nullable=False)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     department: Mapped[str] = mapped_column(String(100), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # SQLite's CURRENT_TIMESTAMP has second precision; binding values in the
+    # same text format keeps keyset comparisons on created_at exact.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        server_default=func.now(),
+        nullable=False,
+    )
 
     attendance_records = relationship(
         "Attendance",
@@ -21,3 +30,7 @@ class Employee(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
+
+
+# Matches the newest-first keyset ordering used by the employee listing.
+Index("ix_employees_created_at_id", Employee.created_at.desc(), Employee.id.desc())
@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ResourceVersion(Base):
+    """Monotonic change counter per cached resource, bumped in the writing transaction."""
+
+    __tablename__ = "resource_versions"
+
+    # "employees" or "attendance:<employee_id>".
+    scope: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -1,57 +1,387 @@
+from collections.abc import AsyncIterator, Iterator
 from datetime import date
 from typing import Protocol
 
-from sqlalchemy import func
+from sqlalchemy import Row, Select, and_, case, func, literal_column, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+
+# Keeps each multi-row statement well below the bind parameter limits of
+# both PostgreSQL (65535) and SQLite (32766).
+UPSERT_CHUNK_SIZE = 1000
+
+# Rows buffered per fetch from the server-side cursor while exporting.
+EXPORT_BATCH_SIZE = 1000
+
+# Only true for the row version written by a fresh INSERT; an ON CONFLICT
+# update stamps xmax with the updating transaction id.
+POSTGRES_INSERTED_FLAG = literal_column("xmax = 0").label("inserted")
+
+AttendanceKey = tuple[str, date]
+
+
+def other_status(status: AttendanceStatus) -> AttendanceStatus:
+    # There are exactly two statuses, so any real change is a flip.
+    return AttendanceStatus.ABSENT if status == AttendanceStatus.PRESENT else AttendanceStatus.PRESENT
+
+
+def range_filters(employee_id: str, start: date | None, end: date | None) -> list:
+    filters = [Attendance.employee_id == employee_id]
+    if start is not None:
+        filters.append(Attendance.date >= start)
+    if end is not None:
+        filters.append(Attendance.date < end)
+    return filters
+
+
+def upsert_statement(insert, rows: list[dict], skip_unchanged: bool = False):
+    """Build the upsert; with ``skip_unchanged`` rows whose status already matches are left untouched."""
+    statement = insert(Attendance).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[Attendance.employee_id, Attendance.date],
+        set_={"status": statement.excluded.status},
+        where=(Attendance.status != statement.excluded.status) if skip_unchanged else None,
+    )
+
+
+def page_statement(
+    employee_id: str,
+    start: date | None,
+    end: date | None,
+    limit: int | None,
+    before: tuple[date, int] | None,
+    after: tuple[date, int] | None,
+    rows_only: bool = False,
+) -> Select:
+    """Keyset page of one employee's records; ``rows_only`` selects plain column rows instead of entities."""
+    entity = select(*Attendance.__table__.c) if rows_only else select(Attendance)
+    statement = entity.where(*range_filters(employee_id, start, end))
+    if before is not None:
+        on_date, record_id = before
+        statement = statement.where(
+            or_(Attendance.date < on_date, and_(Attendance.date == on_date, Attendance.id < record_id))
+        )
+    if after is not None:
+        on_date, record_id = after
+        statement = statement.where(
+            or_(Attendance.date > on_date, and_(Attendance.date == on_date, Attendance.id > record_id))
+        )
+        # Walk forward from the key so LIMIT keeps the rows adjacent to it.
+        statement = statement.order_by(Attendance.date.asc(), Attendance.id.asc())
+    else:
+        statement = statement.order_by(Attendance.date.desc(), Attendance.id.desc())
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def summary_statement(employee_id: str, start: date | None, end: date | None) -> Select:
+    return select(
+        func.count(Attendance.id),
+        func.coalesce(func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)), 0),
+    ).where(*range_filters(employee_id, start, end))
+
+
+def export_statement(start: date, end: date, department: str | None) -> Select:
+    statement = (
+        select(
+            Attendance.id,
+            Attendance.employee_id,
+            Attendance.date,
+            Attendance.status,
+            Attendance.created_at,
+        )
+        .where(Attendance.date >= start, Attendance.date < end)
+        .order_by(Attendance.date, Attendance.employee_id)
+    )
+    if department is not None:
+        statement = statement.join(Employee, Employee.employee_id == Attendance.employee_id).where(
+            Employee.department == department
+        )
+    return statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+
+def key_statement(key: AttendanceKey) -> Select:
+    employee_id, on_date = key
+    return select(Attendance).where(Attendance.employee_id == employee_id, Attendance.date == on_date)
+
+
+def existing_statuses_statement(keys: list[AttendanceKey]) -> Select:
+    return select(Attendance.employee_id, Attendance.date, Attendance.status).where(
+        tuple_(Attendance.employee_id, Attendance.date).in_(keys)
+    )
+
+
+def postgres_previous_statuses(
+    rows: list[dict],
+    written: dict[AttendanceKey, bool],
+) -> dict[AttendanceKey, AttendanceStatus | None]:
+    """Derive replaced statuses from the keys a ``skip_unchanged`` upsert returned."""
+    outcome: dict[AttendanceKey, AttendanceStatus | None] = {}
+    for row in rows:
+        key = (row["employee_id"], row["date"])
+        if key not in written:
+            outcome[key] = row["status"]
+        else:
+            outcome[key] = None if written[key] else other_status(row["status"])
+    return outcome
 
 
 class AttendanceRepositoryInterface(Protocol):
-    def create(self, payload: dict) -> Attendance: ...
-    def update_status(self, record: Attendance, status: AttendanceStatus) -> Attendance: ...
-    def get_by_employee(self, employee_id: str) -> list[Attendance]: ...
-    def find_by_employee_and_date(self, employee_id: str, on_date: date) -> Attendance | None: ...
-    def count_present_days(self, employee_id: str) -> int: ...
+    def upsert(self, payload: dict) -> tuple[Attendance, AttendanceStatus | None]: ...
+    def get_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Attendance]: ...
+    def read_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Row]: ...
+    def summarize(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> tuple[int, int]: ...
+    def upsert_many(self, rows: list[dict]) -> dict[AttendanceKey, AttendanceStatus | None]: ...
+    def iter_range(self, start: date, end: date, department: str | None = None) -> Iterator[Row]: ...
 
 
 class AttendanceRepository(AttendanceRepositoryInterface):
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def create(self, payload: dict) -> Attendance:
-        record = Attendance(**payload)
-        self.db.add(record)
-        self.db.flush()
-        self.db.refresh(record)
-        return record
-
-    def update_status(self, record: Attendance, status: AttendanceStatus) -> Attendance:
-        record.status = status
-        self.db.add(record)
-        self.db.flush()
-        self.db.refresh(record)
-        return record
-
-    def get_by_employee(self, employee_id: str) -> list[Attendance]:
-        return (
-            self.db.query(Attendance)
-            .filter(Attendance.employee_id == employee_id)
-            .order_by(Attendance.date.desc())
-            .all()
-        )
+    def upsert(self, payload: dict) -> tuple[Attendance, AttendanceStatus | None]:
+        """Insert or update the row for (employee_id, date) in one statement.
 
-    def find_by_employee_and_date(self, employee_id: str, on_date: date) -> Attendance | None:
-        return (
-            self.db.query(Attendance)
-            .filter(Attendance.employee_id == employee_id, Attendance.date == on_date)
-            .first()
-        )
+        Returns the stored record and the status it replaced, which is
+        ``None`` when the row was inserted. Raises ``IntegrityError`` when the
+        employee does not exist.
+        """
+        key = (payload["employee_id"], payload["date"])
+        if self._dialect_name() == "postgresql":
+            statement = upsert_statement(postgresql.insert, [payload], skip_unchanged=True).returning(
+                Attendance, POSTGRES_INSERTED_FLAG
+            )
+            row = self.db.execute(statement, execution_options={"populate_existing": True}).one_or_none()
+            if row is None:
+                # Same status as stored: nothing was written, so read it back.
+                return self.db.scalars(key_statement(key)).one(), payload["status"]
+            record, inserted = row
+            return record, None if inserted else other_status(record.status)
 
-    def count_present_days(self, employee_id: str) -> int:
-        result = (
-            self.db.query(func.count(Attendance.id))
-            .filter(Attendance.employee_id == employee_id, Attendance.status == AttendanceStatus.PRESENT)
-            .scalar()
-        )
-        return int(result or 0)
+        previous = self._existing_statuses([key]).get(key)
+        statement = upsert_statement(sqlite.insert, [payload]).returning(Attendance)
+        record = self.db.execute(statement, execution_options={"populate_existing": True}).scalar_one()
+        return record, previous
+
+    def get_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Attendance]:
+        """Return records newest first, optionally keyset-paged on ``(date, id)``.
+
+        ``before`` selects rows older than the key and ``after`` rows newer
+        than it; at most one of them may be given.
+        """
+        records = list(self.db.scalars(page_statement(employee_id, start, end, limit, before, after)))
+        if after is not None:
+            records.reverse()
+        return records
+
+    def read_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Row]:
+        """Read-only ``get_by_employee``: column rows, no entities, nothing added to the identity map."""
+        statement = page_statement(employee_id, start, end, limit, before, after, rows_only=True)
+        records = list(self.db.execute(statement).all())
+        if after is not None:
+            records.reverse()
+        return records
+
+    def summarize(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> tuple[int, int]:
+        """Return ``(total_records, total_present)`` for the half-open range [start, end)."""
+        total_records, total_present = self.db.execute(summary_statement(employee_id, start, end)).one()
+        return int(total_records), int(total_present)
+
+    def iter_range(self, start: date, end: date, department: str | None = None) -> Iterator[Row]:
+        """Stream attendance rows in [start, end) through a server-side cursor.
+
+        Rows are plain column tuples fetched ``EXPORT_BATCH_SIZE`` at a time,
+        so memory use does not grow with the size of the range.
+        """
+        result = self.db.execute(export_statement(start, end, department))
+        try:
+            yield from result
+        finally:
+            result.close()
+
+    def upsert_many(self, rows: list[dict]) -> dict[AttendanceKey, AttendanceStatus | None]:
+        """Insert or update rows keyed by (employee_id, date).
+
+        Returns a mapping of each key to the status it replaced, ``None`` when
+        the row was inserted. Keys must be unique.
+        """
+        outcome: dict[AttendanceKey, AttendanceStatus | None] = {}
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            outcome.update(self._upsert_chunk(rows[start : start + UPSERT_CHUNK_SIZE]))
+        return outcome
+
+    def _upsert_chunk(self, rows: list[dict]) -> dict[AttendanceKey, AttendanceStatus | None]:
+        if not rows:
+            return {}
+
+        if self._dialect_name() == "postgresql":
+            statement = upsert_statement(postgresql.insert, rows, skip_unchanged=True).returning(
+                Attendance.employee_id,
+                Attendance.date,
+                POSTGRES_INSERTED_FLAG,
+            )
+            written = {(row.employee_id, row.date): bool(row.inserted) for row in self.db.execute(statement)}
+            return postgres_previous_statuses(rows, written)
+
+        # SQLite has no xmax; writers are serialized, so reading the existing
+        # statuses inside the same transaction is equivalent.
+        keys = [(row["employee_id"], row["date"]) for row in rows]
+        existing = self._existing_statuses(keys)
+        self.db.execute(upsert_statement(sqlite.insert, rows))
+        return {key: existing.get(key) for key in keys}
+
+    def _existing_statuses(self, keys: list[AttendanceKey]) -> dict[AttendanceKey, AttendanceStatus]:
+        rows = self.db.execute(existing_statuses_statement(keys))
+        return {(employee_id, on_date): status for employee_id, on_date, status in rows}
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+
+class AsyncAttendanceRepository:
+    """``AttendanceRepository`` counterpart for ``AsyncSession``; same statements, awaited."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def upsert(self, payload: dict) -> tuple[Attendance, AttendanceStatus | None]:
+        key = (payload["employee_id"], payload["date"])
+        if self._dialect_name() == "postgresql":
+            statement = upsert_statement(postgresql.insert, [payload], skip_unchanged=True).returning(
+                Attendance, POSTGRES_INSERTED_FLAG
+            )
+            result = await self.db.execute(statement, execution_options={"populate_existing": True})
+            row = result.one_or_none()
+            if row is None:
+                return (await self.db.scalars(key_statement(key))).one(), payload["status"]
+            record, inserted = row
+            return record, None if inserted else other_status(record.status)
+
+        previous = (await self._existing_statuses([key])).get(key)
+        statement = upsert_statement(sqlite.insert, [payload]).returning(Attendance)
+        result = await self.db.execute(statement, execution_options={"populate_existing": True})
+        return result.scalar_one(), previous
+
+    async def get_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Attendance]:
+        records = list(await self.db.scalars(page_statement(employee_id, start, end, limit, before, after)))
+        if after is not None:
+            records.reverse()
+        return records
+
+    async def read_by_employee(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        before: tuple[date, int] | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> list[Row]:
+        statement = page_statement(employee_id, start, end, limit, before, after, rows_only=True)
+        records = list((await self.db.execute(statement)).all())
+        if after is not None:
+            records.reverse()
+        return records
+
+    async def summarize(
+        self,
+        employee_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> tuple[int, int]:
+        total_records, total_present = (await self.db.execute(summary_statement(employee_id, start, end))).one()
+        return int(total_records), int(total_present)
+
+    async def iter_range(self, start: date, end: date, department: str | None = None) -> AsyncIterator[Row]:
+        result = await self.db.stream(export_statement(start, end, department))
+        try:
+            async for row in result:
+                yield row
+        finally:
+            await result.close()
+
+    async def upsert_many(self, rows: list[dict]) -> dict[AttendanceKey, AttendanceStatus | None]:
+        outcome: dict[AttendanceKey, AttendanceStatus | None] = {}
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            outcome.update(await self._upsert_chunk(rows[start : start + UPSERT_CHUNK_SIZE]))
+        return outcome
+
+    async def _upsert_chunk(self, rows: list[dict]) -> dict[AttendanceKey, AttendanceStatus | None]:
+        if not rows:
+            return {}
+
+        if self._dialect_name() == "postgresql":
+            statement = upsert_statement(postgresql.insert, rows, skip_unchanged=True).returning(
+                Attendance.employee_id,
+                Attendance.date,
+                POSTGRES_INSERTED_FLAG,
+            )
+            written = {(row.employee_id, row.date): bool(row.inserted) for row in await self.db.execute(statement)}
+            return postgres_previous_statuses(rows, written)
+
+        keys = [(row["employee_id"], row["date"]) for row in rows]
+        existing = await self._existing_statuses(keys)
+        await self.db.execute(upsert_statement(sqlite.insert, rows))
+        return {key: existing.get(key) for key in keys}
+
+    async def _existing_statuses(self, keys: list[AttendanceKey]) -> dict[AttendanceKey, AttendanceStatus]:
+        rows = await self.db.execute(existing_statuses_statement(keys))
+        return {(employee_id, on_date): status for employee_id, on_date, status in rows}
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
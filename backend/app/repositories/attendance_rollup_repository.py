@@ -0,0 +1,137 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date
+from typing import Protocol
+
+from sqlalchemy import Date, Select, case, cast, delete, func, insert, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.attendance_rollup import AttendanceMonthlyRollup
+
+ROLLUP_CHUNK_SIZE = 1000
+
+# (employee_id, date, status it replaced or None when inserted, new status)
+AttendanceChange = tuple[str, date, AttendanceStatus | None, AttendanceStatus]
+
+
+def month_deltas(changes: Iterable[AttendanceChange]) -> list[dict]:
+    """Fold attendance writes into per-(employee, month) counter deltas."""
+    deltas: dict[tuple[str, date], list[int]] = defaultdict(lambda: [0, 0])
+    for employee_id, on_date, previous, status in changes:
+        if previous == status:
+            continue
+        bucket = deltas[(employee_id, on_date.replace(day=1))]
+        _adjust(bucket, status, 1)
+        if previous is not None:
+            _adjust(bucket, previous, -1)
+
+    return [
+        {"employee_id": employee_id, "month": month, "present_count": present, "absent_count": absent}
+        for (employee_id, month), (present, absent) in deltas.items()
+        if present or absent
+    ]
+
+
+def increment_statement(dialect_name: str, rows: list[dict]):
+    insert_for_dialect = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    statement = insert_for_dialect(AttendanceMonthlyRollup).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[AttendanceMonthlyRollup.employee_id, AttendanceMonthlyRollup.month],
+        set_={
+            "present_count": AttendanceMonthlyRollup.present_count + statement.excluded.present_count,
+            "absent_count": AttendanceMonthlyRollup.absent_count + statement.excluded.absent_count,
+        },
+    )
+
+
+def summary_statement(employee_id: str, month: date | None) -> Select:
+    statement = select(
+        func.coalesce(func.sum(AttendanceMonthlyRollup.present_count + AttendanceMonthlyRollup.absent_count), 0),
+        func.coalesce(func.sum(AttendanceMonthlyRollup.present_count), 0),
+    ).where(AttendanceMonthlyRollup.employee_id == employee_id)
+    if month is not None:
+        statement = statement.where(AttendanceMonthlyRollup.month == month)
+    return statement
+
+
+def rebuild_statement(dialect_name: str):
+    month = _month_start(dialect_name, Attendance.date)
+    aggregate = select(
+        Attendance.employee_id,
+        month,
+        func.sum(case((Attendance.status == AttendanceStatus.PRESENT, 1), else_=0)),
+        func.sum(case((Attendance.status == AttendanceStatus.ABSENT, 1), else_=0)),
+    ).group_by(Attendance.employee_id, month)
+    return insert(AttendanceMonthlyRollup).from_select(
+        ["employee_id", "month", "present_count", "absent_count"],
+        aggregate,
+    )
+
+
+def _adjust(bucket: list[int], status: AttendanceStatus, amount: int) -> None:
+    bucket[0 if status == AttendanceStatus.PRESENT else 1] += amount
+
+
+def _month_start(dialect_name: str, column):
+    if dialect_name == "postgresql":
+        # Inline literal keeps the SELECT and GROUP BY expressions identical.
+        return cast(func.date_trunc(literal_column("'month'"), column), Date)
+    return func.date(column, "start of month")
+
+
+class AttendanceRollupRepositoryInterface(Protocol):
+    def apply_changes(self, changes: Iterable[AttendanceChange]) -> None: ...
+    def summarize(self, employee_id: str, month: date | None = None) -> tuple[int, int]: ...
+    def rebuild(self) -> int: ...
+
+
+class AttendanceRollupRepository(AttendanceRollupRepositoryInterface):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def apply_changes(self, changes: Iterable[AttendanceChange]) -> None:
+        """Fold attendance writes into the monthly counters as atomic deltas."""
+        rows = month_deltas(changes)
+        for start in range(0, len(rows), ROLLUP_CHUNK_SIZE):
+            self.db.execute(increment_statement(self._dialect_name(), rows[start : start + ROLLUP_CHUNK_SIZE]))
+
+    def summarize(self, employee_id: str, month: date | None = None) -> tuple[int, int]:
+        """Return ``(total_records, total_present)`` for one month or the whole history."""
+        total_records, total_present = self.db.execute(summary_statement(employee_id, month)).one()
+        return int(total_records), int(total_present)
+
+    def rebuild(self) -> int:
+        """Recompute every counter from raw attendance; returns the number of rollup rows."""
+        self.db.execute(delete(AttendanceMonthlyRollup))
+        self.db.execute(rebuild_statement(self._dialect_name()))
+        return int(self.db.scalar(select(func.count()).select_from(AttendanceMonthlyRollup)) or 0)
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+
+class AsyncAttendanceRollupRepository:
+    """``AttendanceRollupRepository`` counterpart for ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def apply_changes(self, changes: Iterable[AttendanceChange]) -> None:
+        rows = month_deltas(changes)
+        for start in range(0, len(rows), ROLLUP_CHUNK_SIZE):
+            await self.db.execute(increment_statement(self._dialect_name(), rows[start : start + ROLLUP_CHUNK_SIZE]))
+
+    async def summarize(self, employee_id: str, month: date | None = None) -> tuple[int, int]:
+        total_records, total_present = (await self.db.execute(summary_statement(employee_id, month))).one()
+        return int(total_records), int(total_present)
+
+    async def rebuild(self) -> int:
+        await self.db.execute(delete(AttendanceMonthlyRollup))
+        await self.db.execute(rebuild_statement(self._dialect_name()))
+        return int(await self.db.scalar(select(func.count()).select_from(AttendanceMonthlyRollup)) or 0)
+
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
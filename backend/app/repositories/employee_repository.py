@@ -1,16 +1,89 @@
+from collections.abc import Collection, Sequence
+from datetime import datetime
 from typing import Protocol
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Column, Integer, MetaData, Row, Select, String, Table, and_, delete, or_, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 
 from app.models.employee import Employee
 
 
+# Session-local landing table for CSV imports; kept out of Base.metadata so it is never migrated.
+IMPORT_STAGING = Table(
+    "employee_import_staging",
+    MetaData(),
+    Column("row_number", Integer, nullable=False),
+    Column("employee_id", String(32), nullable=False),
+    Column("full_name", String(150), nullable=False),
+    Column("email", String(255), nullable=False),
+    Column("department", String(100), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+IMPORT_COLUMNS = ("employee_id", "full_name", "email", "department")
+
+
+def page_statement(
+    limit: int | None,
+    after: tuple[datetime, int] | None,
+    columns: Sequence[str] | None,
+    rows_only: bool = False,
+) -> Select:
+    """Newest-first keyset page; ``rows_only`` selects plain column rows instead of entities."""
+    if rows_only:
+        names = dict.fromkeys(("id", "created_at", *(columns or Employee.__table__.c.keys())))
+        statement = select(*(Employee.__table__.c[name] for name in names))
+    else:
+        statement = select(Employee)
+        if columns:
+            attributes = {"id", "created_at", *columns}
+            statement = statement.options(load_only(*(getattr(Employee, name) for name in attributes)))
+    statement = statement.order_by(Employee.created_at.desc(), Employee.id.desc())
+    if after is not None:
+        created_at, employee_pk = after
+        statement = statement.where(
+            or_(
+                Employee.created_at < created_at,
+                and_(Employee.created_at == created_at, Employee.id < employee_pk),
+            )
+        )
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+
+def exists_statement(employee_id: str) -> Select:
+    return select(Employee.id).where(Employee.employee_id == employee_id).limit(1)
+
+
+def existing_ids_statement(employee_ids: Collection[str]) -> Select:
+    return select(Employee.employee_id).where(Employee.employee_id.in_(list(employee_ids)))
+
+
 class EmployeeRepositoryInterface(Protocol):
     def create(self, payload: dict) -> Employee: ...
-    def get_all(self) -> list[Employee]: ...
+    def get_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Employee]: ...
+    def read_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Row]: ...
     def get_by_employee_id(self, employee_id: str) -> Employee | None: ...
     def get_by_email(self, email: str) -> Employee | None: ...
+    def get_existing_employee_ids(self, employee_ids: Collection[str]) -> set[str]: ...
+    def exists(self, employee_id: str) -> bool: ...
     def delete(self, employee: Employee) -> None: ...
+    def start_import(self) -> None: ...
+    def stage_import(self, rows: list[dict]) -> None: ...
+    def merge_import(self) -> set[str]: ...
 
 
 class EmployeeRepository(EmployeeRepositoryInterface):
@@ -21,11 +94,29 @@ class EmployeeRepository(EmployeeRepositoryInterface):
         employee = Employee(**payload)
         self.db.add(employee)
         self.db.flush()
-        self.db.refresh(employee)
         return employee
 
-    def get_all(self) -> list[Employee]:
-        return self.db.query(Employee).order_by(Employee.created_at.desc()).all()
+    def get_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Employee]:
+        """Return employees newest first, starting strictly after the ``(created_at, id)`` key.
+
+        ``columns`` restricts which attributes are loaded; the keyset columns
+        are always included.
+        """
+        return list(self.db.scalars(page_statement(limit, after, columns)))
+
+    def read_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Row]:
+        """Read-only ``get_page``: column rows, no entities, nothing added to the identity map."""
+        return list(self.db.execute(page_statement(limit, after, columns, rows_only=True)).all())
 
     def get_by_employee_id(self, employee_id: str) -> Employee | None:
         return self.db.query(Employee).filter(Employee.employee_id == employee_id).first()
@@ -33,5 +124,97 @@ class EmployeeRepository(EmployeeRepositoryInterface):
     def get_by_email(self, email: str) -> Employee | None:
         return self.db.query(Employee).filter(Employee.email == email).first()
 
+    def get_existing_employee_ids(self, employee_ids: Collection[str]) -> set[str]:
+        if not employee_ids:
+            return set()
+        return set(self.db.scalars(existing_ids_statement(employee_ids)))
+
+    def exists(self, employee_id: str) -> bool:
+        return self.db.scalar(exists_statement(employee_id)) is not None
+
     def delete(self, employee: Employee) -> None:
         self.db.delete(employee)
+
+    def start_import(self) -> None:
+        """Create (or empty) the staging table on this session's connection."""
+        connection = self.db.connection()
+        IMPORT_STAGING.create(connection, checkfirst=True)
+        connection.execute(delete(IMPORT_STAGING))
+
+    def stage_import(self, rows: list[dict]) -> None:
+        """Append validated rows to the staging table: COPY on PostgreSQL, executemany elsewhere."""
+        if not rows:
+            return
+        connection = self.db.connection()
+        if connection.dialect.name != "postgresql":
+            connection.execute(IMPORT_STAGING.insert(), rows)
+            return
+
+        columns = ("row_number", *IMPORT_COLUMNS)
+        copy_sql = f"COPY {IMPORT_STAGING.name} ({', '.join(columns)}) FROM STDIN"
+        with connection.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(copy_sql) as copy:
+                for row in rows:
+                    copy.write_row([row[column] for column in columns])
+
+    def merge_import(self) -> set[str]:
+        """Insert staged rows that collide with no existing employee; return the inserted ids."""
+        connection = self.db.connection()
+        insert_for_dialect = postgresql.insert if connection.dialect.name == "postgresql" else sqlite.insert
+        # SQLite needs a WHERE on INSERT ... SELECT to parse the trailing ON CONFLICT.
+        staged = select(*(IMPORT_STAGING.c[column] for column in IMPORT_COLUMNS)).where(true())
+        statement = (
+            insert_for_dialect(Employee)
+            .from_select(list(IMPORT_COLUMNS), staged.order_by(IMPORT_STAGING.c.row_number))
+            .on_conflict_do_nothing()
+            .returning(Employee.employee_id)
+        )
+        inserted = set(connection.execute(statement).scalars())
+        connection.execute(delete(IMPORT_STAGING))
+        return inserted
+
+
+class AsyncEmployeeRepository:
+    """``EmployeeRepository`` counterpart for ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create(self, payload: dict) -> Employee:
+        employee = Employee(**payload)
+        self.db.add(employee)
+        await self.db.flush()
+        return employee
+
+    async def get_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Employee]:
+        return list(await self.db.scalars(page_statement(limit, after, columns)))
+
+    async def read_page(
+        self,
+        limit: int | None = None,
+        after: tuple[datetime, int] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> list[Row]:
+        return list((await self.db.execute(page_statement(limit, after, columns, rows_only=True))).all())
+
+    async def get_by_employee_id(self, employee_id: str) -> Employee | None:
+        return await self.db.scalar(select(Employee).where(Employee.employee_id == employee_id).limit(1))
+
+    async def get_by_email(self, email: str) -> Employee | None:
+        return await self.db.scalar(select(Employee).where(Employee.email == email).limit(1))
+
+    async def get_existing_employee_ids(self, employee_ids: Collection[str]) -> set[str]:
+        if not employee_ids:
+            return set()
+        return set(await self.db.scalars(existing_ids_statement(employee_ids)))
+
+    async def exists(self, employee_id: str) -> bool:
+        return await self.db.scalar(exists_statement(employee_id)) is not None
+
+    async def delete(self, employee: Employee) -> None:
+        await self.db.delete(employee)
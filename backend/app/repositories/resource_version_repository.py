@@ -0,0 +1,60 @@
+from collections.abc import Iterable
+from typing import Protocol
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.resource_version import ResourceVersion
+
+EMPLOYEES_SCOPE = "employees"
+
+
+def attendance_scope(employee_id: str) -> str:
+    return f"attendance:{employee_id}"
+
+
+def bump_statement(dialect_name: str, scopes: Iterable[str]):
+    # Sorted so concurrent writers touching overlapping scopes lock rows in the same order.
+    rows = [{"scope": scope, "version": 1} for scope in sorted(set(scopes))]
+    insert_for_dialect = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    statement = insert_for_dialect(ResourceVersion).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[ResourceVersion.scope],
+        set_={"version": ResourceVersion.version + 1},
+    )
+
+
+class ResourceVersionRepositoryInterface(Protocol):
+    def get(self, scope: str) -> int: ...
+    def bump(self, scopes: Iterable[str]) -> None: ...
+
+
+class ResourceVersionRepository(ResourceVersionRepositoryInterface):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get(self, scope: str) -> int:
+        """Return the scope's version; 0 when it has never been written."""
+        return self.db.scalar(select(ResourceVersion.version).where(ResourceVersion.scope == scope)) or 0
+
+    def bump(self, scopes: Iterable[str]) -> None:
+        scopes = list(scopes)
+        if scopes:
+            self.db.execute(bump_statement(self.db.get_bind().dialect.name, scopes))
+
+
+class AsyncResourceVersionRepository:
+    """``ResourceVersionRepository`` counterpart for ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get(self, scope: str) -> int:
+        return await self.db.scalar(select(ResourceVersion.version).where(ResourceVersion.scope == scope)) or 0
+
+    async def bump(self, scopes: Iterable[str]) -> None:
+        scopes = list(scopes)
+        if scopes:
+            await self.db.execute(bump_statement(self.db.get_bind().dialect.name, scopes))
@@ -0,0 +1,34 @@
+from datetime import date
+from typing import Protocol
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+
+
+class StatsRepositoryInterface(Protocol):
+    def headcount_by_department(self) -> list[tuple[str, int]]: ...
+    def attendance_counts_on(self, on_date: date) -> dict[AttendanceStatus, int]: ...
+
+
+class StatsRepository(StatsRepositoryInterface):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def headcount_by_department(self) -> list[tuple[str, int]]:
+        statement = (
+            select(Employee.department, func.count(Employee.id))
+            .group_by(Employee.department)
+            .order_by(Employee.department)
+        )
+        return [(department, int(headcount)) for department, headcount in self.db.execute(statement)]
+
+    def attendance_counts_on(self, on_date: date) -> dict[AttendanceStatus, int]:
+        statement = (
+            select(Attendance.status, func.count(Attendance.id))
+            .where(Attendance.date == on_date)
+            .group_by(Attendance.status)
+        )
+        return {status: int(total) for status, total in self.db.execute(statement)}
@@ -1,3 +1,4 @@
+import enum
 from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -26,3 +27,35 @@ class AttendanceSummary(BaseModel):
     total_records: int
     total_present: int
     records: list[AttendanceRead]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class AttendanceExportFormat(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class AttendanceBulkCreate(BaseModel):
+    records: list[AttendanceCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class AttendanceBulkOutcome(str, enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    REJECTED = "rejected"
+
+
+class AttendanceBulkRowResult(BaseModel):
+    index: int
+    employee_id: str
+    date: date
+    outcome: AttendanceBulkOutcome
+    message: str | None = None
+
+
+class AttendanceBulkResult(BaseModel):
+    created: int
+    updated: int
+    rejected: int
+    results: list[AttendanceBulkRowResult]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class PoolStatus(BaseModel):
+    name: str
+    pool_class: str
+    size: int | None
+    checked_out: int
+    idle: int | None
+    overflow: int | None
+    checkouts: int
+    connects: int
+    invalidations: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class PoolReport(BaseModel):
+    pools: list[PoolStatus]
@@ -19,3 +19,16 @@ class EmployeeRead(BaseModel):
     email: EmailStr
     department: str
     created_at: datetime
+
+
+class EmployeeImportError(BaseModel):
+    # 1-based data row, not counting the header.
+    row: int
+    employee_id: str | None = None
+    message: str
+
+
+class EmployeeImportResult(BaseModel):
+    created: int
+    rejected: int
+    errors: list[EmployeeImportError]
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class DependencyCheck(BaseModel):
+    ok: bool
+    latency_ms: float
+    detail: str | None = None
+
+
+class ReadinessReport(BaseModel):
+    status: Literal["ready", "not_ready"]
+    checked_at: datetime
+    checks: dict[str, DependencyCheck]
@@ -0,0 +1,17 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class DepartmentHeadcount(BaseModel):
+    department: str
+    headcount: int
+
+
+class StatsOverview(BaseModel):
+    total_employees: int
+    departments: list[DepartmentHeadcount]
+    date: date
+    present_today: int
+    absent_today: int
+    unmarked_today: int
@@ -1,23 +1,276 @@
-from datetime import date, datetime
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import date, datetime, timedelta
 from typing import Protocol
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import BadRequestException, NotFoundException
 from app.models.attendance import AttendanceStatus
-from app.repositories.attendance_repository import AttendanceRepository, AttendanceRepositoryInterface
-from app.repositories.employee_repository import EmployeeRepository, EmployeeRepositoryInterface
-from app.schemas.attendance import AttendanceCreate, AttendanceSummary
+from app.repositories.attendance_repository import (
+    AsyncAttendanceRepository,
+    AttendanceRepository,
+    AttendanceRepositoryInterface,
+)
+from app.repositories.attendance_rollup_repository import (
+    AsyncAttendanceRollupRepository,
+    AttendanceChange,
+    AttendanceRollupRepository,
+    AttendanceRollupRepositoryInterface,
+)
+from app.repositories.employee_repository import (
+    AsyncEmployeeRepository,
+    EmployeeRepository,
+    EmployeeRepositoryInterface,
+)
+from app.repositories.resource_version_repository import (
+    AsyncResourceVersionRepository,
+    ResourceVersionRepository,
+    ResourceVersionRepositoryInterface,
+    attendance_scope,
+)
+from app.schemas.attendance import (
+    AttendanceBulkCreate,
+    AttendanceBulkOutcome,
+    AttendanceBulkResult,
+    AttendanceBulkRowResult,
+    AttendanceCreate,
+    AttendanceExportFormat,
+    AttendanceRead,
+    AttendanceSummary,
+)
+from app.services.employee_service import employee_existence_cache
+from app.utils.cache import ExistenceCache
+from app.utils.pagination import decode_cursor, encode_cursor
+
+EXPORT_COLUMNS = ("id", "employee_id", "date", "status", "created_at")
+# Rows rendered per chunk handed to the response stream.
+EXPORT_CHUNK_ROWS = 500
+
+
+def resolve_range(for_date: date | None, for_month: str | None) -> tuple[date | None, date | None]:
+    """Translate the date/month filters into a half-open [start, end) range."""
+    start: date | None = None
+    end: date | None = None
+
+    if for_month:
+        try:
+            start = datetime.strptime(for_month, "%Y-%m").date().replace(day=1)
+        except ValueError as error:
+            raise BadRequestException(
+                "Invalid month format. Use YYYY-MM",
+                details={"month": for_month},
+            ) from error
+
+        if start.month == 12:
+            end = start.replace(year=start.year + 1, month=1)
+        else:
+            end = start.replace(month=start.month + 1)
+
+    if for_date:
+        day_end = for_date + timedelta(days=1)
+        start = max(start, for_date) if start else for_date
+        end = min(end, day_end) if end else day_end
+
+    return start, end
+
+
+def decode_record_cursor(cursor: str) -> tuple[date, int]:
+    on_date, record_id = decode_cursor(cursor, 2)
+    try:
+        return date.fromisoformat(on_date), int(record_id)
+    except (TypeError, ValueError) as error:
+        raise BadRequestException("Invalid cursor", details={"cursor": cursor}) from error
+
+
+def page_cursors(
+    records: list,
+    limit: int | None,
+    before_key: tuple[date, int] | None,
+    after_key: tuple[date, int] | None,
+) -> tuple[list, str | None, str | None]:
+    """Trim a ``limit + 1`` fetch and return ``(records, next_cursor, prev_cursor)``."""
+    has_more = limit is not None and len(records) > limit
+    if has_more:
+        records = records[1:] if after_key else records[:limit]
+
+    if after_key:
+        has_newer, has_older = has_more, True
+    else:
+        has_newer, has_older = before_key is not None, has_more
+
+    next_cursor = prev_cursor = None
+    if records and has_older:
+        next_cursor = encode_cursor(records[-1].date.isoformat(), records[-1].id)
+    if records and has_newer:
+        prev_cursor = encode_cursor(records[0].date.isoformat(), records[0].id)
+    return records, next_cursor, prev_cursor
+
+
+def bulk_row_result(
+    index: int,
+    row: AttendanceCreate,
+    outcome: AttendanceBulkOutcome,
+    message: str | None = None,
+) -> AttendanceBulkRowResult:
+    return AttendanceBulkRowResult(
+        index=index,
+        employee_id=row.employee_id,
+        date=row.date,
+        outcome=outcome,
+        message=message,
+    )
+
+
+def plan_bulk(
+    records: list[AttendanceCreate],
+    known_ids: set[str],
+) -> tuple[list[AttendanceBulkRowResult | None], dict[tuple[str, date], int]]:
+    """Reject unknown employees and superseded duplicates; return the rows left to write by key."""
+    results: list[AttendanceBulkRowResult | None] = [None] * len(records)
+    latest_index: dict[tuple[str, date], int] = {}
+    for index, row in enumerate(records):
+        if row.employee_id not in known_ids:
+            results[index] = bulk_row_result(index, row, AttendanceBulkOutcome.REJECTED, "Employee not found")
+            continue
+
+        key = (row.employee_id, row.date)
+        if key in latest_index:
+            superseded = latest_index[key]
+            results[superseded] = bulk_row_result(
+                superseded,
+                records[superseded],
+                AttendanceBulkOutcome.REJECTED,
+                "Superseded by a later row for the same employee and date",
+            )
+        latest_index[key] = index
+    return results, latest_index
+
+
+def bulk_changes(
+    records: list[AttendanceCreate],
+    latest_index: dict[tuple[str, date], int],
+    previous_by_key: dict[tuple[str, date], AttendanceStatus | None],
+) -> Iterator[AttendanceChange]:
+    for (employee_id, on_date), index in latest_index.items():
+        yield employee_id, on_date, previous_by_key[(employee_id, on_date)], records[index].status
+
+
+def bulk_result(
+    records: list[AttendanceCreate],
+    results: list[AttendanceBulkRowResult | None],
+    latest_index: dict[tuple[str, date], int],
+    previous_by_key: dict[tuple[str, date], AttendanceStatus | None],
+) -> AttendanceBulkResult:
+    for key, index in latest_index.items():
+        created = previous_by_key[key] is None
+        outcome = AttendanceBulkOutcome.CREATED if created else AttendanceBulkOutcome.UPDATED
+        results[index] = bulk_row_result(index, records[index], outcome)
+
+    return AttendanceBulkResult(
+        created=sum(1 for result in results if result.outcome == AttendanceBulkOutcome.CREATED),
+        updated=sum(1 for result in results if result.outcome == AttendanceBulkOutcome.UPDATED),
+        rejected=sum(1 for result in results if result.outcome == AttendanceBulkOutcome.REJECTED),
+        results=results,
+    )
+
+
+def remember_existence(cache: ExistenceCache, employee_id: str, exists: bool) -> None:
+    if exists:
+        cache.add(employee_id)
+    else:
+        cache.mark_absent(employee_id)
+
+
+def validate_export_range(start: date, end: date) -> None:
+    if end < start:
+        raise BadRequestException(
+            "Export range end must not be before its start",
+            details={"from": start.isoformat(), "to": end.isoformat()},
+        )
+
+
+def render_ndjson(rows: Iterable) -> str:
+    return "".join(
+        json.dumps(
+            {
+                "id": row.id,
+                "employee_id": row.employee_id,
+                "date": row.date.isoformat(),
+                "status": row.status.value,
+                "created_at": row.created_at.isoformat(),
+            }
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def render_csv(rows: Iterable) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow((row.id, row.employee_id, row.date.isoformat(), row.status.value, row.created_at.isoformat()))
+    return buffer.getvalue()
+
+
+EXPORT_RENDERERS = {AttendanceExportFormat.NDJSON: render_ndjson, AttendanceExportFormat.CSV: render_csv}
+# csv.writer terminates rows with CRLF; the header matches it.
+EXPORT_HEADERS = {AttendanceExportFormat.CSV: ",".join(EXPORT_COLUMNS) + "\r\n"}
+
+
+def iter_export_chunks(rows: Iterable, export_format: AttendanceExportFormat) -> Iterator[str]:
+    render = EXPORT_RENDERERS[export_format]
+    if export_format in EXPORT_HEADERS:
+        yield EXPORT_HEADERS[export_format]
+    batch: list = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield render(batch)
+            batch = []
+    if batch:
+        yield render(batch)
+
+
+async def aiter_export_chunks(rows: AsyncIterator, export_format: AttendanceExportFormat) -> AsyncIterator[str]:
+    render = EXPORT_RENDERERS[export_format]
+    if export_format in EXPORT_HEADERS:
+        yield EXPORT_HEADERS[export_format]
+    batch: list = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_ROWS:
+            yield render(batch)
+            batch = []
+    if batch:
+        yield render(batch)
 
 
 class AttendanceServiceInterface(Protocol):
     def mark_attendance(self, payload: AttendanceCreate) -> tuple[object, bool]: ...
+    def mark_attendance_bulk(self, payload: AttendanceBulkCreate) -> AttendanceBulkResult: ...
     def get_employee_attendance(
         self,
         employee_id: str,
         for_date: date | None = None,
         for_month: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
     ) -> AttendanceSummary: ...
+    def export_attendance(
+        self,
+        start: date,
+        end: date,
+        export_format: AttendanceExportFormat,
+        department: str | None = None,
+    ) -> Iterator[str]: ...
+    def get_attendance_version(self, employee_id: str) -> int: ...
 
 
 class AttendanceService(AttendanceServiceInterface):
@@ -26,71 +279,302 @@ class AttendanceService(AttendanceServiceInterface):
         db: Session,
         attendance_repository: AttendanceRepositoryInterface | None = None,
         employee_repository: EmployeeRepositoryInterface | None = None,
+        rollup_repository: AttendanceRollupRepositoryInterface | None = None,
+        existence_cache: ExistenceCache | None = None,
+        version_repository: ResourceVersionRepositoryInterface | None = None,
     ) -> None:
         self.db = db
         self.attendance_repository = attendance_repository or AttendanceRepository(db)
         self.employee_repository = employee_repository or EmployeeRepository(db)
+        self.rollup_repository = rollup_repository or AttendanceRollupRepository(db)
+        self.existence_cache = existence_cache or employee_existence_cache
+        self.version_repository = version_repository or ResourceVersionRepository(db)
 
     def mark_attendance(self, payload: AttendanceCreate) -> tuple[object, bool]:
-        employee = self.employee_repository.get_by_employee_id(payload.employee_id)
-        if not employee:
+        try:
+            record, previous = self.attendance_repository.upsert(payload.model_dump())
+        except IntegrityError as error:
+            # The upsert cannot violate the (employee_id, date) uniqueness, so
+            # the only remaining constraint is the employee foreign key.
+            self.db.rollback()
+            self.existence_cache.discard(payload.employee_id)
             raise NotFoundException(
                 "Employee not found",
                 details={"employee_id": payload.employee_id},
-            )
+            ) from error
 
-        existing = self.attendance_repository.find_by_employee_and_date(payload.employee_id, payload.date)
-        if existing:
-            updated = self.attendance_repository.update_status(existing, payload.status)
-            self.db.commit()
-            return updated, False
+        self.rollup_repository.apply_changes([(payload.employee_id, payload.date, previous, payload.status)])
+        self.version_repository.bump([attendance_scope(payload.employee_id)])
 
-        record = self.attendance_repository.create(payload.model_dump())
+        # Serialize before commit so the expired instance is not reloaded.
+        result = AttendanceRead.model_validate(record)
         self.db.commit()
-        return record, True
+        # The foreign key just proved the employee exists.
+        self.existence_cache.add(payload.employee_id)
+        return result, previous is None
+
+    def mark_attendance_bulk(self, payload: AttendanceBulkCreate) -> AttendanceBulkResult:
+        records = payload.records
+        employee_ids = {row.employee_id for row in records}
+        try:
+            return self._write_bulk(records, employee_ids)
+        except IntegrityError:
+            # An employee was deleted between the existence check and the upsert
+            # (the foreign key is the only constraint left); plan again once.
+            self.db.rollback()
+            for employee_id in employee_ids:
+                self.existence_cache.discard(employee_id)
+            return self._write_bulk(records, employee_ids)
+
+    def _write_bulk(self, records: list[AttendanceCreate], employee_ids: set[str]) -> AttendanceBulkResult:
+        results, latest_index = plan_bulk(records, self._known_employee_ids(employee_ids))
+
+        previous_by_key: dict[tuple[str, date], AttendanceStatus | None] = {}
+        if latest_index:
+            previous_by_key = self.attendance_repository.upsert_many(
+                [records[index].model_dump() for index in latest_index.values()]
+            )
+            self.rollup_repository.apply_changes(bulk_changes(records, latest_index, previous_by_key))
+            self.version_repository.bump(attendance_scope(employee_id) for employee_id, _ in latest_index)
+            self.db.commit()
+
+        return bulk_result(records, results, latest_index, previous_by_key)
 
     def get_employee_attendance(
         self,
         employee_id: str,
         for_date: date | None = None,
         for_month: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
     ) -> AttendanceSummary:
-        employee = self.employee_repository.get_by_employee_id(employee_id)
-        if not employee:
+        if not self._employee_exists(employee_id):
             raise NotFoundException("Employee not found", details={"employee_id": employee_id})
 
-        records = self.attendance_repository.get_by_employee(employee_id)
-        month_start: date | None = None
-        month_end: date | None = None
+        if before and after:
+            raise BadRequestException("Use either before or after, not both")
 
-        if for_month:
-            try:
-                month_start = datetime.strptime(for_month, "%Y-%m").date().replace(day=1)
-            except ValueError as error:
-                raise BadRequestException(
-                    "Invalid month format. Use YYYY-MM",
-                    details={"month": for_month},
-                ) from error
+        start, end = resolve_range(for_date, for_month)
+        before_key = decode_record_cursor(before) if before else None
+        after_key = decode_record_cursor(after) if after else None
 
-            if month_start.month == 12:
-                next_month_start = month_start.replace(year=month_start.year + 1, month=1)
-            else:
-                next_month_start = month_start.replace(month=month_start.month + 1)
+        # Fetch one extra row to learn whether the page continues.
+        records = self.attendance_repository.read_by_employee(
+            employee_id,
+            start,
+            end,
+            limit=limit + 1 if limit is not None else None,
+            before=before_key,
+            after=after_key,
+        )
+        records, next_cursor, prev_cursor = page_cursors(records, limit, before_key, after_key)
+
+        # Counters cover the whole filtered range, independent of the page.
+        # Whole-month and all-time counters are served by the monthly rollup.
+        if for_date is None:
+            total_records, total_present = self.rollup_repository.summarize(employee_id, start)
+        else:
+            total_records, total_present = self.attendance_repository.summarize(employee_id, start, end)
+
+        # Trusted rows: model_construct keeps the column rows as they are (they expose
+        # AttendanceRead's attributes) instead of validating each one.
+        return AttendanceSummary.model_construct(
+            employee_id=employee_id,
+            total_records=total_records,
+            total_present=total_present,
+            records=records,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    def export_attendance(
+        self,
+        start: date,
+        end: date,
+        export_format: AttendanceExportFormat,
+        department: str | None = None,
+    ) -> Iterator[str]:
+        """Return a lazy stream of rendered chunks for attendance between start and end, inclusive.
+
+        Arguments are validated eagerly; the returned iterator owns the session
+        and closes it once the stream is exhausted or abandoned.
+        """
+        validate_export_range(start, end)
+        rows = self.attendance_repository.iter_range(start, end + timedelta(days=1), department)
+        return self._close_when_done(iter_export_chunks(rows, export_format))
+
+    def get_attendance_version(self, employee_id: str) -> int:
+        """Return the employee's attendance change counter, used as its ETag source.
+
+        Unknown employees raise ``NotFoundException`` here, so a conditional
+        request for one can never be answered with a 304.
+        """
+        if not self._employee_exists(employee_id):
+            raise NotFoundException("Employee not found", details={"employee_id": employee_id})
+        return self.version_repository.get(attendance_scope(employee_id))
+
+    def _employee_exists(self, employee_id: str) -> bool:
+        """Answer from the existence cache, falling back to a single-row lookup."""
+        exists = self.existence_cache.lookup(employee_id)
+        if exists is None:
+            exists = self.employee_repository.exists(employee_id)
+            remember_existence(self.existence_cache, employee_id, exists)
+        return exists
+
+    def _known_employee_ids(self, employee_ids: set[str]) -> set[str]:
+        # Writes confirm every id with one IN query instead of trusting the cache:
+        # a cached positive may be an employee another worker has since deleted.
+        found = self.employee_repository.get_existing_employee_ids(employee_ids)
+        for employee_id in found:
+            self.existence_cache.add(employee_id)
+        return found
+
+    def _close_when_done(self, chunks: Iterator[str]) -> Iterator[str]:
+        try:
+            yield from chunks
+        finally:
+            self.db.close()
+
+
+class AsyncAttendanceService:
+    """``AttendanceService`` counterpart running on ``AsyncSession``."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        attendance_repository: AsyncAttendanceRepository | None = None,
+        employee_repository: AsyncEmployeeRepository | None = None,
+        rollup_repository: AsyncAttendanceRollupRepository | None = None,
+        existence_cache: ExistenceCache | None = None,
+        version_repository: AsyncResourceVersionRepository | None = None,
+    ) -> None:
+        self.db = db
+        self.attendance_repository = attendance_repository or AsyncAttendanceRepository(db)
+        self.employee_repository = employee_repository or AsyncEmployeeRepository(db)
+        self.rollup_repository = rollup_repository or AsyncAttendanceRollupRepository(db)
+        self.existence_cache = existence_cache or employee_existence_cache
+        self.version_repository = version_repository or AsyncResourceVersionRepository(db)
+
+    async def mark_attendance(self, payload: AttendanceCreate) -> tuple[object, bool]:
+        try:
+            record, previous = await self.attendance_repository.upsert(payload.model_dump())
+        except IntegrityError as error:
+            await self.db.rollback()
+            self.existence_cache.discard(payload.employee_id)
+            raise NotFoundException(
+                "Employee not found",
+                details={"employee_id": payload.employee_id},
+            ) from error
+
+        await self.rollup_repository.apply_changes([(payload.employee_id, payload.date, previous, payload.status)])
+        await self.version_repository.bump([attendance_scope(payload.employee_id)])
+
+        result = AttendanceRead.model_validate(record)
+        await self.db.commit()
+        self.existence_cache.add(payload.employee_id)
+        return result, previous is None
 
-            month_end = next_month_start
-            records = [record for record in records if month_start <= record.date < month_end]
+    async def mark_attendance_bulk(self, payload: AttendanceBulkCreate) -> AttendanceBulkResult:
+        records = payload.records
+        employee_ids = {row.employee_id for row in records}
+        try:
+            return await self._write_bulk(records, employee_ids)
+        except IntegrityError:
+            await self.db.rollback()
+            for employee_id in employee_ids:
+                self.existence_cache.discard(employee_id)
+            return await self._write_bulk(records, employee_ids)
+
+    async def _write_bulk(self, records: list[AttendanceCreate], employee_ids: set[str]) -> AttendanceBulkResult:
+        results, latest_index = plan_bulk(records, await self._known_employee_ids(employee_ids))
+
+        previous_by_key: dict[tuple[str, date], AttendanceStatus | None] = {}
+        if latest_index:
+            previous_by_key = await self.attendance_repository.upsert_many(
+                [records[index].model_dump() for index in latest_index.values()]
+            )
+            await self.rollup_repository.apply_changes(bulk_changes(records, latest_index, previous_by_key))
+            await self.version_repository.bump(attendance_scope(employee_id) for employee_id, _ in latest_index)
+            await self.db.commit()
 
-        if for_date:
-            records = [record for record in records if record.date == for_date]
+        return bulk_result(records, results, latest_index, previous_by_key)
 
-        if for_month or for_date:
-            present_count = len([record for record in records if record.status == AttendanceStatus.PRESENT])
+    async def get_employee_attendance(
+        self,
+        employee_id: str,
+        for_date: date | None = None,
+        for_month: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> AttendanceSummary:
+        if not await self._employee_exists(employee_id):
+            raise NotFoundException("Employee not found", details={"employee_id": employee_id})
+
+        if before and after:
+            raise BadRequestException("Use either before or after, not both")
+
+        start, end = resolve_range(for_date, for_month)
+        before_key = decode_record_cursor(before) if before else None
+        after_key = decode_record_cursor(after) if after else None
+
+        records = await self.attendance_repository.read_by_employee(
+            employee_id,
+            start,
+            end,
+            limit=limit + 1 if limit is not None else None,
+            before=before_key,
+            after=after_key,
+        )
+        records, next_cursor, prev_cursor = page_cursors(records, limit, before_key, after_key)
+
+        if for_date is None:
+            total_records, total_present = await self.rollup_repository.summarize(employee_id, start)
         else:
-            present_count = self.attendance_repository.count_present_days(employee_id)
+            total_records, total_present = await self.attendance_repository.summarize(employee_id, start, end)
 
-        return AttendanceSummary(
+        return AttendanceSummary.model_construct(
             employee_id=employee_id,
-            total_records=len(records),
-            total_present=present_count,
+            total_records=total_records,
+            total_present=total_present,
             records=records,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
+
+    async def export_attendance(
+        self,
+        start: date,
+        end: date,
+        export_format: AttendanceExportFormat,
+        department: str | None = None,
+    ) -> AsyncIterator[str]:
+        validate_export_range(start, end)
+        rows = self.attendance_repository.iter_range(start, end + timedelta(days=1), department)
+        return self._close_when_done(aiter_export_chunks(rows, export_format))
+
+    async def get_attendance_version(self, employee_id: str) -> int:
+        if not await self._employee_exists(employee_id):
+            raise NotFoundException("Employee not found", details={"employee_id": employee_id})
+        return await self.version_repository.get(attendance_scope(employee_id))
+
+    async def _employee_exists(self, employee_id: str) -> bool:
+        exists = self.existence_cache.lookup(employee_id)
+        if exists is None:
+            exists = await self.employee_repository.exists(employee_id)
+            remember_existence(self.existence_cache, employee_id, exists)
+        return exists
+
+    async def _known_employee_ids(self, employee_ids: set[str]) -> set[str]:
+        found = await self.employee_repository.get_existing_employee_ids(employee_ids)
+        for employee_id in found:
+            self.existence_cache.add(employee_id)
+        return found
+
+    async def _close_when_done(self, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await self.db.close()
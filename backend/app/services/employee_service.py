@@ -1,22 +1,96 @@
-from typing import Protocol
+import csv
+from datetime import datetime
+from itertools import islice
+from typing import Protocol, TextIO
 
+from pydantic import ValidationError
+
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import ConflictException, NotFoundException
-from app.repositories.employee_repository import EmployeeRepository, EmployeeRepositoryInterface
-from app.schemas.employee import EmployeeCreate
+from app.core.config import get_settings
+from app.core.exceptions import BadRequestException, ConflictException, NotFoundException
+from app.repositories.employee_repository import (
+    AsyncEmployeeRepository,
+    EmployeeRepository,
+    EmployeeRepositoryInterface,
+)
+from app.repositories.resource_version_repository import (
+    EMPLOYEES_SCOPE,
+    AsyncResourceVersionRepository,
+    ResourceVersionRepository,
+    ResourceVersionRepositoryInterface,
+    attendance_scope,
+)
+from app.schemas.employee import EmployeeCreate, EmployeeImportError, EmployeeImportResult, EmployeeRead
+from app.utils.cache import ExistenceCache
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# Rows validated and staged per round trip during CSV imports.
+IMPORT_CHUNK_ROWS = 1000
+
+_settings = get_settings()
+# Shared by every request in this worker; attendance reads consult it before the database.
+employee_existence_cache = ExistenceCache(
+    maxsize=_settings.employee_cache_size,
+    ttl_seconds=_settings.employee_cache_ttl_seconds,
+    negative_ttl_seconds=_settings.employee_negative_cache_ttl_seconds,
+)
+
+
+def validate_fields(fields: list[str] | None) -> None:
+    if fields:
+        unknown = sorted(set(fields) - set(EmployeeRead.model_fields))
+        if unknown:
+            raise BadRequestException("Unknown employee fields requested", details={"fields": unknown})
+
+
+def decode_employee_cursor(cursor: str) -> tuple[datetime, int]:
+    created_at, employee_pk = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(employee_pk)
+    except (TypeError, ValueError) as error:
+        raise BadRequestException("Invalid cursor", details={"cursor": cursor}) from error
+
+
+def paginate(employees: list, limit: int | None) -> tuple[list, str | None]:
+    """Trim the over-fetched row and derive the next cursor from the last kept one."""
+    if limit is None or len(employees) <= limit:
+        return employees, None
+    employees = employees[:limit]
+    last = employees[-1]
+    return employees, encode_cursor(last.created_at.isoformat(), last.id)
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors())
 
 
 class EmployeeServiceInterface(Protocol):
     def create_employee(self, payload: EmployeeCreate): ...
-    def list_employees(self): ...
+    def list_employees(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list, str | None]: ...
     def delete_employee(self, employee_id: str) -> None: ...
+    def get_version(self) -> int: ...
+    def import_employees(self, source: TextIO) -> EmployeeImportResult: ...
 
 
 class EmployeeService(EmployeeServiceInterface):
-    def __init__(self, db: Session, repository: EmployeeRepositoryInterface | None = None) -> None:
+    def __init__(
+        self,
+        db: Session,
+        repository: EmployeeRepositoryInterface | None = None,
+        existence_cache: ExistenceCache | None = None,
+        version_repository: ResourceVersionRepositoryInterface | None = None,
+    ) -> None:
         self.db = db
         self.repository = repository or EmployeeRepository(db)
+        self.existence_cache = existence_cache or employee_existence_cache
+        self.version_repository = version_repository or ResourceVersionRepository(db)
 
     def create_employee(self, payload: EmployeeCreate):
         if self.repository.get_by_employee_id(payload.employee_id):
@@ -32,11 +106,28 @@ class EmployeeService(EmployeeServiceInterface):
             )
 
         employee = self.repository.create(payload.model_dump())
+        self.version_repository.bump([EMPLOYEES_SCOPE])
+        # Serialize before commit so the expired instance is not reloaded.
+        result = EmployeeRead.model_validate(employee)
         self.db.commit()
-        return employee
+        self.existence_cache.add(payload.employee_id)
+        return result
 
-    def list_employees(self):
-        return self.repository.get_all()
+    def list_employees(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list, str | None]:
+        """Return a newest-first page of employees and the cursor for the next page."""
+        validate_fields(fields)
+        # Fetch one extra row to learn whether another page exists.
+        employees = self.repository.read_page(
+            limit=limit + 1 if limit is not None else None,
+            after=decode_employee_cursor(cursor) if cursor else None,
+            columns=fields,
+        )
+        return paginate(employees, limit)
 
     def delete_employee(self, employee_id: str) -> None:
         employee = self.repository.get_by_employee_id(employee_id)
@@ -47,4 +138,144 @@ class EmployeeService(EmployeeServiceInterface):
             )
 
         self.repository.delete(employee)
+        # The attendance scope is bumped too, so a re-created id never reuses an old ETag.
+        self.version_repository.bump([EMPLOYEES_SCOPE, attendance_scope(employee_id)])
         self.db.commit()
+        self.existence_cache.discard(employee_id)
+
+    def get_version(self) -> int:
+        """Return the employee list's change counter, used as its ETag source."""
+        return self.version_repository.get(EMPLOYEES_SCOPE)
+
+    def import_employees(self, source: TextIO) -> EmployeeImportResult:
+        """Load employees from CSV text in one transaction and report every rejected row.
+
+        Rows are validated with ``EmployeeCreate`` ``IMPORT_CHUNK_ROWS`` at a
+        time and staged, then merged in a single statement that skips any row
+        whose employee_id or email already exists.
+        """
+        reader = csv.DictReader(source)
+        missing = sorted(set(EmployeeCreate.model_fields) - set(reader.fieldnames or ()))
+        if missing:
+            raise BadRequestException("CSV is missing required columns", details={"columns": missing})
+
+        errors: list[EmployeeImportError] = []
+        staged_rows: dict[str, int] = {}
+        staged_emails: set[str] = set()
+        self.repository.start_import()
+
+        rows = enumerate(reader, start=1)
+        while chunk := self._read_import_chunk(rows):
+            valid: list[dict] = []
+            for row_number, row in chunk:
+                employee_id = row.get("employee_id") or None
+                try:
+                    employee = EmployeeCreate.model_validate(
+                        {name: row.get(name) for name in EmployeeCreate.model_fields}
+                    )
+                except ValidationError as error:
+                    message = describe_validation_error(error)
+                    errors.append(EmployeeImportError(row=row_number, employee_id=employee_id, message=message))
+                    continue
+                if employee.employee_id in staged_rows or employee.email in staged_emails:
+                    message = "Duplicate employee_id or email earlier in the file"
+                    errors.append(EmployeeImportError(row=row_number, employee_id=employee_id, message=message))
+                    continue
+                staged_rows[employee.employee_id] = row_number
+                staged_emails.add(employee.email)
+                valid.append({"row_number": row_number, **employee.model_dump()})
+            self.repository.stage_import(valid)
+
+        created = self.repository.merge_import()
+        errors.extend(
+            EmployeeImportError(
+                row=row_number,
+                employee_id=employee_id,
+                message="Employee with this employee_id or email already exists",
+            )
+            for employee_id, row_number in staged_rows.items()
+            if employee_id not in created
+        )
+        if created:
+            self.version_repository.bump([EMPLOYEES_SCOPE])
+        self.db.commit()
+        for employee_id in created:
+            self.existence_cache.add(employee_id)
+
+        errors.sort(key=lambda error: error.row)
+        return EmployeeImportResult(created=len(created), rejected=len(errors), errors=errors)
+
+    @staticmethod
+    def _read_import_chunk(rows) -> list[tuple[int, dict]]:
+        try:
+            return list(islice(rows, IMPORT_CHUNK_ROWS))
+        except UnicodeDecodeError as error:
+            raise BadRequestException("CSV must be UTF-8 encoded") from error
+        except csv.Error as error:
+            raise BadRequestException("Malformed CSV", details={"error": str(error)}) from error
+
+
+class AsyncEmployeeService:
+    """``EmployeeService`` counterpart running on ``AsyncSession``."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: AsyncEmployeeRepository | None = None,
+        existence_cache: ExistenceCache | None = None,
+        version_repository: AsyncResourceVersionRepository | None = None,
+    ) -> None:
+        self.db = db
+        self.repository = repository or AsyncEmployeeRepository(db)
+        self.existence_cache = existence_cache or employee_existence_cache
+        self.version_repository = version_repository or AsyncResourceVersionRepository(db)
+
+    async def create_employee(self, payload: EmployeeCreate):
+        if await self.repository.get_by_employee_id(payload.employee_id):
+            raise ConflictException(
+                "Employee with this employee_id already exists",
+                details={"employee_id": payload.employee_id},
+            )
+
+        if await self.repository.get_by_email(payload.email):
+            raise ConflictException(
+                "Employee with this email already exists",
+                details={"email": payload.email},
+            )
+
+        employee = await self.repository.create(payload.model_dump())
+        await self.version_repository.bump([EMPLOYEES_SCOPE])
+        result = EmployeeRead.model_validate(employee)
+        await self.db.commit()
+        self.existence_cache.add(payload.employee_id)
+        return result
+
+    async def list_employees(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> tuple[list, str | None]:
+        validate_fields(fields)
+        employees = await self.repository.read_page(
+            limit=limit + 1 if limit is not None else None,
+            after=decode_employee_cursor(cursor) if cursor else None,
+            columns=fields,
+        )
+        return paginate(employees, limit)
+
+    async def delete_employee(self, employee_id: str) -> None:
+        employee = await self.repository.get_by_employee_id(employee_id)
+        if not employee:
+            raise NotFoundException(
+                "Employee not found",
+                details={"employee_id": employee_id},
+            )
+
+        await self.repository.delete(employee)
+        await self.version_repository.bump([EMPLOYEES_SCOPE, attendance_scope(employee_id)])
+        await self.db.commit()
+        self.existence_cache.discard(employee_id)
+
+    async def get_version(self) -> int:
+        return await self.version_repository.get(EMPLOYEES_SCOPE)
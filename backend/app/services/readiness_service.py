@@ -0,0 +1,105 @@
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.schemas.readiness import DependencyCheck, ReadinessReport
+from app.utils.cache import TTLCache
+
+ALEMBIC_SCRIPT_DIR = Path(__file__).resolve().parents[2] / "alembic"
+READINESS_KEY = "ready"
+
+# One probe per worker per TTL, however many load balancers ask.
+readiness_cache: TTLCache[ReadinessReport] = TTLCache(maxsize=1, ttl_seconds=get_settings().readiness_cache_ttl_seconds)
+
+
+@lru_cache
+def expected_heads() -> frozenset[str]:
+    # Read from the migration scripts shipped with this build, so a worker that
+    # runs ahead of (or behind) the database schema reports itself not ready.
+    return frozenset(ScriptDirectory(str(ALEMBIC_SCRIPT_DIR)).get_heads())
+
+
+def timed(check: Callable[[], str | None]) -> DependencyCheck:
+    started = time.perf_counter()
+    try:
+        detail = check()
+        ok = detail is None
+    except SQLAlchemyError as exc:
+        ok, detail = False, type(exc).__name__
+    return DependencyCheck(ok=ok, latency_ms=round((time.perf_counter() - started) * 1000, 3), detail=detail)
+
+
+def probe(session: Session, heads: frozenset[str]) -> ReadinessReport:
+    """Check out a pooled connection, run a trivial query, then compare the schema revision.
+
+    Runs on a plain ``Session`` so the async service can reuse it through ``run_sync``.
+    """
+
+    def database() -> None:
+        session.connection().execute(text("SELECT 1"))
+
+    def migrations() -> str | None:
+        current = frozenset(MigrationContext.configure(session.connection()).get_current_heads())
+        if current != heads:
+            return f"database at {','.join(sorted(current)) or 'no revision'}, code expects {','.join(sorted(heads))}"
+        return None
+
+    checks = {"database": timed(database)}
+    checks["migrations"] = (
+        timed(migrations) if checks["database"].ok else DependencyCheck(ok=False, latency_ms=0.0, detail="skipped")
+    )
+    return ReadinessReport(
+        status="ready" if all(check.ok for check in checks.values()) else "not_ready",
+        checked_at=datetime.now(timezone.utc),
+        checks=checks,
+    )
+
+
+class ReadinessServiceInterface(Protocol):
+    def check(self) -> ReadinessReport: ...
+
+
+class ReadinessService(ReadinessServiceInterface):
+    def __init__(
+        self,
+        db: Session,
+        cache: TTLCache[ReadinessReport] | None = None,
+        heads: frozenset[str] | None = None,
+    ) -> None:
+        self.db = db
+        self.cache = cache if cache is not None else readiness_cache
+        self.heads = heads
+
+    def check(self) -> ReadinessReport:
+        return self.cache.get_or_set(READINESS_KEY, lambda: probe(self.db, self.heads or expected_heads()))
+
+
+class AsyncReadinessService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: TTLCache[ReadinessReport] | None = None,
+        heads: frozenset[str] | None = None,
+    ) -> None:
+        self.db = db
+        self.cache = cache if cache is not None else readiness_cache
+        self.heads = heads
+
+    async def check(self) -> ReadinessReport:
+        report = self.cache.get(READINESS_KEY)
+        if report is None:
+            heads = self.heads or expected_heads()
+            report = await self.db.run_sync(lambda session: probe(session, heads))
+            self.cache.set(READINESS_KEY, report)
+        return report
@@ -0,0 +1,55 @@
+from collections.abc import Callable
+from datetime import date
+from typing import Protocol
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models.attendance import AttendanceStatus
+from app.repositories.stats_repository import StatsRepository, StatsRepositoryInterface
+from app.schemas.stats import DepartmentHeadcount, StatsOverview
+from app.utils.cache import TTLCache
+
+# Shared by every request in this worker so concurrent dashboards reuse one result.
+overview_cache: TTLCache[StatsOverview] = TTLCache(maxsize=4, ttl_seconds=get_settings().stats_cache_ttl_seconds)
+
+
+class StatsServiceInterface(Protocol):
+    def get_overview(self) -> StatsOverview: ...
+
+
+class StatsService(StatsServiceInterface):
+    def __init__(
+        self,
+        db: Session,
+        repository: StatsRepositoryInterface | None = None,
+        cache: TTLCache[StatsOverview] | None = None,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.db = db
+        self.repository = repository or StatsRepository(db)
+        self.cache = cache if cache is not None else overview_cache
+        self.today = today
+
+    def get_overview(self) -> StatsOverview:
+        on_date = self.today()
+        return self.cache.get_or_set(on_date, lambda: self._build_overview(on_date))
+
+    def _build_overview(self, on_date: date) -> StatsOverview:
+        departments = [
+            DepartmentHeadcount(department=department, headcount=headcount)
+            for department, headcount in self.repository.headcount_by_department()
+        ]
+        total_employees = sum(item.headcount for item in departments)
+        counts = self.repository.attendance_counts_on(on_date)
+        present = counts.get(AttendanceStatus.PRESENT, 0)
+        absent = counts.get(AttendanceStatus.ABSENT, 0)
+
+        return StatsOverview(
+            total_employees=total_employees,
+            departments=departments,
+            date=on_date,
+            present_today=present,
+            absent_today=absent,
+            unmarked_today=max(total_employees - present - absent, 0),
+        )
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe, size-bounded LRU cache whose entries expire after ``ttl_seconds``.
+
+    State is per process; every gunicorn worker keeps its own copy.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: object = None) -> V | object:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """Return the cached value, computing and storing it with ``factory`` on a miss.
+
+        The factory runs outside the lock, so concurrent misses may compute it
+        more than once; the last result wins.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class ExistenceCache:
+    """Per-process answer to "does this key exist?" without a database round trip.
+
+    Confirmed keys are remembered for ``ttl_seconds`` and confirmed absences
+    for the much shorter ``negative_ttl_seconds``, each in a size-bounded LRU;
+    anything else is "unsure" and must be checked. Writers in this process keep
+    both exact via :meth:`add` and :meth:`discard`; a key created elsewhere is
+    seen once its absence lapses, a key deleted elsewhere once its presence does.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._present: TTLCache[bool] = TTLCache(maxsize, ttl_seconds, clock)
+        self._absent: TTLCache[bool] = TTLCache(maxsize, negative_ttl_seconds, clock)
+
+    def lookup(self, key: str) -> bool | None:
+        """Return True if known to exist, False if known to be absent, None when unsure."""
+        if self._present.get(key):
+            return True
+        if self._absent.get(key):
+            return False
+        return None
+
+    def add(self, key: str) -> None:
+        self._absent.pop(key)
+        self._present.set(key, True)
+
+    def mark_absent(self, key: str) -> None:
+        self._present.pop(key)
+        self._absent.set(key, True)
+
+    def discard(self, key: str) -> None:
+        self._present.pop(key)
+        self._absent.pop(key)
+
+    def clear(self) -> None:
+        self._present.clear()
+        self._absent.clear()
@@ -0,0 +1,16 @@
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+
+async def run_service(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a sync or async service method from an ``async def`` route.
+
+    Coroutine methods are awaited on the event loop; blocking ones are moved
+    to the threadpool so a sync session never stalls other requests.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
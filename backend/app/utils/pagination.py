@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(*values: object) -> str:
+    """Pack keyset values into an opaque, URL-safe cursor token."""
+    raw = json.dumps(list(values), separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list:
+    """Unpack a cursor produced by :func:`encode_cursor` holding ``size`` values."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as error:
+        raise BadRequestException("Invalid cursor", details={"cursor": token}) from error
+
+    if not isinstance(values, list) or len(values) != size:
+        raise BadRequestException("Invalid cursor", details={"cursor": token})
+    return values
@@ -0,0 +1,4 @@
+"""In-process endpoint benchmarks for HRMS Lite.
+
+Run from the backend directory with ``python -m benchmarks --help``.
+"""
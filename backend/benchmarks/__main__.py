@@ -0,0 +1,140 @@
+"""Seed a synthetic dataset and benchmark the API endpoints in-process.
+
+Examples (from the backend directory)::
+
+    python -m benchmarks --employees 10000 --days 1095 --output .benchmarks/baseline.json
+    python -m benchmarks --employees 10000 --days 1095 --baseline .benchmarks/baseline.json
+"""
+
+import argparse
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+DEFAULT_OUTPUT = Path(".benchmarks") / "latest.json"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HRMS Lite endpoint benchmarks")
+    parser.add_argument(
+        "--database-url",
+        help="Database to seed and serve from (default: a fresh SQLite file in a temp directory). "
+        "It must be empty unless --skip-seed is given.",
+    )
+    parser.add_argument("--db-mode", choices=["sync", "async"], help="Override DB_MODE for the app under test")
+    parser.add_argument("--employees", type=int, default=1000, help="Synthetic employees to seed")
+    parser.add_argument("--days", type=int, default=90, help="Calendar days of attendance per employee")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="Last attendance day (YYYY-MM-DD)")
+    parser.add_argument("--absence-rate", type=float, default=0.05)
+    parser.add_argument("--department-skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for data and request mix")
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse data already loaded with the same spec")
+    parser.add_argument("--requests", type=int, default=500, help="Timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per scenario")
+    parser.add_argument("--page-size", type=int, default=100, help="limit= used by the read scenarios")
+    parser.add_argument("--scenario", action="append", dest="scenarios", help="Run only this scenario (repeatable)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON report")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help="With --baseline, exit 1 when a percentile or throughput is worse by more than this fraction",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    # Settings are read once at import time, so the target database is chosen before the app loads.
+    database_url = args.database_url or f"sqlite:///{Path(tempfile.mkdtemp(prefix='hrms-bench-')) / 'bench.db'}"
+    os.environ["DATABASE_URL"] = database_url
+    if args.db_mode:
+        os.environ["DB_MODE"] = args.db_mode
+
+    import sqlalchemy
+    from fastapi.testclient import TestClient
+
+    from app.core.config import get_settings
+    from app.db.init_db import init_db
+    from app.db.session import SessionLocal
+    from app.db.synthetic import DatasetSpec, load_dataset
+    from app.main import app
+    from benchmarks.report import compare, format_table, peak_rss_bytes, read_report, write_report
+    from benchmarks.scenarios import run_scenarios
+
+    settings = get_settings()
+    spec = DatasetSpec(
+        employees=args.employees,
+        days=args.days,
+        end=args.end,
+        department_skew=args.department_skew,
+        absence_rate=args.absence_rate,
+        seed=args.seed,
+    )
+
+    seeded: dict = {"skipped": args.skip_seed}
+    if not args.skip_seed:
+        init_db()
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            seeded.update(load_dataset(db, spec))
+            db.commit()
+        seeded["seconds"] = round(time.perf_counter() - started, 3)
+        print(f"[bench] Seeded {seeded['employees']} employees / {seeded['attendance']} attendance rows "
+              f"in {seeded['seconds']}s")
+
+    with TestClient(app, headers={"X-Superadmin-Key": settings.superadmin_key}) as client:
+        scenarios = run_scenarios(
+            client,
+            spec,
+            requests=args.requests,
+            warmup=args.warmup,
+            api_prefix=settings.api_v1_prefix,
+            page_size=args.page_size,
+            only=set(args.scenarios) if args.scenarios else None,
+        )
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "dialect": sqlalchemy.make_url(database_url).get_backend_name(),
+            "db_mode": settings.db_mode,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "page_size": args.page_size,
+        },
+        "dataset": {
+            "employees": spec.employees,
+            "days": spec.days,
+            "end": spec.end.isoformat(),
+            "absence_rate": spec.absence_rate,
+            "department_skew": spec.department_skew,
+            "seed": spec.seed,
+        },
+        "seed": seeded,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "scenarios": scenarios,
+    }
+    write_report(report, args.output)
+
+    changes, regressions = None, []
+    if args.baseline:
+        changes, regressions = compare(report, read_report(args.baseline), args.max_regression)
+    print(format_table(report, changes))
+    print(f"[bench] Report written to {args.output}")
+    for regression in regressions:
+        print(f"[bench] REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
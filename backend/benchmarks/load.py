@@ -0,0 +1,242 @@
+"""Concurrent HTTP load against a running deployment's /api routes.
+
+Unlike ``python -m benchmarks``, which drives the app in-process, this hits a
+live server (gunicorn workers, real pool, real network stack) so releases can
+be compared on the hardware they run on. ``hrmsctl bench`` runs it against
+the docker or venv deployment.
+
+The workload mixes, by weight:
+
+- ``mark_attendance``: POST /attendance for a known employee and a recent day (upsert)
+- ``attendance_month``: GET /attendance/{id}?month=YYYY-MM
+- ``list_employees``: GET /employees?limit=N
+- ``employee_churn``: POST /employees then DELETE of the same employee
+
+Known employees are read from the target once at start-up, so seed it first
+(``hrmsctl seed``). The run writes attendance rows; churned employees are removed.
+
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --concurrency 32 --duration 30
+"""
+
+import argparse
+import asyncio
+import platform
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+from app.core.config import get_settings
+from benchmarks.report import compare, format_table, read_report, summarize, write_report
+
+DEFAULT_OUTPUT = Path(".benchmarks") / "load-latest.json"
+DEFAULT_MIX = "mark_attendance=4,attendance_month=3,list_employees=2,employee_churn=1"
+OPERATIONS = ("mark_attendance", "attendance_month", "list_employees", "employee_churn")
+# Employees fetched up front as targets for the attendance operations.
+KNOWN_EMPLOYEES = 1000
+STATUSES = ("PRESENT", "ABSENT")
+
+
+def parse_mix(raw: str) -> dict[str, float]:
+    """Parse ``name=weight,...`` into weights for :data:`OPERATIONS`."""
+    mix: dict[str, float] = {}
+    for part in filter(None, (item.strip() for item in raw.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The mix needs at least one operation with a positive weight")
+    return mix
+
+
+def recent_months(today: date, count: int) -> list[str]:
+    months = []
+    year, month = today.year, today.month
+    for _ in range(count):
+        months.append(f"{year}-{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months
+
+
+@dataclass
+class Recorder:
+    """Per-route latencies; only requests started inside the measured window count."""
+
+    measure_from: float
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    async def request(self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs) -> int:
+        started = time.perf_counter()
+        try:
+            status = (await client.request(method, url, **kwargs)).status_code
+        except httpx.HTTPError:
+            status = 0
+        if started >= self.measure_from:
+            self.latencies[route].append(time.perf_counter() - started)
+            if status == 0 or status >= 400:
+                self.errors[route] += 1
+        return status
+
+
+class Workload:
+    def __init__(self, api_prefix: str, employee_ids: list[str], page_size: int, days: int, run_id: str) -> None:
+        self.api_prefix = api_prefix
+        self.employee_ids = employee_ids
+        self.page_size = page_size
+        today = date.today()
+        self.dates = [today - timedelta(days=offset) for offset in range(days)]
+        self.months = recent_months(today, max(days // 30, 1))
+        self.run_id = run_id
+
+    async def run(self, operation: str, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random) -> None:
+        await getattr(self, operation)(client, recorder, rng)
+
+    async def mark_attendance(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random) -> None:
+        payload = {
+            "employee_id": rng.choice(self.employee_ids),
+            "date": rng.choice(self.dates).isoformat(),
+            "status": rng.choice(STATUSES),
+        }
+        await recorder.request(client, "mark_attendance", "POST", f"{self.api_prefix}/attendance", json=payload)
+
+    async def attendance_month(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random) -> None:
+        url = f"{self.api_prefix}/attendance/{rng.choice(self.employee_ids)}?month={rng.choice(self.months)}"
+        await recorder.request(client, "attendance_month", "GET", url)
+
+    async def list_employees(self, client: httpx.AsyncClient, recorder: Recorder, _rng: random.Random) -> None:
+        await recorder.request(client, "list_employees", "GET", f"{self.api_prefix}/employees?limit={self.page_size}")
+
+    async def employee_churn(self, client: httpx.AsyncClient, recorder: Recorder, _rng: random.Random) -> None:
+        employee_id = f"LT{self.run_id}{uuid.uuid4().hex[:12]}".upper()
+        payload = {
+            "employee_id": employee_id,
+            "full_name": "Load Test",
+            "email": f"{employee_id.lower()}@example.com",
+            "department": "Load Test",
+        }
+        status = await recorder.request(client, "create_employee", "POST", f"{self.api_prefix}/employees", json=payload)
+        if status == 201:
+            await recorder.request(client, "delete_employee", "DELETE", f"{self.api_prefix}/employees/{employee_id}")
+
+
+async def fetch_employee_ids(client: httpx.AsyncClient, api_prefix: str, count: int) -> list[str]:
+    response = await client.get(f"{api_prefix}/employees", params={"limit": count, "fields": "employee_id"})
+    response.raise_for_status()
+    return [row["employee_id"] for row in response.json()]
+
+
+async def run_load(args: argparse.Namespace, mix: dict[str, float]) -> tuple[dict[str, dict], float]:
+    # One pooled client shared by every worker: connections are kept alive and reused, and the
+    # pool never exceeds the concurrency, so each worker has at most one request in flight.
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"X-Superadmin-Key": args.superadmin_key},
+        limits=limits,
+        timeout=args.timeout,
+    ) as client:
+        operations = [name for name, weight in mix.items() if weight > 0]
+        weights = [mix[name] for name in operations]
+        employee_ids = await fetch_employee_ids(client, args.api_prefix, KNOWN_EMPLOYEES)
+        if not employee_ids and {"mark_attendance", "attendance_month"}.intersection(operations):
+            raise RuntimeError("The target has no employees; seed it first (hrmsctl seed)")
+
+        workload = Workload(args.api_prefix, employee_ids, args.page_size, args.days, uuid.uuid4().hex[:4])
+        started = time.perf_counter()
+        recorder = Recorder(measure_from=started + args.warmup)
+        deadline = recorder.measure_from + args.duration
+
+        async def worker(index: int) -> None:
+            rng = random.Random(args.seed + index)
+            while time.perf_counter() < deadline:
+                operation = rng.choices(operations, weights)[0]
+                await workload.run(operation, client, recorder, rng)
+
+        await asyncio.gather(*(worker(index) for index in range(args.concurrency)))
+        elapsed = time.perf_counter() - recorder.measure_from
+
+    routes = {
+        route: summarize(latencies, elapsed, recorder.errors[route])
+        for route, latencies in sorted(recorder.latencies.items())
+    }
+    return routes, elapsed
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="HRMS Lite load generator for a running deployment")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Backend root URL")
+    parser.add_argument("--api-prefix", default="/api")
+    parser.add_argument(
+        "--superadmin-key",
+        default=get_settings().superadmin_key,
+        help="X-Superadmin-Key sent with every request (default: SUPERADMIN_KEY from the environment or .env)",
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent workers (and pooled connections)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds before the window opens")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--page-size", type=int, default=100, help="limit= used by list_employees")
+    parser.add_argument("--days", type=int, default=90, help="Recent days marked and queried by month")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed for the request mix")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON report")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help="With --baseline, exit 1 when a percentile or throughput is worse by more than this fraction",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    mix = parse_mix(args.mix)
+    print(
+        f"[bench] {args.concurrency} workers for {args.duration:g}s (+{args.warmup:g}s warm-up) "
+        f"against {args.base_url}{args.api_prefix}"
+    )
+    routes, elapsed = asyncio.run(run_load(args, mix))
+
+    total = sum(figures["requests"] for figures in routes.values())
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "target": args.base_url,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 3),
+            "warmup_seconds": args.warmup,
+            "mix": mix,
+            "page_size": args.page_size,
+            "total_requests": total,
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        },
+        # Keyed like the in-process report so compare() and format_table() apply unchanged.
+        "scenarios": routes,
+    }
+    write_report(report, args.output)
+
+    changes, regressions = None, []
+    if args.baseline:
+        changes, regressions = compare(report, read_report(args.baseline), args.max_regression)
+    print(format_table(report, changes))
+    print(f"[bench] {total} requests in {elapsed:.1f}s ({report['meta']['throughput_rps']} req/s overall)")
+    print(f"[bench] Report written to {args.output}")
+    for regression in regressions:
+        print(f"[bench] REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
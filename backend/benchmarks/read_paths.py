@@ -0,0 +1,107 @@
+"""Latency and memory of ORM entity reads vs the Core column-row reads GET endpoints use.
+
+Seeds a throwaway SQLite file, then times each repository read and records
+the peak Python allocation (``tracemalloc``) of one more run.
+
+    python -m benchmarks.read_paths --employees 20000 --days 3650
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.base import Base
+from app.db.synthetic import (
+    LOAD_BATCH_SIZE,
+    DatasetSpec,
+    batched,
+    generate_attendance,
+    load_dataset,
+    synthetic_employee_id,
+)
+from app.models.attendance import Attendance
+from app.repositories.attendance_repository import AttendanceRepository
+from app.repositories.employee_repository import EmployeeRepository
+from benchmarks.report import percentile, write_report
+
+
+def measure(session_factory: Callable[[], Session], read: Callable[[Session], list], repeat: int) -> dict:
+    # A fresh session per run, like one per HTTP request, so the identity map starts empty.
+    timings: list[float] = []
+    for _ in range(repeat):
+        with session_factory() as db:
+            started = time.perf_counter()
+            rows = len(read(db))
+            timings.append(time.perf_counter() - started)
+
+    # Allocation tracing slows Python down, so memory gets its own untimed run.
+    with session_factory() as db:
+        tracemalloc.start()
+        read(db)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        "rows": rows,
+        "p50_ms": round(percentile(timings, 0.5) * 1000, 3),
+        "best_ms": round(min(timings) * 1000, 3),
+        "peak_alloc_bytes": peak,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ORM vs Core read paths")
+    parser.add_argument("--employees", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=3650, help="Calendar days of history for the attendance read")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Also write the figures as JSON")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(f"sqlite:///{Path(tempfile.mkdtemp(prefix='hrms-read-')) / 'read.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    # Attendance for the first employee only keeps seeding fast while still producing a long history.
+    with session_factory() as db:
+        load_dataset(db, DatasetSpec(employees=args.employees, days=0))
+        history = DatasetSpec(employees=1, days=args.days, end=date(2026, 12, 31))
+        for batch in batched(generate_attendance(history), LOAD_BATCH_SIZE):
+            db.execute(insert(Attendance.__table__), batch)
+        db.commit()
+
+    employee_id = synthetic_employee_id(0)
+    cases = {
+        "employees_all": {
+            "orm": lambda db: EmployeeRepository(db).get_page(),
+            "core": lambda db: EmployeeRepository(db).read_page(),
+        },
+        "attendance_history": {
+            "orm": lambda db: AttendanceRepository(db).get_by_employee(employee_id),
+            "core": lambda db: AttendanceRepository(db).read_by_employee(employee_id),
+        },
+    }
+
+    results: dict[str, dict] = {}
+    for name, paths in cases.items():
+        results[name] = {label: measure(session_factory, read, args.repeat) for label, read in paths.items()}
+        orm, core = results[name]["orm"], results[name]["core"]
+        print(
+            f"[bench] {name:<18} {core['rows']:>7} rows: "
+            f"orm {orm['p50_ms']:.1f} ms / {orm['peak_alloc_bytes'] / 2**20:.1f} MiB, "
+            f"core {core['p50_ms']:.1f} ms / {core['peak_alloc_bytes'] / 2**20:.1f} MiB"
+        )
+    engine.dispose()
+
+    if args.output:
+        write_report({"employees": args.employees, "days": args.days, "results": results}, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import json
+import math
+import sys
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Latency figures compared against a baseline; throughput is compared in the other direction.
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples``; 0.0 for an empty list."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far, or ``None`` where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize(latencies: list[float], elapsed_seconds: float, errors: int) -> dict:
+    """Reduce per-request latencies (seconds) to the figures stored in a report."""
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 3),
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> tuple[list[dict], list[str]]:
+    """Diff two reports' scenarios.
+
+    Returns one row of relative changes per shared scenario, plus the
+    descriptions of every figure that got worse by more than ``max_regression``
+    (a fraction, e.g. ``0.1`` for 10%).
+    """
+    rows: list[dict] = []
+    regressions: list[str] = []
+    for name, figures in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        row = {"scenario": name}
+        for key in (*LATENCY_KEYS, "throughput_rps"):
+            change = _relative_change(figures[key], previous[key])
+            row[key] = change
+            # Slower latency is a positive change; lower throughput a negative one.
+            worse = change if key in LATENCY_KEYS else -change
+            if worse > max_regression:
+                regressions.append(f"{name} {key}: {previous[key]} -> {figures[key]} ({change:+.1%})")
+        rows.append(row)
+    return rows, regressions
+
+
+def _relative_change(current: float, previous: float) -> float:
+    if not previous:
+        return 0.0
+    return (current - previous) / previous
+
+
+def write_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, default=str) + "\n", encoding="utf-8")
+
+
+def read_report(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def format_table(report: dict, changes: list[dict] | None = None) -> str:
+    by_scenario = {row["scenario"]: row for row in changes or []}
+    lines = [f"{'scenario':<24}{'reqs':>7}{'err':>5}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  vs baseline"]
+    for name, figures in report["scenarios"].items():
+        line = (
+            f"{name:<24}{figures['requests']:>7}{figures['errors']:>5}{figures['throughput_rps']:>10.1f}"
+            f"{figures['p50_ms']:>10.2f}{figures['p95_ms']:>10.2f}{figures['p99_ms']:>10.2f}"
+        )
+        change = by_scenario.get(name)
+        if change:
+            line += f"  p95 {change['p95_ms']:+.1%}, rps {change['throughput_rps']:+.1%}"
+        lines.append(line)
+    return "\n".join(lines)
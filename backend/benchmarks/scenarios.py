@@ -0,0 +1,115 @@
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from fastapi.testclient import TestClient
+
+from app.db.synthetic import DatasetSpec, synthetic_employee_id
+from app.models.attendance import AttendanceStatus
+from benchmarks.report import summarize
+
+# (method, path, JSON body or None)
+RequestSpec = tuple[str, str, dict | None]
+
+
+@dataclass
+class Scenario:
+    name: str
+    build_request: Callable[[random.Random], RequestSpec]
+    # Upper bound on requests, for scenarios that consume the dataset (e.g. deletes).
+    max_requests: int | None = None
+
+
+def build_scenarios(spec: DatasetSpec, api_prefix: str, page_size: int) -> list[Scenario]:
+    """Endpoint workloads over a dataset loaded from ``spec``, in execution order.
+
+    Read scenarios come first; ``delete_employee`` runs last and removes
+    employees from the top of the index range that the other scenarios
+    never touch.
+    """
+    dates = spec.attendance_dates()
+    months = sorted({f"{day.year}-{day.month:02d}" for day in dates})
+    # The lower half is read and written; the upper half is reserved for deletes.
+    readable = max(spec.employees // 2, 1)
+    deletable = list(range(readable, spec.employees))
+    random.Random(spec.seed).shuffle(deletable)
+
+    def random_employee(rng: random.Random) -> str:
+        return synthetic_employee_id(rng.randrange(readable))
+
+    def list_employees(_rng: random.Random) -> RequestSpec:
+        return "GET", f"{api_prefix}/employees?limit={page_size}", None
+
+    def get_attendance(rng: random.Random) -> RequestSpec:
+        return "GET", f"{api_prefix}/attendance/{random_employee(rng)}?limit={page_size}", None
+
+    def get_attendance_month(rng: random.Random) -> RequestSpec:
+        month = rng.choice(months)
+        return "GET", f"{api_prefix}/attendance/{random_employee(rng)}?month={month}", None
+
+    def mark_attendance(rng: random.Random) -> RequestSpec:
+        payload = {
+            "employee_id": random_employee(rng),
+            "date": rng.choice(dates).isoformat(),
+            "status": rng.choice(list(AttendanceStatus)).value,
+        }
+        return "POST", f"{api_prefix}/attendance", payload
+
+    def delete_employee(_rng: random.Random) -> RequestSpec:
+        return "DELETE", f"{api_prefix}/employees/{synthetic_employee_id(deletable.pop())}", None
+
+    return [
+        Scenario("list_employees", list_employees),
+        Scenario("get_attendance", get_attendance),
+        Scenario("get_attendance_month", get_attendance_month),
+        Scenario("mark_attendance", mark_attendance),
+        Scenario("delete_employee", delete_employee, max_requests=len(deletable)),
+    ]
+
+
+def run_scenario(
+    client: TestClient,
+    scenario: Scenario,
+    requests: int,
+    warmup: int,
+    rng: random.Random,
+) -> dict:
+    """Issue ``warmup`` untimed then ``requests`` timed calls; any 4xx/5xx counts as an error."""
+    if scenario.max_requests is not None:
+        warmup = min(warmup, scenario.max_requests)
+        requests = min(requests, scenario.max_requests - warmup)
+
+    for _ in range(warmup):
+        method, path, body = scenario.build_request(rng)
+        client.request(method, path, json=body)
+
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for _ in range(requests):
+        method, path, body = scenario.build_request(rng)
+        request_started = time.perf_counter()
+        response = client.request(method, path, json=body)
+        latencies.append(time.perf_counter() - request_started)
+        if response.status_code >= 400:
+            errors += 1
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+def run_scenarios(
+    client: TestClient,
+    spec: DatasetSpec,
+    requests: int,
+    warmup: int,
+    api_prefix: str = "/api",
+    page_size: int = 100,
+    only: set[str] | None = None,
+) -> dict[str, dict]:
+    rng = random.Random(spec.seed)
+    results: dict[str, dict] = {}
+    for scenario in build_scenarios(spec, api_prefix, page_size):
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = run_scenario(client, scenario, requests, warmup, rng)
+    return results
@@ -0,0 +1,133 @@
+"""Per-row cost of rendering large list responses, validated vs trusted.
+
+``validated`` mirrors what FastAPI does for ``response_model`` routes: the rows
+are validated into the response model (``EmailStr`` included), dumped to
+JSON-compatible data and encoded with the stdlib ``JSONResponse``.
+``trusted`` is the path the list endpoints use now: attributes are copied
+off the rows without validation and encoded with ``AppJSONResponse``.
+
+    python -m benchmarks.serialization --rows 10000
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.employee import Employee
+from app.schemas.attendance import AttendanceRead, AttendanceSummary
+from app.schemas.employee import EmployeeRead
+from app.utils.serialization import AppJSONResponse, trusted_rows
+from benchmarks.report import percentile, write_report
+
+
+def build_employees(count: int) -> list[Employee]:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Employee(
+            id=index + 1,
+            employee_id=f"EMP{index:06d}",
+            full_name=f"Employee {index}",
+            email=f"employee{index}@example.com",
+            department="Engineering",
+            created_at=created_at + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def build_attendance(count: int) -> list[Attendance]:
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Attendance(
+            id=index + 1,
+            employee_id="EMP000001",
+            date=date(2000, 1, 1) + timedelta(days=index),
+            status=AttendanceStatus.PRESENT if index % 7 else AttendanceStatus.ABSENT,
+            created_at=created_at,
+        )
+        for index in range(count)
+    ]
+
+
+def employee_paths(rows: list[Employee]) -> dict[str, Callable[[], bytes]]:
+    adapter = TypeAdapter(list[EmployeeRead])
+
+    def validated() -> bytes:
+        models = adapter.validate_python(rows, from_attributes=True)
+        return JSONResponse(adapter.dump_python(models, mode="json")).body
+
+    def trusted() -> bytes:
+        return AppJSONResponse(trusted_rows(EmployeeRead, rows)).body
+
+    return {"validated": validated, "trusted": trusted}
+
+
+def attendance_paths(rows: list[Attendance]) -> dict[str, Callable[[], bytes]]:
+    def summary(records: list) -> dict:
+        return {"employee_id": "EMP000001", "total_records": len(rows), "total_present": 0, "records": records}
+
+    def validated() -> bytes:
+        # Service validation into AttendanceSummary, then FastAPI's dump-and-revalidate of the response model.
+        built = AttendanceSummary(**summary(rows))
+        checked = AttendanceSummary.model_validate(built.model_dump())
+        return JSONResponse(checked.model_dump(mode="json")).body
+
+    def trusted() -> bytes:
+        built = AttendanceSummary.model_construct(**summary(rows), next_cursor=None, prev_cursor=None)
+        content = built.model_dump(exclude={"records"})
+        content["records"] = trusted_rows(AttendanceRead, built.records)
+        return AppJSONResponse(content).body
+
+    return {"validated": validated, "trusted": trusted}
+
+
+def measure(path: Callable[[], bytes], rows: int, repeat: int) -> dict:
+    path()  # warm up schema and encoder caches
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        "best_ms": round(best * 1000, 3),
+        "p50_ms": round(percentile(timings, 0.5) * 1000, 3),
+        "per_row_us": round(best / rows * 1_000_000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Validated vs trusted response serialization")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Also write the figures as JSON")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict] = {}
+    for name, paths in (
+        ("employees", employee_paths(build_employees(args.rows))),
+        ("attendance", attendance_paths(build_attendance(args.rows))),
+    ):
+        results[name] = {label: measure(path, args.rows, args.repeat) for label, path in paths.items()}
+        validated, trusted = results[name]["validated"], results[name]["trusted"]
+        speedup = validated["best_ms"] / trusted["best_ms"] if trusted["best_ms"] else 0.0
+        results[name]["speedup"] = round(speedup, 2)
+        print(
+            f"[bench] {name:<10} {args.rows} rows: validated {validated['per_row_us']:.2f} us/row, "
+            f"trusted {trusted['per_row_us']:.2f} us/row ({speedup:.1f}x)"
+        )
+
+    if args.output:
+        write_report({"rows": args.rows, "repeat": args.repeat, "results": results}, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Gunicorn settings picked up automatically when started from backend/.
+
+Values come from ``Settings`` (``WEB_CONCURRENCY`` and ``GUNICORN_*`` env
+vars or ``.env``); command-line flags still override them. The app is
+preloaded in the master and workers are forked from it, so restart with
+``hrmsctl reload`` (USR2, then TERM to the old master) to pick up new code;
+HUP only rotates workers on the already loaded code.
+"""
+
+import contextlib
+import gc
+import os
+import shutil
+import tempfile
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# prometheus_client reads this at import time, so it is set before any worker loads the app.
+prometheus_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "hrms-prometheus"),
+)
+
+
+def usable_cpus() -> int:
+    # Honours CPU affinity (taskset, container cpusets) where the platform exposes it.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = settings.web_concurrency or max(usable_cpus(), 2)
+preload_app = settings.gunicorn_preload
+timeout = settings.gunicorn_timeout
+graceful_timeout = settings.gunicorn_graceful_timeout
+# UvicornWorker passes this on as uvicorn's keep-alive timeout.
+keepalive = settings.gunicorn_keepalive
+max_requests = settings.gunicorn_max_requests
+max_requests_jitter = settings.gunicorn_max_requests_jitter
+if settings.gunicorn_bind:
+    bind = settings.gunicorn_bind
+if settings.gunicorn_pidfile:
+    pidfile = settings.gunicorn_pidfile
+
+
+def boot_dir(cfg, master_pid: int) -> str | None:
+    """Where ``master_pid`` and its workers report boot progress, next to the pidfile.
+
+    ``hrmsctl reload`` waits here for every worker of a USR2-started master
+    before it drains the old one: health checks through the shared socket
+    would also be answered by the old master's workers.
+    """
+    if not cfg.pidfile:
+        return None
+    return os.path.join(f"{cfg.pidfile}.workers", str(master_pid))
+
+
+def on_starting(server) -> None:
+    # A master re-executed by USR2 inherits GUNICORN_FD and shares the directory with the
+    # old master's live workers; only a cold start clears samples from a previous run.
+    if "GUNICORN_FD" not in os.environ:
+        shutil.rmtree(prometheus_dir, ignore_errors=True)
+        if server.cfg.pidfile:
+            shutil.rmtree(f"{server.cfg.pidfile}.workers", ignore_errors=True)
+    os.makedirs(prometheus_dir, exist_ok=True)
+
+
+def when_ready(server) -> None:
+    path = boot_dir(server.cfg, server.pid)
+    if path:
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "expected"), "w", encoding="utf-8") as marker:
+            marker.write(str(server.num_workers))
+
+
+def pre_fork(server, worker) -> None:
+    # Move everything the preloaded app allocated out of the collector's reach, so
+    # collections in the children never touch (and copy) those shared pages.
+    gc.freeze()
+
+
+def post_fork(server, worker) -> None:
+    from app.db.session import engine
+
+    # Connections opened in the master must not be shared across processes.
+    engine.dispose(close=False)
+
+
+def post_worker_init(worker) -> None:
+    path = boot_dir(worker.cfg, worker.ppid)
+    if path:
+        open(os.path.join(path, str(worker.pid)), "w").close()
+
+
+def child_exit(server, worker) -> None:
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+    path = boot_dir(server.cfg, server.pid)
+    if path:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(path, str(worker.pid)))
+
+
+def on_exit(server) -> None:
+    path = boot_dir(server.cfg, server.pid)
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
@@ -1,15 +1,30 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.core.config import get_settings
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.query_stats import QueryStats, track_queries
+from app.api.dependencies import (
+    get_async_attendance_service,
+    get_async_employee_service,
+    get_async_readiness_service,
+    get_attendance_service,
+    get_employee_service,
+    get_readiness_service,
+)
+from app.db.session import get_async_db, get_db
 from app.main import app
+from app.services.employee_service import employee_existence_cache
+from app.services.readiness_service import readiness_cache
+from app.services.stats_service import overview_cache
 
 
 @pytest.fixture()
@@ -30,6 +45,14 @@ def db_session() -> Generator[Session, None, None]:
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches() -> Generator[None, None, None]:
+    yield
+    overview_cache.clear()
+    employee_existence_cache.clear()
+    readiness_cache.clear()
+
+
 @pytest.fixture()
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     def override_get_db() -> Generator[Session, None, None]:
@@ -57,3 +80,52 @@ def public_client(db_session: Session) -> Generator[TestClient, None, None]:
         yield test_client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def async_client(tmp_path: Path) -> Generator[TestClient, None, None]:
+    """Client whose routers run on the async session stack over aiosqlite."""
+    database = tmp_path / "hrms.sqlite3"
+    sync_engine = create_engine(f"sqlite:///{database}")
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    # NullPool keeps aiosqlite connections from outliving the client's event loop.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database}", poolclass=NullPool)
+    TestingAsyncSession = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSession() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_employee_service] = get_async_employee_service
+    app.dependency_overrides[get_attendance_service] = get_async_attendance_service
+    app.dependency_overrides[get_readiness_service] = get_async_readiness_service
+
+    with TestClient(
+        app,
+        headers={"X-Superadmin-Key": get_settings().superadmin_key},
+    ) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def query_budget() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """Fail the test when the enclosed requests run more than ``max_queries`` statements.
+
+    Usage: ``with query_budget(3): client.get(...)``. Counts come from the
+    production counter: TestClient runs the app in a copy of the caller's
+    context, so each request's tracking scope nests under this one, and
+    streamed response bodies are included.
+    """
+
+    @contextmanager
+    def budget(max_queries: int) -> Generator[QueryStats, None, None]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, f"{stats.count} queries exceed the budget of {max_queries}"
+
+    return budget
@@ -0,0 +1,95 @@
+import csv
+import io
+
+
+def create_employee(client, employee_id: str, department: str = "Engineering") -> None:
+    response = client.post(
+        "/api/employees",
+        json={
+            "employee_id": employee_id,
+            "full_name": "John Doe",
+            "email": f"{employee_id.lower()}@company.com",
+            "department": department,
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_async_employee_crud_and_paging(async_client) -> None:
+    for index in range(3):
+        create_employee(async_client, f"EMP00{index}")
+
+    duplicate = async_client.post(
+        "/api/employees",
+        json={"employee_id": "EMP000", "full_name": "Jane", "email": "jane@company.com", "department": "Sales"},
+    )
+    assert duplicate.status_code == 409
+
+    first_page = async_client.get("/api/employees?limit=2")
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = async_client.get(f"/api/employees?limit=2&cursor={cursor}&fields=employee_id")
+    assert second_page.json() == [{"employee_id": "EMP000"}]
+
+    assert async_client.delete("/api/employees/EMP000").status_code == 200
+    assert async_client.delete("/api/employees/EMP000").status_code == 404
+
+
+def test_async_attendance_flow_keeps_rollup_in_step(async_client) -> None:
+    create_employee(async_client, "EMP001")
+
+    created = async_client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+    )
+    assert created.status_code == 201
+    updated = async_client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP001", "date": "2026-02-25", "status": "ABSENT"},
+    )
+    assert updated.status_code == 200
+    missing = async_client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP404", "date": "2026-02-25", "status": "ABSENT"},
+    )
+    assert missing.status_code == 404
+
+    bulk = async_client.post(
+        "/api/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": "EMP001", "date": "2026-02-26", "status": "PRESENT"},
+                {"employee_id": "EMP404", "date": "2026-02-26", "status": "PRESENT"},
+            ]
+        },
+    )
+    assert (bulk.json()["created"], bulk.json()["rejected"]) == (1, 1)
+
+    summary = async_client.get("/api/attendance/EMP001?month=2026-02&limit=1").json()
+    assert (summary["total_records"], summary["total_present"]) == (2, 1)
+    assert [record["date"] for record in summary["records"]] == ["2026-02-26"]
+    assert summary["next_cursor"] is not None
+
+
+def test_async_export_streams_csv(async_client) -> None:
+    create_employee(async_client, "EMP001")
+    async_client.post("/api/attendance", json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"})
+
+    response = async_client.get("/api/attendance/export?from=2026-02-01&to=2026-02-28&format=csv")
+
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id", "employee_id", "date", "status", "created_at"]
+    assert rows[1][1:4] == ["EMP001", "2026-02-25", "PRESENT"]
+
+
+def test_async_ready_probes_async_pool(async_client) -> None:
+    response = async_client.get("/ready")
+
+    # create_all leaves no alembic_version row, so only the connection check passes.
+    assert response.status_code == 503
+    checks = response.json()["checks"]
+    assert checks["database"]["ok"] is True
+    assert checks["migrations"]["ok"] is False
@@ -1,5 +1,15 @@
+import csv
+import io
+import json
 from datetime import date
 
+from sqlalchemy import select
+
+from app.models.attendance_rollup import AttendanceMonthlyRollup
+from app.repositories.attendance_rollup_repository import AttendanceRollupRepository
+from app.services.employee_service import employee_existence_cache
+from app.utils.etag import weak_etag
+
 
 def create_employee(client, employee_id: str = "EMP001", email: str = "john@company.com") -> None:
     response = client.post(
@@ -149,3 +159,302 @@ def test_get_attendance_with_invalid_month_filter(client) -> None:
     response = client.get("/api/attendance/EMP001?month=2026/02")
     assert response.status_code == 400
     assert response.json()["message"] == "Invalid month format. Use YYYY-MM"
+
+
+def test_mark_attendance_bulk_creates_updates_and_rejects(client) -> None:
+    create_employee(client)
+    create_employee(client, employee_id="EMP002", email="jane@company.com")
+    client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+    )
+
+    response = client.post(
+        "/api/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": "EMP001", "date": "2026-02-25", "status": "ABSENT"},
+                {"employee_id": "EMP002", "date": "2026-02-25", "status": "PRESENT"},
+                {"employee_id": "EMP404", "date": "2026-02-25", "status": "PRESENT"},
+                {"employee_id": "EMP002", "date": "2026-02-26", "status": "ABSENT"},
+                {"employee_id": "EMP002", "date": "2026-02-26", "status": "PRESENT"},
+            ]
+        },
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert (data["created"], data["updated"], data["rejected"]) == (2, 1, 2)
+    assert [row["outcome"] for row in data["results"]] == [
+        "updated",
+        "created",
+        "rejected",
+        "rejected",
+        "created",
+    ]
+    assert data["results"][2]["message"] == "Employee not found"
+
+    summary = client.get("/api/attendance/EMP002").json()
+    assert summary["total_records"] == 2
+    assert summary["total_present"] == 2
+
+    assert client.get("/api/attendance/EMP001").json()["total_present"] == 0
+
+
+def test_mark_attendance_bulk_rejects_employee_deleted_behind_the_cache(client) -> None:
+    create_employee(client)
+    # Another worker deleted EMP009 after this worker cached it as existing.
+    employee_existence_cache.add("EMP009")
+
+    response = client.post(
+        "/api/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+                {"employee_id": "EMP009", "date": "2026-02-25", "status": "PRESENT"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["rejected"]) == (1, 1)
+    assert data["results"][1]["message"] == "Employee not found"
+
+
+def test_mark_attendance_bulk_requires_records(client) -> None:
+    response = client.post("/api/attendance/bulk", json={"records": []})
+
+    assert response.status_code == 422
+
+
+def test_get_attendance_with_date_outside_month_filter_is_empty(client) -> None:
+    create_employee(client)
+    client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+    )
+
+    response = client.get("/api/attendance/EMP001?month=2026-01&date=2026-02-25")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total_records"] == 0
+    assert data["total_present"] == 0
+    assert data["records"] == []
+
+
+def test_get_attendance_keyset_pagination(client) -> None:
+    create_employee(client)
+    for day in range(1, 6):
+        client.post(
+            "/api/attendance",
+            json={"employee_id": "EMP001", "date": f"2026-02-0{day}", "status": "PRESENT" if day % 2 else "ABSENT"},
+        )
+
+    first = client.get("/api/attendance/EMP001?limit=2").json()
+    assert [record["date"] for record in first["records"]] == ["2026-02-05", "2026-02-04"]
+    assert (first["total_records"], first["total_present"]) == (5, 3)
+    assert first["prev_cursor"] is None
+
+    second = client.get(f"/api/attendance/EMP001?limit=2&before={first['next_cursor']}").json()
+    assert [record["date"] for record in second["records"]] == ["2026-02-03", "2026-02-02"]
+    assert second["total_records"] == 5
+
+    last = client.get(f"/api/attendance/EMP001?limit=2&before={second['next_cursor']}").json()
+    assert [record["date"] for record in last["records"]] == ["2026-02-01"]
+    assert last["next_cursor"] is None
+
+    back = client.get(f"/api/attendance/EMP001?limit=2&after={second['prev_cursor']}").json()
+    assert [record["date"] for record in back["records"]] == ["2026-02-05", "2026-02-04"]
+    assert back["prev_cursor"] is None
+    assert back["next_cursor"] is not None
+
+
+def test_get_attendance_without_limit_returns_full_history(client) -> None:
+    create_employee(client)
+    client.post(
+        "/api/attendance",
+        json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+    )
+
+    data = client.get("/api/attendance/EMP001").json()
+    assert len(data["records"]) == 1
+    assert data["next_cursor"] is None
+    assert data["prev_cursor"] is None
+
+
+def test_get_attendance_rejects_before_and_after_together(client) -> None:
+    create_employee(client)
+
+    response = client.get("/api/attendance/EMP001?before=abc&after=abc")
+    assert response.status_code == 400
+
+
+def seed_export_data(client) -> None:
+    create_employee(client)
+    response = client.post(
+        "/api/employees",
+        json={
+            "employee_id": "EMP002",
+            "full_name": "Jane Roe",
+            "email": "jane@company.com",
+            "department": "Sales",
+        },
+    )
+    assert response.status_code == 201
+    client.post(
+        "/api/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": "EMP001", "date": "2026-02-01", "status": "PRESENT"},
+                {"employee_id": "EMP002", "date": "2026-02-01", "status": "ABSENT"},
+                {"employee_id": "EMP001", "date": "2026-02-28", "status": "ABSENT"},
+                {"employee_id": "EMP001", "date": "2026-03-01", "status": "PRESENT"},
+            ]
+        },
+    )
+
+
+def test_export_attendance_ndjson(client) -> None:
+    seed_export_data(client)
+
+    response = client.get("/api/attendance/export?from=2026-02-01&to=2026-02-28")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["employee_id"], row["date"], row["status"]) for row in rows] == [
+        ("EMP001", "2026-02-01", "PRESENT"),
+        ("EMP002", "2026-02-01", "ABSENT"),
+        ("EMP001", "2026-02-28", "ABSENT"),
+    ]
+
+
+def test_export_attendance_csv_with_department_filter(client) -> None:
+    seed_export_data(client)
+
+    response = client.get("/api/attendance/export?from=2026-02-01&to=2026-03-31&format=csv&department=Engineering")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["employee_id"], row["date"]) for row in rows] == [
+        ("EMP001", "2026-02-01"),
+        ("EMP001", "2026-02-28"),
+        ("EMP001", "2026-03-01"),
+    ]
+
+
+def test_export_attendance_rejects_inverted_range(client) -> None:
+    response = client.get("/api/attendance/export?from=2026-03-01&to=2026-02-01")
+
+    assert response.status_code == 400
+
+
+def test_monthly_rollup_tracks_inserts_flips_and_no_op_marks(client, db_session) -> None:
+    create_employee(client)
+    for payload in (
+        {"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"},
+        {"employee_id": "EMP001", "date": "2026-02-25", "status": "ABSENT"},
+        {"employee_id": "EMP001", "date": "2026-02-25", "status": "ABSENT"},
+        {"employee_id": "EMP001", "date": "2026-02-26", "status": "PRESENT"},
+        {"employee_id": "EMP001", "date": "2026-03-02", "status": "PRESENT"},
+    ):
+        client.post("/api/attendance", json=payload)
+
+    rollup = {
+        (row.month.isoformat(), row.present_count, row.absent_count)
+        for row in db_session.scalars(select(AttendanceMonthlyRollup))
+    }
+    assert rollup == {("2026-02-01", 1, 1), ("2026-03-01", 1, 0)}
+
+    february = client.get("/api/attendance/EMP001?month=2026-02").json()
+    assert (february["total_records"], february["total_present"]) == (2, 1)
+
+    overall = client.get("/api/attendance/EMP001").json()
+    assert (overall["total_records"], overall["total_present"]) == (3, 2)
+
+
+def test_monthly_rollup_rebuild_matches_incremental_counters(client, db_session) -> None:
+    create_employee(client)
+    client.post(
+        "/api/attendance/bulk",
+        json={
+            "records": [
+                {"employee_id": "EMP001", "date": "2026-01-31", "status": "ABSENT"},
+                {"employee_id": "EMP001", "date": "2026-02-01", "status": "PRESENT"},
+                {"employee_id": "EMP001", "date": "2026-02-02", "status": "PRESENT"},
+            ]
+        },
+    )
+
+    def snapshot() -> set[tuple]:
+        return {
+            (row.employee_id, row.month, row.present_count, row.absent_count)
+            for row in db_session.scalars(select(AttendanceMonthlyRollup))
+        }
+
+    incremental = snapshot()
+    assert AttendanceRollupRepository(db_session).rebuild() == 2
+    db_session.commit()
+    db_session.expire_all()
+
+    assert snapshot() == incremental
+
+
+def test_attendance_reads_follow_employee_create_and_delete(client) -> None:
+    assert client.get("/api/attendance/EMP001").status_code == 404
+
+    create_employee(client)
+    assert client.get("/api/attendance/EMP001").status_code == 200
+
+    assert client.delete("/api/employees/EMP001").status_code == 200
+    assert client.get("/api/attendance/EMP001").status_code == 404
+
+
+def test_get_attendance_conditional_get(client) -> None:
+    create_employee(client)
+    payload = {"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"}
+    client.post("/api/attendance", json=payload)
+
+    etag = client.get("/api/attendance/EMP001").headers["ETag"]
+    assert client.get("/api/attendance/EMP001", headers={"If-None-Match": etag}).status_code == 304
+
+    # A status flip changes neither row count nor ids, but still invalidates the tag.
+    client.post("/api/attendance", json={**payload, "status": "ABSENT"})
+    refreshed = client.get("/api/attendance/EMP001", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["total_present"] == 0
+    assert refreshed.headers["ETag"] != etag
+
+
+def test_get_attendance_conditional_get_for_unknown_employee_is_not_found(client) -> None:
+    # "*" and the tag a never-written version 0 would carry must not match a missing employee.
+    for tag in ("*", weak_etag("attendance", "EMP404", 0, "")):
+        assert client.get("/api/attendance/EMP404", headers={"If-None-Match": tag}).status_code == 404
+
+
+def test_attendance_endpoints_stay_within_query_budget(client, query_budget) -> None:
+    create_employee(client)
+    create_employee(client, "EMP002", "jane@company.com")
+
+    with query_budget(4):
+        client.post("/api/attendance", json={"employee_id": "EMP001", "date": "2026-02-25", "status": "PRESENT"})
+
+    # The bulk path must not grow with the number of rows or employees.
+    records = [
+        {"employee_id": employee_id, "date": f"2026-02-{day:02d}", "status": "ABSENT"}
+        for employee_id in ("EMP001", "EMP002")
+        for day in range(1, 21)
+    ]
+    # One IN query confirms every employee; writes never trust the existence cache.
+    with query_budget(5):
+        client.post("/api/attendance/bulk", json={"records": records})
+
+    with query_budget(4):
+        client.get("/api/attendance/EMP002?limit=5")
+    with query_budget(3):
+        client.get("/api/attendance/EMP002?month=2026-02&limit=5")
+    with query_budget(1):
+        client.get("/api/attendance/export?from=2026-02-01&to=2026-02-28")
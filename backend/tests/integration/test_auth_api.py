@@ -23,3 +23,29 @@ def test_protected_endpoint_requires_key(public_client) -> None:
 
     assert response.status_code == 401
     assert response.json()["message"] == "Missing superadmin key"
+
+
+def test_debug_pool_requires_key(public_client) -> None:
+    response = public_client.get("/debug/pool")
+
+    assert response.status_code == 401
+
+
+def test_debug_pool_reports_sync_engine(client) -> None:
+    response = client.get("/debug/pool")
+
+    assert response.status_code == 200
+    pools = response.json()["pools"]
+    assert pools[0]["name"] == "sync"
+    assert {"checked_out", "idle", "overflow", "wait_seconds_total"} <= set(pools[0])
+
+
+def test_metrics_use_route_templates_and_count_queries(client) -> None:
+    client.get("/api/attendance/EMP404")
+
+    body = client.get("/metrics").text
+
+    assert 'hrms_http_requests_total{method="GET",route="/api/attendance/{employee_id}",status="404"}' in body
+    assert "EMP404" not in body
+    assert 'hrms_http_request_db_queries_count{method="GET",route="/api/attendance/{employee_id}"}' in body
+    assert 'hrms_http_requests_in_flight{method="GET",route="/metrics"} 1.0' in body
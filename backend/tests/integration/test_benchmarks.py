@@ -0,0 +1,29 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.synthetic import DatasetSpec, load_dataset
+from benchmarks.scenarios import run_scenarios
+
+
+def test_benchmark_scenarios_run_against_seeded_data(client: TestClient, db_session: Session) -> None:
+    spec = DatasetSpec(employees=8, days=31, end=date(2026, 1, 31), seed=3)
+    counts = load_dataset(db_session, spec)
+    db_session.commit()
+
+    results = run_scenarios(client, spec, requests=5, warmup=1)
+
+    assert counts["employees"] == 8
+    assert counts["attendance"] == 8 * len(spec.attendance_dates())
+    assert list(results) == [
+        "list_employees",
+        "get_attendance",
+        "get_attendance_month",
+        "mark_attendance",
+        "delete_employee",
+    ]
+    assert all(figures["errors"] == 0 for figures in results.values())
+    # Deletes are capped by the employees reserved for them (upper half, one used by warmup).
+    assert results["delete_employee"]["requests"] == 3
+    assert results["get_attendance"]["requests"] == 5
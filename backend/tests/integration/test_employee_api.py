@@ -68,3 +68,151 @@ def test_create_employee_validation_error_422(client) -> None:
 
     assert response.status_code == 422
     assert response.json()["message"] == "Validation error"
+
+
+def create_employees(client, count: int) -> None:
+    for index in range(1, count + 1):
+        response = client.post(
+            "/api/employees",
+            json={
+                "employee_id": f"EMP{index:03d}",
+                "full_name": f"Employee {index}",
+                "email": f"employee{index}@company.com",
+                "department": "Engineering",
+            },
+        )
+        assert response.status_code == 201
+
+
+def test_list_employees_keyset_pagination(client) -> None:
+    create_employees(client, 5)
+
+    first = client.get("/api/employees?limit=2")
+    assert first.status_code == 200
+    assert [row["employee_id"] for row in first.json()] == ["EMP005", "EMP004"]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(f"/api/employees?limit=2&cursor={cursor}")
+    assert [row["employee_id"] for row in second.json()] == ["EMP003", "EMP002"]
+
+    third = client.get(f"/api/employees?limit=2&cursor={second.headers['X-Next-Cursor']}")
+    assert [row["employee_id"] for row in third.json()] == ["EMP001"]
+    assert "X-Next-Cursor" not in third.headers
+
+
+def test_list_employees_sparse_fields(client) -> None:
+    create_employees(client, 2)
+
+    response = client.get("/api/employees?fields=employee_id,department&limit=1")
+    assert response.status_code == 200
+    assert response.json() == [{"employee_id": "EMP002", "department": "Engineering"}]
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_list_employees_rejects_unknown_fields_and_bad_cursor(client) -> None:
+    unknown = client.get("/api/employees?fields=employee_id,salary")
+    assert unknown.status_code == 400
+    assert unknown.json()["details"] == {"fields": ["salary"]}
+
+    bad_cursor = client.get("/api/employees?cursor=not-a-cursor")
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json()["message"] == "Invalid cursor"
+
+
+def test_list_employees_conditional_get(client) -> None:
+    first = client.get("/api/employees")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/api/employees", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    other_shape = client.get("/api/employees?fields=employee_id", headers={"If-None-Match": etag})
+    assert other_shape.status_code == 200
+
+    client.post(
+        "/api/employees",
+        json={"employee_id": "EMP001", "full_name": "John Doe", "email": "john@company.com", "department": "Sales"},
+    )
+    changed = client.get("/api/employees", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 1
+
+
+def test_import_employees_reports_rejected_rows(client) -> None:
+    client.post(
+        "/api/employees",
+        json={"employee_id": "EMP001", "full_name": "John Doe", "email": "john@company.com", "department": "Sales"},
+    )
+    body = "\n".join(
+        [
+            "employee_id,full_name,email,department",
+            "EMP002,Jane Roe,jane@company.com,Engineering",
+            "EMP003,Bad Email,not-an-email,Engineering",
+            "EMP002,Jane Again,jane2@company.com,Engineering",
+            "EMP001,John Clash,other@company.com,Sales",
+            '"EMP004","Smith, Ann",ann@company.com,Finance',
+        ]
+    )
+
+    response = client.post("/api/employees/import", content=body, headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["rejected"]) == (2, 3)
+    assert [(error["row"], error["employee_id"]) for error in data["errors"]] == [
+        (2, "EMP003"),
+        (3, "EMP002"),
+        (4, "EMP001"),
+    ]
+    assert data["errors"][0]["message"].startswith("email:")
+
+    employees = {employee["employee_id"]: employee for employee in client.get("/api/employees").json()}
+    assert set(employees) == {"EMP001", "EMP002", "EMP004"}
+    assert employees["EMP004"]["full_name"] == "Smith, Ann"
+    assert client.get("/api/attendance/EMP004").status_code == 200
+
+
+def test_import_employees_requires_header_columns(client) -> None:
+    response = client.post("/api/employees/import", content="employee_id,email\nEMP1,a@b.com\n")
+
+    assert response.status_code == 400
+    assert response.json()["details"]["columns"] == ["department", "full_name"]
+
+
+def test_employee_endpoints_stay_within_query_budget(client, query_budget) -> None:
+    for index in range(3):
+        with query_budget(4):
+            client.post(
+                "/api/employees",
+                json={
+                    "employee_id": f"EMP00{index}",
+                    "full_name": "John Doe",
+                    "email": f"emp{index}@company.com",
+                    "department": "Engineering",
+                },
+            )
+
+    with query_budget(2):
+        listing = client.get("/api/employees?limit=2")
+    with query_budget(1):
+        not_modified = client.get("/api/employees?limit=2", headers={"If-None-Match": listing.headers["ETag"]})
+    with query_budget(3):
+        client.delete("/api/employees/EMP000")
+
+    assert not_modified.status_code == 304
+    assert listing.headers["X-DB-Query-Count"] == "2"
+
+
+def test_query_count_header_reports_the_request_statements(client) -> None:
+    create_employees(client, 3)
+
+    listing = client.get("/api/employees?limit=2")
+    not_modified = client.get("/api/employees?limit=2", headers={"If-None-Match": listing.headers["ETag"]})
+
+    # The version lookup and the page select; a matching ETag stops after the version.
+    assert listing.headers["X-DB-Query-Count"] == "2"
+    assert not_modified.headers["X-DB-Query-Count"] == "1"
+    assert float(listing.headers["X-DB-Query-Time-Ms"]) >= 0
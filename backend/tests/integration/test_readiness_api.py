@@ -0,0 +1,44 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.readiness_service import expected_heads, readiness_cache
+
+
+def stamp_head(db_session: Session) -> None:
+    # What `alembic stamp head` writes; the test schema comes from create_all.
+    db_session.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY)"))
+    for head in expected_heads():
+        db_session.execute(text("INSERT INTO alembic_version (version_num) VALUES (:head)"), {"head": head})
+    db_session.commit()
+
+
+def test_ready_reports_unmigrated_database(public_client) -> None:
+    response = public_client.get("/ready")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "not_ready"
+    assert body["checks"]["database"]["ok"] is True
+    assert body["checks"]["migrations"]["ok"] is False
+    assert "no revision" in body["checks"]["migrations"]["detail"]
+
+
+def test_ready_once_schema_is_at_head(public_client, db_session: Session) -> None:
+    stamp_head(db_session)
+
+    response = public_client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert set(body["checks"]) == {"database", "migrations"}
+    assert all(check["latency_ms"] >= 0 for check in body["checks"].values())
+
+
+def test_ready_serves_cached_probe(public_client, db_session: Session) -> None:
+    first = public_client.get("/ready")
+    stamp_head(db_session)
+
+    assert public_client.get("/ready").json() == first.json()
+    readiness_cache.clear()
+    assert public_client.get("/ready").status_code == 200
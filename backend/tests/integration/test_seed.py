@@ -0,0 +1,38 @@
+from datetime import date
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.synthetic import DatasetSpec, generate_attendance, seed_database
+from app.models import Attendance, AttendanceMonthlyRollup, Employee, ResourceVersion
+
+
+def test_seed_database_loads_rows_rollup_and_versions(tmp_path) -> None:
+    database_url = f"sqlite:///{tmp_path / 'seed.sqlite3'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    spec = DatasetSpec(employees=7, days=40, end=date(2026, 2, 28), absence_rate=0.2, seed=5)
+
+    result = seed_database(database_url, spec, workers=2, batch_size=16)
+
+    expected = [(row["employee_id"], row["date"], row["status"]) for row in generate_attendance(spec)]
+    with Session(engine) as db:
+        stored = db.execute(
+            select(Attendance.employee_id, Attendance.date, Attendance.status).order_by(
+                Attendance.employee_id, Attendance.date
+            )
+        ).all()
+        absent = db.scalar(select(func.sum(AttendanceMonthlyRollup.absent_count)))
+        versions = db.scalar(select(func.count()).select_from(ResourceVersion))
+        employees = db.scalar(select(func.count()).select_from(Employee))
+    engine.dispose()
+
+    assert (result["employees"], result["attendance"]) == (7, len(expected))
+    # SQLite keeps a plain attendance table.
+    assert result["attendance_partitions"] == 0
+    assert [tuple(row) for row in stored] == expected
+    assert absent == sum(1 for _, _, status in expected if status.name == "ABSENT")
+    assert employees == 7
+    # The employee list scope plus one attendance scope per seeded employee.
+    assert versions == 8
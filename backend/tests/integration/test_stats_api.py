@@ -0,0 +1,45 @@
+from datetime import date
+
+
+def create_employee(client, employee_id: str, email: str, department: str) -> None:
+    response = client.post(
+        "/api/employees",
+        json={
+            "employee_id": employee_id,
+            "full_name": "John Doe",
+            "email": email,
+            "department": department,
+        },
+    )
+    assert response.status_code == 201
+
+
+def test_stats_overview_counts(client) -> None:
+    create_employee(client, "EMP001", "john@company.com", "Engineering")
+    create_employee(client, "EMP002", "jane@company.com", "Engineering")
+    create_employee(client, "EMP003", "ana@company.com", "Sales")
+
+    today = date.today().isoformat()
+    client.post("/api/attendance", json={"employee_id": "EMP001", "date": today, "status": "PRESENT"})
+    client.post("/api/attendance", json={"employee_id": "EMP003", "date": today, "status": "ABSENT"})
+    client.post("/api/attendance", json={"employee_id": "EMP002", "date": "2026-01-01", "status": "PRESENT"})
+
+    response = client.get("/api/stats/overview")
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_employees": 3,
+        "departments": [
+            {"department": "Engineering", "headcount": 2},
+            {"department": "Sales", "headcount": 1},
+        ],
+        "date": today,
+        "present_today": 1,
+        "absent_today": 1,
+        "unmarked_today": 1,
+    }
+
+
+def test_stats_overview_requires_key(public_client) -> None:
+    response = public_client.get("/api/stats/overview")
+
+    assert response.status_code == 401
@@ -4,25 +4,40 @@ from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import BadRequestException, NotFoundException
 from app.models.attendance import AttendanceStatus
-from app.schemas.attendance import AttendanceCreate
+from app.schemas.attendance import AttendanceBulkCreate, AttendanceBulkOutcome, AttendanceCreate
 from app.services.attendance_service import AttendanceService
+from app.utils.cache import ExistenceCache
+
+
+def build_record(record_id: int, status: AttendanceStatus) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=record_id,
+        employee_id="EMP1",
+        date=date(2026, 2, 25),
+        status=status,
+        created_at=datetime(2026, 2, 25, 10, 0, 0),
+    )
 
 
 def test_mark_attendance_employee_not_found() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
-    employee_repo.get_by_employee_id.return_value = None
+    rollup_repo = Mock()
+    attendance_repo.upsert.side_effect = IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed"))
 
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
     payload = AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT)
 
     with pytest.raises(NotFoundException):
         service.mark_attendance(payload)
 
+    db.rollback.assert_called_once()
+    rollup_repo.apply_changes.assert_not_called()
     db.commit.assert_not_called()
 
 
@@ -30,20 +45,21 @@ def test_mark_attendance_duplicate_same_date_updates_record() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
+    rollup_repo = Mock()
+    attendance_repo.upsert.return_value = (build_record(1, AttendanceStatus.ABSENT), AttendanceStatus.PRESENT)
 
-    employee_repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP1")
-    existing = SimpleNamespace(id=1, employee_id="EMP1", status=AttendanceStatus.PRESENT)
-    attendance_repo.find_by_employee_and_date.return_value = existing
-    attendance_repo.update_status.return_value = existing
-
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
     payload = AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.ABSENT)
 
     result, created = service.mark_attendance(payload)
 
     assert created is False
     assert result.id == 1
-    attendance_repo.update_status.assert_called_once_with(existing, AttendanceStatus.ABSENT)
+    assert result.status == AttendanceStatus.ABSENT
+    attendance_repo.upsert.assert_called_once_with(payload.model_dump())
+    rollup_repo.apply_changes.assert_called_once_with(
+        [("EMP1", date(2026, 2, 25), AttendanceStatus.PRESENT, AttendanceStatus.ABSENT)]
+    )
     db.commit.assert_called_once()
 
 
@@ -51,18 +67,17 @@ def test_mark_attendance_success() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
+    rollup_repo = Mock()
+    attendance_repo.upsert.return_value = (build_record(11, AttendanceStatus.PRESENT), None)
 
-    employee_repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP1")
-    attendance_repo.find_by_employee_and_date.return_value = None
-    attendance_repo.create.return_value = SimpleNamespace(id=11, employee_id="EMP1")
-
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
     payload = AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT)
 
     result, created = service.mark_attendance(payload)
 
     assert created is True
     assert result.id == 11
+    employee_repo.get_by_employee_id.assert_not_called()
     db.commit.assert_called_once()
 
 
@@ -70,9 +85,10 @@ def test_get_employee_attendance_with_date_filter() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
+    rollup_repo = Mock()
 
-    employee_repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP1")
-    attendance_repo.get_by_employee.return_value = [
+    employee_repo.exists.return_value = True
+    attendance_repo.read_by_employee.return_value = [
         SimpleNamespace(
             id=1,
             employee_id="EMP1",
@@ -80,43 +96,64 @@ def test_get_employee_attendance_with_date_filter() -> None:
             status=AttendanceStatus.PRESENT,
             created_at=datetime(2026, 2, 25, 10, 0, 0),
         ),
-        SimpleNamespace(
-            id=2,
-            employee_id="EMP1",
-            date=date(2026, 2, 24),
-            status=AttendanceStatus.ABSENT,
-            created_at=datetime(2026, 2, 24, 10, 0, 0),
-        ),
     ]
-    attendance_repo.count_present_days.return_value = 1
+    attendance_repo.summarize.return_value = (1, 1)
 
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
     summary = service.get_employee_attendance("EMP1", date(2026, 2, 25))
 
     assert summary.total_records == 1
     assert summary.total_present == 1
     assert summary.employee_id == "EMP1"
+    attendance_repo.read_by_employee.assert_called_once_with(
+        "EMP1", date(2026, 2, 25), date(2026, 2, 26), limit=None, before=None, after=None
+    )
+    attendance_repo.summarize.assert_called_once_with("EMP1", date(2026, 2, 25), date(2026, 2, 26))
 
 
 def test_get_employee_attendance_not_found() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
-    employee_repo.get_by_employee_id.return_value = None
+    rollup_repo = Mock()
+
+    employee_repo.exists.return_value = False
 
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo, ExistenceCache(8, 60, 2))
 
     with pytest.raises(NotFoundException):
         service.get_employee_attendance("UNKNOWN")
+    with pytest.raises(NotFoundException):
+        service.get_employee_attendance("UNKNOWN")
+    # The absence is confirmed once, then served from the short negative cache.
+    employee_repo.exists.assert_called_once_with("UNKNOWN")
+
+
+def test_get_employee_attendance_caches_employee_existence() -> None:
+    db = Mock()
+    attendance_repo = Mock()
+    employee_repo = Mock()
+    rollup_repo = Mock()
+    employee_repo.exists.return_value = True
+    attendance_repo.read_by_employee.return_value = []
+    rollup_repo.summarize.return_value = (0, 0)
+
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo, ExistenceCache(8, 60, 2))
+    service.get_employee_attendance("EMP1")
+    service.get_employee_attendance("EMP1")
+
+    employee_repo.exists.assert_called_once_with("EMP1")
+    employee_repo.get_by_employee_id.assert_not_called()
 
 
 def test_get_employee_attendance_with_month_filter() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
+    rollup_repo = Mock()
 
-    employee_repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP1")
-    attendance_repo.get_by_employee.return_value = [
+    employee_repo.exists.return_value = True
+    attendance_repo.read_by_employee.return_value = [
         SimpleNamespace(
             id=1,
             employee_id="EMP1",
@@ -131,32 +168,128 @@ def test_get_employee_attendance_with_month_filter() -> None:
             status=AttendanceStatus.ABSENT,
             created_at=datetime(2026, 2, 24, 10, 0, 0),
         ),
-        SimpleNamespace(
-            id=3,
-            employee_id="EMP1",
-            date=date(2026, 1, 30),
-            status=AttendanceStatus.PRESENT,
-            created_at=datetime(2026, 1, 30, 10, 0, 0),
-        ),
     ]
+    rollup_repo.summarize.return_value = (2, 1)
 
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
     summary = service.get_employee_attendance("EMP1", for_month="2026-02")
 
     assert summary.total_records == 2
     assert summary.total_present == 1
     assert summary.records[0].date == date(2026, 2, 25)
+    attendance_repo.read_by_employee.assert_called_once_with(
+        "EMP1", date(2026, 2, 1), date(2026, 3, 1), limit=None, before=None, after=None
+    )
+
+
+def test_get_employee_attendance_with_december_month_filter() -> None:
+    db = Mock()
+    attendance_repo = Mock()
+    employee_repo = Mock()
+    rollup_repo = Mock()
+
+    employee_repo.exists.return_value = True
+    attendance_repo.read_by_employee.return_value = []
+    rollup_repo.summarize.return_value = (0, 0)
+
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
+    service.get_employee_attendance("EMP1", for_month="2025-12")
+
+    attendance_repo.read_by_employee.assert_called_once_with(
+        "EMP1", date(2025, 12, 1), date(2026, 1, 1), limit=None, before=None, after=None
+    )
+    rollup_repo.summarize.assert_called_once_with("EMP1", date(2025, 12, 1))
+    attendance_repo.summarize.assert_not_called()
 
 
 def test_get_employee_attendance_with_invalid_month_filter() -> None:
     db = Mock()
     attendance_repo = Mock()
     employee_repo = Mock()
+    rollup_repo = Mock()
 
-    employee_repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP1")
-    attendance_repo.get_by_employee.return_value = []
+    employee_repo.exists.return_value = True
+    attendance_repo.read_by_employee.return_value = []
 
-    service = AttendanceService(db, attendance_repo, employee_repo)
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
 
     with pytest.raises(BadRequestException):
         service.get_employee_attendance("EMP1", for_month="2026/02")
+
+
+def test_mark_attendance_bulk_uses_batch_repository_methods() -> None:
+    db = Mock()
+    attendance_repo = Mock()
+    employee_repo = Mock()
+    rollup_repo = Mock()
+
+    employee_repo.get_existing_employee_ids.return_value = {"EMP1"}
+    attendance_repo.upsert_many.return_value = {("EMP1", date(2026, 2, 25)): None}
+
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
+    payload = AttendanceBulkCreate(
+        records=[
+            AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT),
+            AttendanceCreate(employee_id="EMP2", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT),
+        ]
+    )
+
+    result = service.mark_attendance_bulk(payload)
+
+    assert (result.created, result.updated, result.rejected) == (1, 0, 1)
+    assert result.results[1].outcome == AttendanceBulkOutcome.REJECTED
+    employee_repo.get_existing_employee_ids.assert_called_once_with({"EMP1", "EMP2"})
+    attendance_repo.upsert_many.assert_called_once()
+    assert list(rollup_repo.apply_changes.call_args.args[0]) == [
+        ("EMP1", date(2026, 2, 25), None, AttendanceStatus.PRESENT)
+    ]
+    employee_repo.get_by_employee_id.assert_not_called()
+    db.commit.assert_called_once()
+
+
+def test_mark_attendance_bulk_all_rejected_skips_write() -> None:
+    db = Mock()
+    attendance_repo = Mock()
+    employee_repo = Mock()
+    rollup_repo = Mock()
+    employee_repo.get_existing_employee_ids.return_value = set()
+
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo)
+    payload = AttendanceBulkCreate(
+        records=[AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.ABSENT)]
+    )
+
+    result = service.mark_attendance_bulk(payload)
+
+    assert result.rejected == 1
+    attendance_repo.upsert_many.assert_not_called()
+    db.commit.assert_not_called()
+
+
+def test_mark_attendance_bulk_replans_after_concurrent_delete() -> None:
+    db = Mock()
+    attendance_repo = Mock()
+    employee_repo = Mock()
+    rollup_repo = Mock()
+    # EMP2 passes the existence check, then is deleted before the upsert reaches the foreign key.
+    employee_repo.get_existing_employee_ids.side_effect = [{"EMP1", "EMP2"}, {"EMP1"}]
+    attendance_repo.upsert_many.side_effect = [
+        IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed")),
+        {("EMP1", date(2026, 2, 25)): None},
+    ]
+    cache = ExistenceCache(8, 60, 2)
+
+    service = AttendanceService(db, attendance_repo, employee_repo, rollup_repo, cache)
+    payload = AttendanceBulkCreate(
+        records=[
+            AttendanceCreate(employee_id="EMP1", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT),
+            AttendanceCreate(employee_id="EMP2", date=date(2026, 2, 25), status=AttendanceStatus.PRESENT),
+        ]
+    )
+
+    result = service.mark_attendance_bulk(payload)
+
+    assert (result.created, result.rejected) == (1, 1)
+    db.rollback.assert_called_once()
+    db.commit.assert_called_once()
+    assert cache.lookup("EMP2") is None
@@ -0,0 +1,36 @@
+from datetime import date
+
+from app.db.synthetic import DatasetSpec, generate_attendance, generate_employees
+from benchmarks.report import compare, percentile, summarize
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([3.0], 0.95) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_compare_flags_slower_latency_and_lower_throughput() -> None:
+    baseline = {"scenarios": {"list": summarize([0.010] * 10, 1.0, 0)}}
+    current = {"scenarios": {"list": summarize([0.020] * 10, 2.0, 0), "new": summarize([0.001], 1.0, 0)}}
+
+    changes, regressions = compare(current, baseline, max_regression=0.1)
+
+    assert [row["scenario"] for row in changes] == ["list"]
+    assert changes[0]["p95_ms"] == 1.0
+    assert changes[0]["throughput_rps"] == -0.5
+    assert len(regressions) == 4
+
+
+def test_synthetic_slices_match_full_generation() -> None:
+    spec = DatasetSpec(employees=6, days=14, end=date(2026, 3, 31), absence_rate=0.3, seed=7)
+
+    full = list(generate_attendance(spec))
+    sliced = list(generate_attendance(spec, 0, 2)) + list(generate_attendance(spec, 2, 6))
+
+    assert sliced == full
+    assert len(full) == 6 * len(spec.attendance_dates()) == 6 * 10
+    assert list(generate_employees(spec, 4)) == list(generate_employees(spec))[4:]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import Mock
 
@@ -6,6 +7,7 @@ import pytest
 from app.core.exceptions import ConflictException, NotFoundException
 from app.schemas.employee import EmployeeCreate
 from app.services.employee_service import EmployeeService
+from app.utils.cache import ExistenceCache
 
 
 def build_payload() -> EmployeeCreate:
@@ -17,6 +19,10 @@ def build_payload() -> EmployeeCreate:
     )
 
 
+def build_employee() -> SimpleNamespace:
+    return SimpleNamespace(id=1, created_at=datetime(2026, 2, 25, 10, 0, 0), **build_payload().model_dump())
+
+
 def test_create_employee_success() -> None:
     db = Mock()
     repo = Mock()
@@ -24,7 +30,7 @@ def test_create_employee_success() -> None:
 
     repo.get_by_employee_id.return_value = None
     repo.get_by_email.return_value = None
-    repo.create.return_value = SimpleNamespace(employee_id="EMP001")
+    repo.create.return_value = build_employee()
 
     service = EmployeeService(db=db, repository=repo)
     result = service.create_employee(payload)
@@ -89,3 +95,29 @@ def test_delete_employee_success() -> None:
 
     repo.delete.assert_called_once_with(employee)
     db.commit.assert_called_once()
+
+
+def test_create_and_delete_keep_existence_cache_consistent() -> None:
+    now = [0.0]
+    cache = ExistenceCache(maxsize=8, ttl_seconds=30, negative_ttl_seconds=2, clock=lambda: now[0])
+    cache.mark_absent("EMP001")
+    assert cache.lookup("EMP001") is False
+
+    db = Mock()
+    repo = Mock()
+    repo.get_by_employee_id.return_value = None
+    repo.get_by_email.return_value = None
+    repo.create.return_value = build_employee()
+    service = EmployeeService(db=db, repository=repo, existence_cache=cache)
+
+    service.create_employee(build_payload())
+    assert cache.lookup("EMP001") is True
+
+    repo.get_by_employee_id.return_value = SimpleNamespace(employee_id="EMP001")
+    service.delete_employee("EMP001")
+    assert cache.lookup("EMP001") is None
+
+    # An absence cached here lapses quickly, so ids created by other workers show up.
+    cache.mark_absent("EMP404")
+    now[0] = 2.5
+    assert cache.lookup("EMP404") is None
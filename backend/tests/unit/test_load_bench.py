@@ -0,0 +1,20 @@
+from datetime import date
+
+import pytest
+
+from benchmarks.load import DEFAULT_MIX, OPERATIONS, parse_mix, recent_months
+
+
+def test_parse_mix_reads_weights() -> None:
+    assert parse_mix("mark_attendance=3, list_employees") == {"mark_attendance": 3.0, "list_employees": 1.0}
+    assert set(parse_mix(DEFAULT_MIX)) == set(OPERATIONS)
+
+
+@pytest.mark.parametrize("raw", ["unknown=1", "list_employees=0", ""])
+def test_parse_mix_rejects_unusable_mixes(raw: str) -> None:
+    with pytest.raises(ValueError):
+        parse_mix(raw)
+
+
+def test_recent_months_crosses_year_boundary() -> None:
+    assert recent_months(date(2026, 2, 14), 3) == ["2026-02", "2026-01", "2025-12"]
@@ -0,0 +1,37 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+
+from app.db.partitions import (
+    add_months,
+    ensure_attendance_partitions,
+    month_start,
+    partition_months,
+    partition_name,
+)
+
+
+def test_month_arithmetic_and_partition_names() -> None:
+    assert month_start(date(2026, 10, 18)) == date(2026, 10, 1)
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2027, 3, 1)) == "attendance_2027_03"
+
+
+def test_partition_months_covers_the_window_and_stranded_months() -> None:
+    stranded = [date(2025, 11, 1), date(2026, 10, 1), date(2026, 2, 1)]
+
+    assert partition_months(date(2026, 10, 18), 2, stranded) == [
+        date(2025, 11, 1),
+        date(2026, 2, 1),
+        date(2026, 10, 1),
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+    ]
+
+
+def test_ensure_partitions_skips_unpartitioned_databases() -> None:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        assert ensure_attendance_partitions(connection, months_ahead=3) == []
+    engine.dispose()
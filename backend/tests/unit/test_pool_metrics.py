@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+
+def test_pool_metrics_track_checkouts_and_timeouts(tmp_path) -> None:
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.sqlite3'}",
+        poolclass=instrumented_pool_class(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    metrics.listen(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        busy = metrics.snapshot(engine.pool)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    idle = metrics.snapshot(engine.pool)
+    engine.dispose()
+
+    assert (busy["checked_out"], busy["idle"], busy["size"]) == (1, 0, 1)
+    assert (idle["checked_out"], idle["idle"], idle["overflow"]) == (0, 1, 0)
+    assert idle["checkouts"] == 1
+    assert idle["connects"] == 1
+    assert idle["timeouts"] == 1
+    assert idle["wait_seconds_max"] >= 0.05
+    assert idle["pool_class"] == "InstrumentedQueuePool"
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.db.query_stats import track_queries
+
+
+def test_track_queries_counts_statements_in_every_enclosing_scope() -> None:
+    engine = create_engine("sqlite://")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as outer:
+            connection.execute(text("SELECT 1"))
+            with track_queries() as inner:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 1"))
+
+    engine.dispose()
+
+    assert (outer.count, inner.count) == (4, 2)
+    assert outer.seconds >= inner.seconds > 0
+
+
+def test_track_queries_skips_failed_statements() -> None:
+    engine = create_engine("sqlite://")
+
+    with engine.connect() as connection, track_queries() as stats:
+        with pytest.raises(exc.OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+        connection.execute(text("SELECT 1"))
+        pending_timers = connection.info.get("query_started_at")
+
+    engine.dispose()
+
+    assert stats.count == 1
+    assert not pending_timers
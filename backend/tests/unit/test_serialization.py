@@ -0,0 +1,51 @@
+import json
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from app.models.attendance import AttendanceStatus
+from app.schemas.attendance import AttendanceRead
+from app.schemas.employee import EmployeeRead
+from app.utils.serialization import AppJSONResponse, trusted_rows
+
+
+def test_trusted_rows_render_like_the_validated_response_model() -> None:
+    rows = [
+        SimpleNamespace(
+            id=1,
+            employee_id="EMP-1",
+            full_name="Asha Rao",
+            email="asha@example.com",
+            department="Engineering",
+            created_at=datetime(2026, 10, 18, 9, 30, 15, 250000, tzinfo=timezone.utc),
+        ),
+        SimpleNamespace(
+            id=2,
+            employee_id="EMP-2",
+            full_name="Ben Ode",
+            email="ben@example.com",
+            department="Support",
+            created_at=datetime(2026, 10, 18, 9, 31),
+        ),
+    ]
+
+    trusted = json.loads(AppJSONResponse(trusted_rows(EmployeeRead, rows)).body)
+    validated = [json.loads(EmployeeRead.model_validate(row).model_dump_json()) for row in rows]
+
+    assert trusted == validated
+    assert trusted[0]["created_at"] == "2026-10-18T09:30:15.250000Z"
+
+
+def test_trusted_rows_serialize_enums_dates_and_sparse_fields() -> None:
+    row = SimpleNamespace(
+        id=7,
+        employee_id="EMP-1",
+        date=date(2026, 10, 1),
+        status=AttendanceStatus.ABSENT,
+        created_at=datetime(2026, 10, 1, 8, 0, tzinfo=timezone.utc),
+    )
+
+    full = json.loads(AppJSONResponse(trusted_rows(AttendanceRead, [row])).body)
+    sparse = trusted_rows(AttendanceRead, [row], ["id", "status"])
+
+    assert full == [json.loads(AttendanceRead.model_validate(row).model_dump_json())]
+    assert sparse == [{"id": 7, "status": AttendanceStatus.ABSENT}]
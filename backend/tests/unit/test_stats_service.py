@@ -0,0 +1,47 @@
+from datetime import date
+from unittest.mock import Mock
+
+from app.models.attendance import AttendanceStatus
+from app.services.stats_service import StatsService
+from app.utils.cache import TTLCache
+
+
+def test_get_overview_builds_from_aggregates() -> None:
+    repo = Mock()
+    repo.headcount_by_department.return_value = [("Engineering", 3), ("Sales", 2)]
+    repo.attendance_counts_on.return_value = {AttendanceStatus.PRESENT: 2, AttendanceStatus.ABSENT: 1}
+
+    service = StatsService(Mock(), repo, TTLCache(maxsize=1, ttl_seconds=60), today=lambda: date(2026, 2, 25))
+    overview = service.get_overview()
+
+    assert overview.total_employees == 5
+    assert (overview.present_today, overview.absent_today, overview.unmarked_today) == (2, 1, 2)
+    repo.attendance_counts_on.assert_called_once_with(date(2026, 2, 25))
+
+
+def test_get_overview_is_cached_within_ttl() -> None:
+    repo = Mock()
+    repo.headcount_by_department.return_value = []
+    repo.attendance_counts_on.return_value = {}
+    cache = TTLCache(maxsize=1, ttl_seconds=60)
+
+    StatsService(Mock(), repo, cache, today=lambda: date(2026, 2, 25)).get_overview()
+    StatsService(Mock(), repo, cache, today=lambda: date(2026, 2, 25)).get_overview()
+
+    repo.headcount_by_department.assert_called_once()
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl_seconds=10, clock=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
@@ -0,0 +1,6 @@
+import apiClient from './client';
+
+export const fetchStatsOverview = async () => {
+  const { data } = await apiClient.get('/stats/overview');
+  return data;
+};
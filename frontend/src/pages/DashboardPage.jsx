@@ -1,20 +1,35 @@
+import PropTypes from 'prop-types';
 import { useEffect, useState } from 'react';
 
-import { fetchEmployees } from '../api/employees';
+import { fetchStatsOverview } from '../api/stats';
 import Alert from '../components/Alert';
 import Loader from '../components/Loader';
 import useAsyncState from '../hooks/useAsyncState';
 
+function StatCard({ label, value }) {
+  return (
+    <div className="rounded-lg border border-slate-200 bg-white p-6">
+      <p className="text-sm text-slate-500">{label}</p>
+      <p className="mt-2 text-3xl font-bold text-slate-900">{value}</p>
+    </div>
+  );
+}
+
+StatCard.propTypes = {
+  label: PropTypes.string.isRequired,
+  value: PropTypes.number.isRequired,
+};
+
 function DashboardPage() {
-  const [employeeCount, setEmployeeCount] = useState(0);
+  const [overview, setOverview] = useState(null);
   const [error, setError] = useState('');
   const { loading, withLoading } = useAsyncState(true);
 
   useEffect(() => {
     withLoading(async () => {
       try {
-        const employees = await fetchEmployees();
-        setEmployeeCount(employees.length);
+        const stats = await fetchStatsOverview();
+        setOverview(stats);
         setError('');
       } catch (fetchError) {
         setError(fetchError.message);
@@ -29,10 +44,29 @@ function DashboardPage() {
       {loading ? (
         <Loader label="Loading dashboard" />
       ) : (
-        <div className="rounded-lg border border-slate-200 bg-white p-6">
-          <p className="text-sm text-slate-500">Total Employees</p>
-          <p className="mt-2 text-3xl font-bold text-slate-900">{employeeCount}</p>
-        </div>
+        overview && (
+          <>
+            <div className="grid gap-4 sm:grid-cols-2 lg:grid-cols-4">
+              <StatCard label="Total Employees" value={overview.total_employees} />
+              <StatCard label="Present Today" value={overview.present_today} />
+              <StatCard label="Absent Today" value={overview.absent_today} />
+              <StatCard label="Not Marked Today" value={overview.unmarked_today} />
+            </div>
+            {overview.departments.length > 0 ? (
+              <div className="rounded-lg border border-slate-200 bg-white p-6">
+                <p className="text-sm text-slate-500">Headcount by Department</p>
+                <ul className="mt-2 divide-y divide-slate-100">
+                  {overview.departments.map((item) => (
+                    <li key={item.department} className="flex justify-between py-2 text-sm text-slate-700">
+                      <span>{item.department}</span>
+                      <span className="font-semibold">{item.headcount}</span>
+                    </li>
+                  ))}
+                </ul>
+              </div>
+            ) : null}
+          </>
+        )
       )}
     </div>
   );
@@ -3,10 +3,10 @@ import { vi } from 'vitest';
 
 import DashboardPage from './DashboardPage';
 
-const fetchEmployeesMock = vi.fn();
+const fetchStatsOverviewMock = vi.fn();
 
-vi.mock('../api/employees', () => ({
-  fetchEmployees: (...args) => fetchEmployeesMock(...args),
+vi.mock('../api/stats', () => ({
+  fetchStatsOverview: (...args) => fetchStatsOverviewMock(...args),
 }));
 
 describe('DashboardPage', () => {
@@ -14,21 +14,31 @@ describe('DashboardPage', () => {
     vi.clearAllMocks();
   });
 
-  test('renders employee count', async () => {
-    fetchEmployeesMock.mockResolvedValueOnce([
-      { employee_id: 'EMP001' },
-      { employee_id: 'EMP002' },
-    ]);
+  test('renders overview counts', async () => {
+    fetchStatsOverviewMock.mockResolvedValueOnce({
+      total_employees: 12,
+      departments: [
+        { department: 'Engineering', headcount: 9 },
+        { department: 'Sales', headcount: 3 },
+      ],
+      date: '2026-02-25',
+      present_today: 7,
+      absent_today: 2,
+      unmarked_today: 3,
+    });
 
     render(<DashboardPage />);
 
     await waitFor(() => {
-      expect(screen.getByText('2')).toBeInTheDocument();
+      expect(screen.getByText('12')).toBeInTheDocument();
     });
+    expect(screen.getByText('7')).toBeInTheDocument();
+    expect(screen.getByText('Engineering')).toBeInTheDocument();
+    expect(screen.getByText('9')).toBeInTheDocument();
   });
 
   test('renders error state when fetch fails', async () => {
-    fetchEmployeesMock.mockRejectedValueOnce(new Error('API unavailable'));
+    fetchStatsOverviewMock.mockRejectedValueOnce(new Error('API unavailable'));
 
     render(<DashboardPage />);
 
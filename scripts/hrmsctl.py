@@ -8,11 +8,16 @@ Supports launching both backend and frontend either with Docker or directly on h
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from urllib.request import Request, urlopen
 from pathlib import Path
 
@@ -20,17 +25,32 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 RUNTIME_DIR = ROOT_DIR / ".runtime"
 LOG_DIR = RUNTIME_DIR / "logs"
 PID_DIR = RUNTIME_DIR / "pids"
+# One file per preparation step holding the hash of the inputs it last succeeded with.
+STAMP_DIR = RUNTIME_DIR / "stamps"
 
 BACKEND_DIR = ROOT_DIR / "backend"
 FRONTEND_DIR = ROOT_DIR / "frontend"
 BACKEND_VENV_DIRNAME = ".venv"
 
 BACKEND_PID_FILE = PID_DIR / "backend.pid"
+# Written by gunicorn itself; after a USR2 re-exec the new master writes "<file>.2" until promoted.
+GUNICORN_PID_FILE = PID_DIR / "gunicorn.pid"
+# gunicorn.conf.py's hooks record "<master pid>/expected" and one "<master pid>/<worker pid>" per booted worker.
+GUNICORN_BOOT_DIR = Path(f"{GUNICORN_PID_FILE}.workers")
 FRONTEND_PID_FILE = PID_DIR / "frontend.pid"
 
 BACKEND_LOG_FILE = LOG_DIR / "backend.log"
 FRONTEND_LOG_FILE = LOG_DIR / "frontend.log"
 
+# Generated or vendored trees that never count as step inputs.
+HASH_SKIP_DIRS = {"node_modules", "dist", "__pycache__", ".venv"}
+# Health probes back off from the first delay to the cap between attempts.
+PROBE_FIRST_DELAY_SECONDS = 0.25
+PROBE_MAX_DELAY_SECONDS = 2.0
+
+# Backend and frontend pipelines print from separate threads; whole lines only.
+OUTPUT_LOCK = threading.Lock()
+
 def env_int(name: str, default: int) -> int:
     raw = os.getenv(name)
     if raw is None:
@@ -50,7 +70,7 @@ VENV_FRONTEND_PORT = env_int("HRMS_VENV_FRONTEND_PORT", 5173)
 
 DOCKER_BACKEND_HEALTH_URL = os.getenv(
     "HRMS_DOCKER_BACKEND_HEALTH_URL",
-    f"http://{HRMS_HOST}:{DOCKER_BACKEND_PORT}/health",
+    f"http://{HRMS_HOST}:{DOCKER_BACKEND_PORT}/ready",
 )
 DOCKER_FRONTEND_URL = os.getenv(
     "HRMS_DOCKER_FRONTEND_URL",
@@ -58,7 +78,7 @@ DOCKER_FRONTEND_URL = os.getenv(
 )
 VENV_BACKEND_HEALTH_URL = os.getenv(
     "HRMS_VENV_BACKEND_HEALTH_URL",
-    f"http://{HRMS_HOST}:{VENV_BACKEND_PORT}/health",
+    f"http://{HRMS_HOST}:{VENV_BACKEND_PORT}/ready",
 )
 VENV_FRONTEND_URL = os.getenv(
     "HRMS_VENV_FRONTEND_URL",
@@ -66,14 +86,109 @@ VENV_FRONTEND_URL = os.getenv(
 )
 
 
+def log(message: str, prefix: str = "hrmsctl") -> None:
+    with OUTPUT_LOCK:
+        print(f"[{prefix}] {message}", flush=True)
+
+
 def ensure_runtime_dirs() -> None:
     RUNTIME_DIR.mkdir(parents=True, exist_ok=True)
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     PID_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def run_command(command: list[str], cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(command, cwd=str(cwd) if cwd else None, check=check, text=True)
+    STAMP_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def hash_inputs(paths: list[Path], extra: tuple[str, ...] = ()) -> str:
+    """Digest of the given files and directory trees (relative path plus content) and ``extra`` strings."""
+    digest = hashlib.sha256()
+    for value in extra:
+        digest.update(value.encode())
+        digest.update(b"\0")
+    for path in paths:
+        files = [path] if path.is_file() else sorted(
+            item
+            for item in path.rglob("*")
+            if item.is_file() and not HASH_SKIP_DIRS.intersection(item.relative_to(path).parts)
+        )
+        for item in files:
+            digest.update(str(item.relative_to(ROOT_DIR)).encode())
+            digest.update(b"\0")
+            digest.update(item.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PreparationSteps:
+    """Runs setup steps, skipping any whose inputs hash matches its stamp and whose outputs exist."""
+
+    def __init__(self, force: bool) -> None:
+        self.force = force
+        self.timings: list[tuple[str, str, float]] = []
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        name: str,
+        action: Callable[[], None],
+        inputs: list[Path],
+        outputs: tuple[Path, ...] = (),
+        extra: tuple[str, ...] = (),
+        prefix: str = "hrmsctl",
+    ) -> None:
+        started = time.perf_counter()
+        stamp = STAMP_DIR / f"{name}.sha256"
+        fingerprint = hash_inputs([path for path in inputs if path.exists()], extra)
+        up_to_date = (
+            not self.force
+            and stamp.exists()
+            and stamp.read_text(encoding="utf-8").strip() == fingerprint
+            and all(path.exists() for path in outputs)
+        )
+        if up_to_date:
+            outcome = "skipped"
+        else:
+            # A failed step raises before its stamp is written, so the next start retries it.
+            stamp.unlink(missing_ok=True)
+            action()
+            stamp.write_text(fingerprint, encoding="utf-8")
+            outcome = "ran"
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.timings.append((name, outcome, elapsed))
+        log(f"{name}: {outcome} ({elapsed:.1f}s)", prefix)
+
+    def report(self, wall_seconds: float) -> None:
+        busy = sum(elapsed for _, _, elapsed in self.timings)
+        log(f"Preparation took {wall_seconds:.1f}s ({busy:.1f}s of step time across pipelines):")
+        for name, outcome, elapsed in self.timings:
+            log(f"  {name:<16} {outcome:<8} {elapsed:6.1f}s")
+
+
+def run_command(
+    command: list[str],
+    cwd: Path | None = None,
+    check: bool = True,
+    prefix: str | None = None,
+) -> subprocess.CompletedProcess[str]:
+    if prefix is None:
+        return subprocess.run(command, cwd=str(cwd) if cwd else None, check=check, text=True)
+
+    # Prefixed line by line so concurrent pipelines stay readable when interleaved.
+    process = subprocess.Popen(
+        command,
+        cwd=str(cwd) if cwd else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        stdin=subprocess.DEVNULL,
+        text=True,
+    )
+    assert process.stdout is not None
+    for line in process.stdout:
+        log(line.rstrip(), prefix)
+    returncode = process.wait()
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, command)
+    return subprocess.CompletedProcess(command, returncode)
 
 
 def is_process_running(pid: int) -> bool:
@@ -115,23 +230,61 @@ def spawn_detached(command: str, cwd: Path, log_file: Path) -> int:
         return process.pid
 
 
-def wait_for_http(url: str, timeout_seconds: int = 120) -> bool:
-    deadline = time.time() + timeout_seconds
+def time_until_ready(url: str, timeout_seconds: float = 120) -> float | None:
+    """Seconds until ``url`` answers below 500, or None once ``timeout_seconds`` pass.
 
-    while time.time() < deadline:
+    The backend URL is /ready, which answers 503 until the DB and schema check out.
+    """
+    started = time.monotonic()
+    delay = PROBE_FIRST_DELAY_SECONDS
+    while True:
         try:
             with urlopen(Request(url, method="GET"), timeout=3) as response:
                 if 200 <= response.status < 500:
-                    return True
+                    return time.monotonic() - started
         except Exception:  # noqa: BLE001
-            time.sleep(1)
+            pass
+        remaining = started + timeout_seconds - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, PROBE_MAX_DELAY_SECONDS)
 
-    return False
+
+def wait_for_http(url: str, timeout_seconds: float = 120) -> bool:
+    return time_until_ready(url, timeout_seconds) is not None
+
+
+def probe_services(urls: dict[str, str], timeout_seconds: float) -> dict[str, float | None]:
+    """Probe every service at once, so one slow service does not delay checking the others."""
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        futures = {name: pool.submit(time_until_ready, url, timeout_seconds) for name, url in urls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def wait_for_services(urls: dict[str, str], timeout_seconds: float = 120) -> bool:
+    results = probe_services(urls, timeout_seconds)
+    for name, elapsed in results.items():
+        if elapsed is None:
+            log(f"{name}: not ready after {timeout_seconds:.0f}s ({urls[name]})")
+        else:
+            log(f"{name}: ready in {elapsed:.1f}s")
+    return all(elapsed is not None for elapsed in results.values())
+
+
+def print_health(urls: dict[str, str]) -> None:
+    for name, elapsed in probe_services(urls, timeout_seconds=3).items():
+        state = "unreachable" if elapsed is None else f"ready ({elapsed * 1000:.0f} ms)"
+        print(f"[hrmsctl] {name} health: {state}")
+
+
+def backend_root(health_url: str) -> str:
+    return health_url.rsplit("/", 1)[0]
 
 
 def print_service_urls(backend_url: str, frontend_url: str) -> None:
     print(f"[hrmsctl] Frontend URL: {frontend_url}")
-    print(f"[hrmsctl] Backend URL: {backend_url.rsplit('/health', 1)[0]}")
+    print(f"[hrmsctl] Backend URL: {backend_root(backend_url)}")
 
 
 def ensure_env_files() -> None:
@@ -153,11 +306,8 @@ def start_docker(build: bool, wait: bool) -> None:
         command.append("--build")
     run_command(command, cwd=ROOT_DIR)
 
-    if wait:
-        backend_ready = wait_for_http(DOCKER_BACKEND_HEALTH_URL)
-        frontend_ready = wait_for_http(DOCKER_FRONTEND_URL)
-        if not (backend_ready and frontend_ready):
-            raise RuntimeError("Services started but health checks timed out")
+    if wait and not wait_for_services({"backend": DOCKER_BACKEND_HEALTH_URL, "frontend": DOCKER_FRONTEND_URL}):
+        raise RuntimeError("Services started but health checks timed out")
 
     print("[hrmsctl] Docker services started in detached mode.")
     print("[hrmsctl] Check status: docker compose ps")
@@ -172,38 +322,99 @@ def stop_docker() -> None:
 
 def status_docker() -> None:
     run_command(["docker", "compose", "ps"], cwd=ROOT_DIR, check=False)
-    print(f"[hrmsctl] Backend healthy: {wait_for_http(DOCKER_BACKEND_HEALTH_URL, timeout_seconds=3)}")
-    print(f"[hrmsctl] Frontend reachable: {wait_for_http(DOCKER_FRONTEND_URL, timeout_seconds=3)}")
+    print_health({"backend": DOCKER_BACKEND_HEALTH_URL, "frontend": DOCKER_FRONTEND_URL})
 
 
-def start_venv(wait: bool) -> None:
+def start_venv(wait: bool, force: bool = False) -> None:
     ensure_runtime_dirs()
     ensure_env_files()
+    steps = PreparationSteps(force)
 
-    print("[hrmsctl] Preparing backend Python environment...")
-    run_command([sys.executable, "-m", "venv", BACKEND_VENV_DIRNAME], cwd=BACKEND_DIR, check=False)
+    backend_venv = BACKEND_DIR / BACKEND_VENV_DIRNAME
+    backend_python = backend_venv / "bin" / "python"
+    backend_pip = backend_venv / "bin" / "pip"
+    lock_file = FRONTEND_DIR / "package-lock.json"
 
-    backend_python = BACKEND_DIR / BACKEND_VENV_DIRNAME / "bin" / "python"
-    backend_pip = BACKEND_DIR / BACKEND_VENV_DIRNAME / "bin" / "pip"
+    def prepare_backend() -> None:
+        def install() -> None:
+            run_command(
+                [sys.executable, "-m", "venv", BACKEND_VENV_DIRNAME], cwd=BACKEND_DIR, check=False, prefix="backend"
+            )
+            run_command([str(backend_pip), "install", "-r", "requirements.txt"], cwd=BACKEND_DIR, prefix="backend")
+
+        def migrate() -> None:
+            run_command([str(backend_python), "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, prefix="backend")
+            run_command([str(backend_python), "-m", "app.cli", "ensure-partitions"], cwd=BACKEND_DIR, prefix="backend")
+
+        log("Preparing backend Python environment...", "backend")
+        steps.run(
+            "backend-deps",
+            install,
+            inputs=[BACKEND_DIR / "requirements.txt"],
+            outputs=(backend_python,),
+            extra=(sys.version,),
+            prefix="backend",
+        )
+        # .env carries DATABASE_URL; the month keeps ensure-partitions running as the calendar advances.
+        steps.run(
+            "migrations",
+            migrate,
+            inputs=[BACKEND_DIR / "alembic", BACKEND_DIR / "alembic.ini", BACKEND_DIR / ".env"],
+            extra=(os.getenv("DATABASE_URL", ""), date.today().strftime("%Y-%m")),
+            prefix="backend",
+        )
 
-    run_command([str(backend_pip), "install", "-r", "requirements.txt"], cwd=BACKEND_DIR)
-    run_command([str(backend_python), "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR)
+    def prepare_frontend() -> None:
+        def install() -> None:
+            command = ["npm", "ci"] if lock_file.exists() else ["npm", "install"]
+            run_command(command, cwd=FRONTEND_DIR, prefix="frontend")
+
+        def build() -> None:
+            run_command(["npm", "run", "build"], cwd=FRONTEND_DIR, prefix="frontend")
+
+        log("Preparing frontend Node environment...", "frontend")
+        steps.run(
+            "frontend-deps",
+            install,
+            inputs=[lock_file if lock_file.exists() else FRONTEND_DIR / "package.json"],
+            outputs=(FRONTEND_DIR / "node_modules",),
+            prefix="frontend",
+        )
+        steps.run(
+            "frontend-build",
+            build,
+            inputs=[
+                FRONTEND_DIR / "src",
+                FRONTEND_DIR / "public",
+                FRONTEND_DIR / "index.html",
+                FRONTEND_DIR / "package-lock.json",
+                FRONTEND_DIR / "package.json",
+                FRONTEND_DIR / "vite.config.js",
+                FRONTEND_DIR / "tailwind.config.js",
+                FRONTEND_DIR / "postcss.config.js",
+                FRONTEND_DIR / ".env",
+            ],
+            outputs=(FRONTEND_DIR / "dist",),
+            prefix="frontend",
+        )
 
-    print("[hrmsctl] Preparing frontend Node environment...")
-    lock_file = FRONTEND_DIR / "package-lock.json"
-    if lock_file.exists():
-        run_command(["npm", "ci"], cwd=FRONTEND_DIR)
-    else:
-        run_command(["npm", "install"], cwd=FRONTEND_DIR)
-    run_command(["npm", "run", "build"], cwd=FRONTEND_DIR)
+    # The pipelines share no inputs or outputs; both run to completion before any failure is raised.
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(prepare_backend), pool.submit(prepare_frontend)]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    steps.report(time.perf_counter() - started)
+    if errors:
+        raise errors[0]
 
     existing_backend = read_pid(BACKEND_PID_FILE)
     if existing_backend and is_process_running(existing_backend):
         print(f"[hrmsctl] Backend already running with PID {existing_backend}.")
     else:
+        # exec keeps the recorded PID on the gunicorn master; workers and preload come from gunicorn.conf.py.
         backend_cmd = (
             f". {BACKEND_VENV_DIRNAME}/bin/activate && "
-            f"gunicorn -k uvicorn.workers.UvicornWorker app.main:app --bind 0.0.0.0:{VENV_BACKEND_PORT}"
+            f"exec gunicorn app.main:app --bind 0.0.0.0:{VENV_BACKEND_PORT} --pid {GUNICORN_PID_FILE}"
         )
         backend_pid = spawn_detached(backend_cmd, BACKEND_DIR, BACKEND_LOG_FILE)
         write_pid(BACKEND_PID_FILE, backend_pid)
@@ -218,11 +429,8 @@ def start_venv(wait: bool) -> None:
         write_pid(FRONTEND_PID_FILE, frontend_pid)
         print(f"[hrmsctl] Frontend started (PID {frontend_pid}). Logs: {FRONTEND_LOG_FILE}")
 
-    if wait:
-        backend_ready = wait_for_http(VENV_BACKEND_HEALTH_URL)
-        frontend_ready = wait_for_http(VENV_FRONTEND_URL)
-        if not (backend_ready and frontend_ready):
-            raise RuntimeError("venv services started but health checks timed out")
+    if wait and not wait_for_services({"backend": VENV_BACKEND_HEALTH_URL, "frontend": VENV_FRONTEND_URL}):
+        raise RuntimeError("venv services started but health checks timed out")
 
     print("[hrmsctl] Services launched in detached sessions (survive SSH disconnect).")
     print_service_urls(VENV_BACKEND_HEALTH_URL, VENV_FRONTEND_URL)
@@ -243,7 +451,11 @@ def stop_venv() -> None:
             continue
 
         print(f"[hrmsctl] Stopping {name} (PID {pid})...")
-        os.killpg(os.getpgid(pid), signal.SIGTERM)
+        if name == "backend":
+            # TERM to the gunicorn master alone is a graceful shutdown: workers finish in-flight requests.
+            os.kill(pid, signal.SIGTERM)
+        else:
+            os.killpg(os.getpgid(pid), signal.SIGTERM)
         remove_pid(pid_file)
         stopped_any = True
 
@@ -266,13 +478,154 @@ def status_venv() -> None:
         state = "running" if is_process_running(pid) else "stopped"
         print(f"[hrmsctl] {name}: {state} (PID {pid}) | logs: {log_file}")
 
-    print(f"[hrmsctl] Backend healthy: {wait_for_http(VENV_BACKEND_HEALTH_URL, timeout_seconds=3)}")
-    print(f"[hrmsctl] Frontend reachable: {wait_for_http(VENV_FRONTEND_URL, timeout_seconds=3)}")
+    print_health({"backend": VENV_BACKEND_HEALTH_URL, "frontend": VENV_FRONTEND_URL})
+
+
+def wait_for_pid_file(path: Path, exclude: int, timeout_seconds: float) -> int | None:
+    deadline = time.time() + timeout_seconds
+    while time.time() < deadline:
+        pid = read_pid(path)
+        if pid and pid != exclude and is_process_running(pid):
+            return pid
+        time.sleep(0.2)
+    return None
+
+
+def wait_for_workers(master: int, timeout_seconds: float) -> bool:
+    """Wait until every worker ``master`` forks has booted, as reported by gunicorn.conf.py."""
+    boot_dir = GUNICORN_BOOT_DIR / str(master)
+    deadline = time.time() + timeout_seconds
+    while time.time() < deadline and is_process_running(master):
+        try:
+            expected = int((boot_dir / "expected").read_text(encoding="utf-8"))
+            booted = [path for path in boot_dir.iterdir() if path.name.isdigit() and is_process_running(int(path.name))]
+        except (OSError, ValueError):
+            expected, booted = 0, []
+        if expected and len(booted) >= expected:
+            return True
+        time.sleep(0.2)
+    return False
+
+
+def abort_new_master(master: int, new_master: int, reason: str) -> None:
+    # The old master reaps its re-executed child and keeps serving as if USR2 never happened.
+    if is_process_running(new_master):
+        os.kill(new_master, signal.SIGTERM)
+    raise RuntimeError(
+        f"{reason}; stopped new master {new_master}, old master {master} keeps serving. See {BACKEND_LOG_FILE}"
+    )
+
+
+def reload_venv(hup: bool, grace_seconds: float) -> None:
+    master = read_pid(BACKEND_PID_FILE)
+    if not master or not is_process_running(master):
+        raise RuntimeError("Backend is not running; use `start -p venv`")
+
+    if hup:
+        # Rotates workers gracefully on the code the preloaded master already holds.
+        os.kill(master, signal.SIGHUP)
+        print(f"[hrmsctl] Sent HUP to gunicorn master {master}; workers are being replaced.")
+        return
+
+    # USR2 re-executes the master with the current code; both masters serve from the shared
+    # socket until the old one is told to drain, so no request is refused.
+    print(f"[hrmsctl] Re-executing gunicorn master {master} with USR2...")
+    os.kill(master, signal.SIGUSR2)
+    new_master = wait_for_pid_file(Path(f"{GUNICORN_PID_FILE}.2"), master, timeout_seconds=60)
+    if new_master is None:
+        raise RuntimeError(
+            f"New gunicorn master did not start; old master {master} keeps serving. See {BACKEND_LOG_FILE}"
+        )
+
+    # Both masters answer on the shared socket, so a health check alone cannot tell whether the
+    # new workers came up; each one reports in from post_worker_init before it starts serving.
+    if not wait_for_workers(new_master, timeout_seconds=60):
+        abort_new_master(master, new_master, "New gunicorn workers did not boot")
+    # Lifespan startup runs after post_worker_init; give it time before the health check.
+    time.sleep(grace_seconds)
+    if not wait_for_http(VENV_BACKEND_HEALTH_URL, timeout_seconds=30):
+        abort_new_master(master, new_master, "Backend health check failed after reload")
+
+    print(f"[hrmsctl] New master {new_master} is serving; draining old master {master}...")
+    os.kill(master, signal.SIGTERM)
+    write_pid(BACKEND_PID_FILE, new_master)
+    print("[hrmsctl] Backend reloaded without dropping connections.")
+
+
+def reload_docker() -> None:
+    # The container's PID 1 is the gunicorn master, which must stay alive, so only HUP applies;
+    # ship new code with `start -p docker --build`.
+    run_command(["docker", "compose", "kill", "-s", "HUP", "backend"], cwd=ROOT_DIR)
+    print("[hrmsctl] Sent HUP to the backend container; gunicorn is replacing its workers.")
+
+
+def seed_command(args: argparse.Namespace) -> list[str]:
+    command = [
+        "-m",
+        "app.cli",
+        "seed",
+        "--employees",
+        str(args.employees),
+        "--days",
+        str(args.days),
+        "--department-skew",
+        str(args.department_skew),
+        "--absence-rate",
+        str(args.absence_rate),
+    ]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    return command
+
+
+def seed_docker(args: argparse.Namespace) -> None:
+    print("[hrmsctl] Seeding synthetic data inside the backend container...")
+    run_command(["docker", "compose", "exec", "backend", "python", *seed_command(args)], cwd=ROOT_DIR)
+
+
+def seed_venv(args: argparse.Namespace) -> None:
+    backend_python = BACKEND_DIR / BACKEND_VENV_DIRNAME / "bin" / "python"
+    if not backend_python.exists():
+        raise RuntimeError("Backend venv not found; run `start -p venv` first")
+
+    print("[hrmsctl] Seeding synthetic data with the backend venv...")
+    run_command([str(backend_python), "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR)
+    run_command([str(backend_python), *seed_command(args)], cwd=BACKEND_DIR)
+
+
+def bench(args: argparse.Namespace, health_url: str) -> None:
+    # Runs on the host against the published port, so Docker's port forwarding is part of the measurement.
+    backend_python = BACKEND_DIR / BACKEND_VENV_DIRNAME / "bin" / "python"
+    python = str(backend_python) if backend_python.exists() else sys.executable
+    command = [
+        python,
+        "-m",
+        "benchmarks.load",
+        "--base-url",
+        backend_root(health_url),
+        "--concurrency",
+        str(args.concurrency),
+        "--duration",
+        str(args.duration),
+    ]
+    if args.mix:
+        command += ["--mix", args.mix]
+    if args.output:
+        command += ["--output", str(args.output.resolve())]
+    if args.baseline:
+        command += ["--baseline", str(args.baseline.resolve())]
+    if not wait_for_http(health_url, timeout_seconds=10):
+        raise RuntimeError(f"Backend is not ready at {health_url}; start it first")
+    run_command(command, cwd=BACKEND_DIR)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="HRMS Lite process manager")
-    parser.add_argument("action", choices=["start", "stop", "status"], help="Action to perform")
+    parser.add_argument(
+        "action",
+        choices=["start", "stop", "status", "reload", "seed", "bench"],
+        help="Action to perform",
+    )
     parser.add_argument(
         "-p",
         "--platform",
@@ -282,6 +635,43 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--build", action="store_true", help="Docker mode: build images before start")
     parser.add_argument("--wait", action="store_true", help="Wait for frontend/backend health checks")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="start (venv): rerun every preparation step even when its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--hup",
+        action="store_true",
+        help="reload: only rotate workers with HUP instead of re-executing the master with USR2",
+    )
+    parser.add_argument(
+        "--grace",
+        type=float,
+        default=5.0,
+        help="reload: seconds for app startup after the new workers report booted, before the health check",
+    )
+    parser.add_argument("--employees", type=int, default=10_000, help="seed: synthetic employees to load")
+    parser.add_argument("--days", type=int, default=365, help="seed: days of attendance per employee")
+    parser.add_argument("--department-skew", type=float, default=1.0, help="seed: Zipf exponent (0 = uniform)")
+    parser.add_argument("--absence-rate", type=float, default=0.05, help="seed: fraction of days marked ABSENT")
+    parser.add_argument("--workers", type=int, help="seed: loader processes (default: CPU count)")
+    parser.add_argument("--concurrency", type=int, default=16, help="bench: concurrent requests (pooled connections)")
+    parser.add_argument("--duration", type=float, default=30.0, help="bench: measured seconds")
+    parser.add_argument(
+        "--mix",
+        help="bench: operation weights, e.g. mark_attendance=4,attendance_month=3,list_employees=2,employee_churn=1",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="bench: JSON report path (default: backend/.benchmarks/load-latest.json)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="bench: earlier report to compare against; exits 1 on regressions",
+    )
     return parser.parse_args()
 
 
@@ -297,13 +687,25 @@ def main() -> int:
                 start_docker(build=args.build, wait=args.wait)
             elif action == "stop":
                 stop_docker()
+            elif action == "reload":
+                reload_docker()
+            elif action == "seed":
+                seed_docker(args)
+            elif action == "bench":
+                bench(args, DOCKER_BACKEND_HEALTH_URL)
             else:
                 status_docker()
         else:
             if action == "start":
-                start_venv(wait=args.wait)
+                start_venv(wait=args.wait, force=args.force)
             elif action == "stop":
                 stop_venv()
+            elif action == "reload":
+                reload_venv(hup=args.hup, grace_seconds=args.grace)
+            elif action == "seed":
+                seed_venv(args)
+            elif action == "bench":
+                bench(args, VENV_BACKEND_HEALTH_URL)
             else:
                 status_venv()
     except subprocess.CalledProcessError as exc: